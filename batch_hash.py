@@ -0,0 +1,124 @@
+""" Batch Hashing
+
+Hashes a whole list of keys at once with NumPy. The keys are encoded into one
+padded matrix of character codes (one row per key) and the polynomial hashes are
+computed one column at a time over every key long enough to have that column,
+instead of running the per-character Python loop of the tables once per key.
+
+NumPy is optional: when it is not installed HAS_NUMPY is False and the tables
+fall back to hashing one key at a time.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from hash_functions import HASH_MASK, MASK_64
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Largest table size whose squared value still fits in a signed 64-bit integer
+MAX_BATCH_TABLESIZE = 3037000499
+
+
+def _active_rows(lengths: np.ndarray) -> tuple:
+    """
+        Order the rows longest key first, so the keys still active at any column are a prefix.
+        :returns: (order, active) where active[column] is the number of keys longer than column
+        :complexity: O(N log N) where N is the number of keys
+    """
+    order = np.argsort(-lengths, kind='stable')
+    width = int(lengths.max()) if len(lengths) > 0 else 0
+    active = np.searchsorted(-lengths[order], -np.arange(width), side='left')
+    return order, active.tolist()
+
+
+def encode_keys(keys: list[str]) -> tuple:
+    """
+        Encode keys into a zero padded matrix of character codes, one row per key.
+        The matrix is uint8 when every character fits in a byte, uint32 otherwise,
+        so the codes are always exactly ord(char).
+        :returns: (matrix, lengths) where lengths[i] is len(keys[i])
+        :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+    """
+    lengths = np.fromiter((len(key) for key in keys), dtype=np.int64, count=len(keys))
+    joined = "".join(keys)
+    try:
+        flat = np.frombuffer(joined.encode('latin-1'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        flat = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+
+    width = int(lengths.max()) if len(keys) > 0 else 0
+    matrix = np.zeros((len(keys), width), dtype=flat.dtype)
+    rows = np.repeat(np.arange(len(keys)), lengths)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    matrix[rows, np.arange(len(flat)) - offsets] = flat
+    return matrix, lengths
+
+
+def polynomial_slots(keys: list[str], base: int, tablesize: int) -> np.ndarray:
+    """
+        Slot of every key under the static base hash of table_analysis.LinearProbeTable,
+        value = (value * base + ord(char)) % tablesize for every character.
+        :raises ValueError: when tablesize is too big for the products to fit in 64 bits
+        :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+    """
+    if tablesize > MAX_BATCH_TABLESIZE:
+        raise ValueError("Table size too big for batch hashing.")
+
+    matrix, lengths = encode_keys(keys)
+    order, active = _active_rows(lengths)
+    matrix = matrix[order].astype(np.int64)
+    base = np.int64(base % tablesize)
+    values = np.zeros(len(keys), dtype=np.int64)
+    for column, rows in enumerate(active):
+        values[:rows] = (values[:rows] * base + matrix[:rows, column]) % tablesize
+
+    result = np.empty_like(values)
+    result[order] = values
+    return result
+
+
+def universal_codes(keys: list[str], a: int = 31415, b: int = 27183) -> np.ndarray:
+    """
+        Hash code of every key under the default hash of hash_table.LinearProbeTable
+        (the "universal" strategy of hash_functions).
+        The codes are computed modulo 2^64, which wraps for free, and cut to 63 bits at the
+        end; that gives the same result as cutting to 63 bits after every character.
+        :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+    """
+    matrix, lengths = encode_keys(keys)
+    order, active = _active_rows(lengths)
+    matrix = matrix[order].astype(np.uint64)
+    values = np.zeros(len(keys), dtype=np.uint64)
+    multiplier = a
+    for column, rows in enumerate(active):
+        values[:rows] = matrix[:rows, column] + np.uint64(multiplier) * values[:rows]
+        multiplier = multiplier * b & HASH_MASK
+
+    result = np.empty(len(keys), dtype=np.int64)
+    result[order] = (values & np.uint64(HASH_MASK)).astype(np.int64)
+    return result
+
+
+def polynomial_codes(keys: list[str], base: int) -> np.ndarray:
+    """
+        Hash code of every key under the "polynomial" strategy of hash_functions.
+        :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+    """
+    matrix, lengths = encode_keys(keys)
+    order, active = _active_rows(lengths)
+    matrix = matrix[order].astype(np.uint64)
+    base = np.uint64(base & MASK_64)
+    values = np.zeros(len(keys), dtype=np.uint64)
+    for column, rows in enumerate(active):
+        values[:rows] = values[:rows] * base + matrix[:rows, column]
+
+    result = np.empty(len(keys), dtype=np.int64)
+    result[order] = (values & np.uint64(HASH_MASK)).astype(np.int64)
+    return result
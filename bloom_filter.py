@@ -0,0 +1,387 @@
+""" Bloom Filter
+
+A Bloom filter answers "is this key in the set?" with "no" or "maybe" from a bit
+array kept in a bytearray. Adding a key sets k bits, a key with any of its k bits
+clear has never been added. Keys that were not added can still find all their bits
+set, with a probability (the false-positive rate) fixed by the size of the filter.
+
+The k bit positions come from a single base hash of the key: the 64-bit code is
+mixed, split into two halves h1 and h2, and the i-th position is h1 + i * h2
+(Kirsch and Mitzenmacher), so a key is hashed once whatever k is.
+
+FilteredTable puts a filter in front of a hash table, so most lookups of missing
+keys are answered by the filter without walking a probe cluster of the table.
+The filter hashes with its own function: a weak table hash, such as the polynomial
+with base 1 under which all anagrams collide, would give colliding keys the same
+bits. By default it is FNV-1a for str keys and the hash of hash_functions.key_type_hash()
+for the other key types of the table.
+
+Usage:
+```
+names = FilteredTable(LinearProbeTable(1000, hash_function=make_hash_function("polynomial", base=1)))
+names["Eva"] = 1
+"Ave" in names     # False, answered by the filter
+names.statistics() # the table's statistics, then the false-positive rate and filter memory
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import math
+from hash_functions import fnv1a_hash, key_type_hash, mix64
+from hash_table import LinearProbeTable
+from typing import Callable, TypeVar, Generic
+T = TypeVar('T')
+
+
+class BloomFilter:
+    """
+        Bloom filter over a bytearray of bits.
+
+        attributes:
+            capacity: the number of keys the filter is sized for
+            error_rate: the false-positive rate expected once capacity keys are added
+            size: the number of bits
+            hash_count: the number of bits set per key (k)
+            bits: the bit array, bit i is bit i % 8 of byte i // 8
+            count: the number of keys added
+            hash: the base hash of the keys
+    """
+
+    ERROR_RATE = 0.01
+
+    def __init__(self, capacity: int, error_rate: float = ERROR_RATE, hash_function: Callable = None) -> None:
+        """
+            Initialiser, sizing the bit array for capacity keys at error_rate:
+            size = -capacity * ln(error_rate) / ln(2)^2 bits and k = size / capacity * ln(2)
+            :param hash_function: the base hash of the keys, FNV-1a of str keys when not given
+            :raises ValueError: when capacity is smaller than 1 or error_rate is not in (0, 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity should be at least 1.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate should be between 0 and 1.")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self.hash = hash_function if hash_function is not None else fnv1a_hash()
+
+    def _positions(self, key) -> range:
+        """
+            The k bit positions of key, as h1 + i * h2 for i in range(k), not yet reduced modulo size
+            :complexity: O(K) where K is the size of the key, for the base hash
+        """
+        code = mix64(self.hash(key))
+        h1 = code & 0xffffffff
+        h2 = (code >> 32) | 1  # odd, so the positions don't collapse onto h1
+        return range(h1, h1 + self.hash_count * h2, h2)
+
+    def add(self, key) -> None:
+        """
+            Add key to the filter
+            :complexity: O(K + k) where K is the size of the key
+        """
+        bits = self.bits
+        size = self.size
+        for position in self._positions(key):
+            position %= size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key) -> bool:
+        """
+            Returns False when key was never added, True when it may have been
+            :complexity: O(K + k) where K is the size of the key, less when a bit is clear early
+        """
+        bits = self.bits
+        size = self.size
+        for position in self._positions(key):
+            position %= size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """
+            Returns the number of keys added
+            :complexity: O(1)
+        """
+        return self.count
+
+    def clear(self) -> None:
+        """
+            Remove every key
+            :complexity: O(size)
+        """
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def expected_false_positive_rate(self) -> float:
+        """
+            The false-positive rate expected with the keys added so far, (1 - e^(-k * n / size))^k
+            :complexity: O(1)
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    def memory(self) -> int:
+        """
+            Returns the number of bytes of the bit array
+            :complexity: O(1)
+        """
+        return len(self.bits)
+
+
+class FilteredTable(Generic[T]):
+    """
+        Hash table behind a Bloom filter holding its keys. A key missing from the filter is
+        reported missing without probing the table.
+        A removed key can't be taken out of the filter, its bits stay set until the filter
+        is rebuilt, which happens when it is full or too many of its keys are stale.
+
+        attributes:
+            table: the hash table filtered, it should only be written through this wrapper
+            filter: the Bloom filter of the keys
+            error_rate: the false-positive rate the filter is sized for
+            filter_hash: the base hash of the filter
+            rejected: the number of lookups of missing keys answered by the filter
+            false_positives: the number of lookups of missing keys that passed the filter
+            stale: the number of keys removed from the table since the filter was built
+    """
+
+    # Data of a key missing from the table, never equal to stored data
+    _MISSING = object()
+
+    def __init__(self, table: LinearProbeTable[T], error_rate: float = BloomFilter.ERROR_RATE,
+                 hash_function: Callable = None) -> None:
+        """
+            Initialiser, filtering the keys already in table
+            :param hash_function: the base hash of the filter, when not given FNV-1a for str keys and
+                                  the hash of the key type of the table for other keys
+            :raises ValueError: when error_rate is not in (0, 1), or there is no hash for the key type of the table
+        """
+        if hash_function is None:
+            key_type = getattr(table, 'key_type', str)
+            hash_function = fnv1a_hash() if key_type is str else key_type_hash(key_type)
+        self.table = table
+        self.error_rate = error_rate
+        self.filter_hash = hash_function
+        self.rejected = 0
+        self.false_positives = 0
+        self._rebuild(max(len(table), table.tablesize // 2))
+
+    def _rebuild(self, capacity: int) -> None:
+        """
+            Make a new filter sized for capacity keys and add the keys of the table to it
+            :complexity: O(N + size) where N is the table size
+        """
+        self.filter = BloomFilter(max(1, capacity), self.error_rate, self.filter_hash)
+        for key in self.table.keys():
+            self.filter.add(key)
+        self.stale = 0
+
+    def _add(self, key) -> None:
+        """
+            Add a key about to be written to the table to the filter, rebuilding a full filter twice as big
+            :complexity: O(K + k), or O(self._rebuild()) when it rebuilds
+        """
+        if key in self.filter:  # already in the table, or a false positive that costs nothing to keep
+            return
+        if self.filter.count >= self.filter.capacity:
+            self._rebuild(2 * self.filter.capacity)
+        self.filter.add(key)
+
+    def _removed(self) -> None:
+        """
+            Count a key removed from the table, rebuilding the filter once half of its keys are stale
+            :complexity: O(1), or O(self._rebuild()) when it rebuilds
+        """
+        self.stale += 1
+        if 2 * self.stale > self.filter.count:
+            self._rebuild(self.filter.capacity)
+
+    def statistics(self) -> tuple:
+        """
+            Return the statistics of the table followed by the measured false-positive rate of the
+            filter (the fraction of lookups of missing keys that passed it) and its memory in bytes
+            :complexity: O(1) plus the cost of the table's statistics()
+        """
+        negatives = self.rejected + self.false_positives
+        rate = self.false_positives / negatives if negatives > 0 else 0.0
+        return tuple(self.table.statistics()) + (rate, self.filter.memory())
+
+    def _passes(self, key) -> bool:
+        """
+            Returns whether the filter lets key through to the table, counting the missing keys it stops
+            :complexity: O(K + k) where K is the size of the key
+        """
+        if key in self.filter:
+            return True
+        self.rejected += 1
+        return False
+
+    def __contains__(self, key) -> bool:
+        """
+            Checks to see if the given key is in the Hash Table, probing it only when the filter lets key through
+            :complexity: O(K + k) for a key stopped by the filter, plus one probe sequence otherwise
+        """
+        if not self._passes(key):
+            return False
+        if key in self.table:
+            return True
+        self.false_positives += 1
+        return False
+
+    def get(self, key, default: T = None) -> T:
+        """
+            Returns the data of key, or default when key is not in the table
+            :see: #self.__contains__(key)
+        """
+        if not self._passes(key):
+            return default
+        data = self.table.get(key, self._MISSING)
+        if data is self._MISSING:
+            self.false_positives += 1
+            return default
+        return data
+
+    def __getitem__(self, key) -> T:
+        """
+            Get the item at a certain key
+            :see: #self.get(key, default: T)
+            :raises KeyError: when the item doesn't exist
+        """
+        data = self.get(key, self._MISSING)
+        if data is self._MISSING:
+            raise KeyError(key)
+        return data
+
+    def __setitem__(self, key, data: T) -> None:
+        """
+            Set an (key, data) pair in the table and its key in the filter
+            :complexity: O(K + k) plus the cost of the table's insert
+        """
+        self._add(key)
+        self.table[key] = data
+
+    def insert(self, key, data: T) -> None:
+        """
+            Utility method to call our setitem method
+            :see: #__setitem__(self, key, data: T)
+        """
+        self[key] = data
+
+    def setdefault(self, key, default: T = None) -> T:
+        """
+            Returns the data of key, inserting (key, default) first when key is not in the table
+            :see: #LinearProbeTable.setdefault(key, default: T)
+        """
+        self._add(key)
+        return self.table.setdefault(key, default)
+
+    def update_with(self, key, fn: Callable[[T], T], default: T = None) -> T:
+        """
+            Store fn(data) as the new data of key, using default as the data when key is not in the table yet
+            :see: #LinearProbeTable.update_with(key, fn, default: T)
+        """
+        self._add(key)
+        return self.table.update_with(key, fn, default)
+
+    def insert_many(self, items) -> None:
+        """
+            Insert many (key, data) pairs, or the entries of a mapping, adding every key to the filter
+            :see: #LinearProbeTable.insert_many(items)
+        """
+        if hasattr(items, 'items'):
+            keys = items.keys()
+        else:
+            items = list(items)
+            keys = [pair[0] for pair in items]
+        for key in keys:
+            self._add(key)
+        self.table.insert_many(items)
+
+    def bulk_insert(self, keys: list, values: list = None) -> None:
+        """
+            Insert a batch of keys, adding every key to the filter
+            :see: #LinearProbeTable.bulk_insert(keys: list, values: list)
+        """
+        for key in keys:
+            self._add(key)
+        self.table.bulk_insert(keys, values)
+
+    def pop(self, key, *default: T) -> T:
+        """
+            Remove key and return its data, only probing the table when the filter lets key through
+            :param default: returned when key is not in the table, if given
+            :raises KeyError: when key is not in the table and no default is given
+        """
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        data = self.table.pop(key)
+        self._removed()
+        return data
+
+    def __delitem__(self, key) -> None:
+        """
+            Remove key from the table
+            :raises KeyError: when key is not in the table
+            :see: #self.pop(key)
+        """
+        self.pop(key)
+
+    def __len__(self) -> int:
+        """
+            Returns number of elements in the hash table
+            :complexity: O(1)
+        """
+        return len(self.table)
+
+    def is_empty(self) -> bool:
+        """
+            Returns whether the hash table is empty
+            :complexity: O(1)
+        """
+        return len(self.table) == 0
+
+    def keys(self):
+        """
+            Returns a live view of the keys in the hash table.
+            :see: #LinearProbeTable.keys()
+        """
+        return self.table.keys()
+
+    def values(self):
+        """
+            Returns a live view of the values in the hash table.
+            :see: #LinearProbeTable.values()
+        """
+        return self.table.values()
+
+    def items(self):
+        """
+            Returns a live view of the (key, value) pairs in the hash table.
+            :see: #LinearProbeTable.items()
+        """
+        return self.table.items()
+
+    def __iter__(self):
+        """
+            Iterate over the keys in the hash table
+            :see: #self.keys()
+        """
+        return iter(self.table)
+
+    def __str__(self) -> str:
+        """
+            Returns all they key/value pairs in our hash table
+            :see: #LinearProbeTable.__str__()
+        """
+        return str(self.table)
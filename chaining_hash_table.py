@@ -0,0 +1,293 @@
+""" Separate Chaining Hash Table ADT
+
+Defines a Hash Table using separate chaining for conflict resolution. Every slot
+holds a bucket of the keys hashing to it: a small list while the bucket is short,
+converted ("treeified") into an AVLTree once it holds more than treeify_threshold
+keys, like the buckets of Java's HashMap. A key set where many keys collide (anagrams
+under a sum of characters, ...) then costs O(log n) per lookup in its bucket instead
+of a scan of the whole bucket.
+
+Tree buckets order their keys with <, so they need keys comparable with each other.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from avl import AVLTree
+from frozen_hash_table import FrozenHashTable
+from hash_table import LinearProbeTable
+from primes import next_growth_prime, prime_at_least
+from referential_array import ArrayR
+from table_views import TableViewsMixin
+from typing import Callable, TypeVar, Generic
+T = TypeVar('T')
+
+
+class ChainingHashTable(TableViewsMixin, Generic[T]):
+    """
+        Separate Chaining Hash Table.
+        A bucket is None when empty, a list of (key, data, hash code) items, or an AVLTree
+        mapping every key of the bucket to its (key, data, hash code) item.
+
+        attributes:
+            count: number of elements in the hash table
+            table: the bucket of every slot
+            tablesize: current size of the hash table
+            treeify_threshold: the bucket length above which a list bucket becomes a tree
+    """
+
+    MAX_LOAD = 0.75
+    TREEIFY_THRESHOLD = 8
+    # A tree bucket shrinking to this many keys goes back to a list
+    UNTREEIFY_THRESHOLD = 6
+
+    # The same hash codes as LinearProbeTable
+    hash = LinearProbeTable.hash
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, hash_function: Callable[[str], int] = None,
+                 treeify_threshold: int = TREEIFY_THRESHOLD) -> None:
+        """
+            Initialiser.
+            :param hash_function: a hash strategy (see hash_functions) used instead of self.hash
+            :param treeify_threshold: the number of keys a list bucket may hold before it becomes a tree
+            :raises ValueError: when treeify_threshold is not above UNTREEIFY_THRESHOLD
+        """
+        if treeify_threshold <= self.UNTREEIFY_THRESHOLD:
+            raise ValueError("treeify_threshold should be above " + str(self.UNTREEIFY_THRESHOLD) + ".")
+
+        if hash_function is not None:
+            self.hash = hash_function
+        self.treeify_threshold = treeify_threshold
+        self.count = 0
+
+        if tablesize_override == -1:
+            self.tablesize = prime_at_least(expected_size)
+        else:
+            self.tablesize = tablesize_override
+        self.table = ArrayR(self.tablesize)
+
+        # Values to return when statistics method is called
+        self.conflict = 0
+        self.total_distance_probed = 0
+        self.length_longest_probe = 0
+        self.rehashing_count = 0
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of inserts into a non-empty bucket, the total and longest number of keys
+            searched past by an insert (the length of a list bucket or the height of a tree bucket)
+            and the number of times the table is rehashed
+            :complexity: O(1)
+        """
+        return (self.conflict, self.total_distance_probed, self.length_longest_probe, self.rehashing_count)
+
+    def __len__(self) -> int:
+        """
+            Returns number of elements in the hash table
+            :complexity: O(1)
+        """
+        return self.count
+
+    def is_empty(self) -> bool:
+        """
+            Returns whether the hash table is empty
+            :complexity: O(1)
+        """
+        return self.count == 0
+
+    def _find_item(self, key: str, code: int) -> tuple:
+        """
+            Returns the (key, data, hash code) item of key, or None when key is not in the table
+            :complexity best: O(K) the bucket is empty
+            :complexity worst: O(K + B) for a list bucket of B keys, O(K * log(B)) for a tree bucket
+                               where K is the size of the key
+        """
+        bucket = self.table[code % self.tablesize]
+        if bucket is None:
+            return None
+        if isinstance(bucket, AVLTree):
+            try:
+                return bucket[key]
+            except KeyError:
+                return None
+        for item in bucket:
+            if item[2] == code and item[0] == key:
+                return item
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        """
+            Checks to see if the given key is in the Hash Table
+            :see: #self._find_item(key: str, code: int)
+        """
+        return self._find_item(key, self.hash(key)) is not None
+
+    def __getitem__(self, key: str) -> T:
+        """
+            Get the item at a certain key
+            :see: #self._find_item(key: str, code: int)
+            :raises KeyError: when the item doesn't exist
+        """
+        item = self._find_item(key, self.hash(key))
+        if item is None:
+            raise KeyError(key)
+        return item[1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+            Returns the data of key, or default when key is not in the table
+            :see: #self._find_item(key: str, code: int)
+        """
+        item = self._find_item(key, self.hash(key))
+        if item is None:
+            return default
+        return item[1]
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+            Set an (key, data) pair in our hash table
+            :complexity: O(K + B) for a list bucket of B keys, O(K * log(B)) for a tree bucket
+                         where K is the size of the key, plus O(self._rehash()) when it rehashes
+        """
+        if self.count > self.tablesize * self.MAX_LOAD:
+            self._rehash()
+
+        code = self.hash(key)
+        position = code % self.tablesize
+        bucket = self.table[position]
+        item = (key, data, code)
+        if bucket is None:
+            self.table[position] = [item]
+            self.count += 1
+            return
+
+        if isinstance(bucket, AVLTree):
+            try:
+                bucket.get_tree_node_by_key(key).item = item
+                return
+            except KeyError:
+                pass
+            self._count_probe(bucket.get_height(bucket.root))
+            bucket[key] = item
+            self.count += 1
+            return
+
+        for index in range(len(bucket)):
+            if bucket[index][2] == code and bucket[index][0] == key:
+                bucket[index] = item
+                return
+        self._count_probe(len(bucket))
+        self._append(position, item)
+        self.count += 1
+
+    def insert(self, key: str, data: T) -> None:
+        """
+            Utility method to call our setitem method
+            :see: #__setitem__(self, key: str, data: T)
+        """
+        self[key] = data
+
+    def _count_probe(self, distance: int) -> None:
+        """
+            Count an insert into a non-empty bucket that searched past distance keys
+            :complexity: O(1)
+        """
+        self.conflict += 1
+        self.total_distance_probed += distance
+        if distance > self.length_longest_probe:
+            self.length_longest_probe = distance
+
+    def _append(self, position: int, item: tuple) -> None:
+        """
+            Add a new item to the bucket at position, turning a list bucket that gets too long into a tree
+            :complexity: O(1), or O(B log(B)) when it treeifies a bucket of B keys
+        """
+        bucket = self.table[position]
+        if bucket is None:
+            self.table[position] = [item]
+        elif isinstance(bucket, AVLTree):
+            bucket[item[0]] = item
+        else:
+            bucket.append(item)
+            if len(bucket) > self.treeify_threshold:
+                tree = AVLTree()
+                for old_item in bucket:
+                    tree[old_item[0]] = old_item
+                self.table[position] = tree
+
+    def __delitem__(self, key: str) -> None:
+        """
+            Remove key from the table
+            :raises KeyError: when key is not in the table
+            :see: #self.pop(key: str)
+        """
+        self.pop(key)
+
+    def pop(self, key: str, *default: T) -> T:
+        """
+            Remove key and return its data, turning a tree bucket that gets short back into a list
+            :param default: returned when key is not in the table, if given
+            :raises KeyError: when key is not in the table and no default is given
+            :complexity: O(K + B) for a list bucket of B keys, O(K * log(B)) for a tree bucket
+        """
+        code = self.hash(key)
+        position = code % self.tablesize
+        item = self._find_item(key, code)
+        if item is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        bucket = self.table[position]
+        if isinstance(bucket, AVLTree):
+            del bucket[key]
+            if len(bucket) <= self.UNTREEIFY_THRESHOLD:
+                self.table[position] = bucket.in_order(bucket.root)
+        else:
+            bucket.remove(item)
+            if len(bucket) == 0:
+                self.table[position] = None
+        self.count -= 1
+        return item[1]
+
+    def is_tree(self, position: int) -> bool:
+        """
+            Returns whether the bucket at position has been turned into a tree
+            :complexity: O(1)
+        """
+        return isinstance(self.table[position], AVLTree)
+
+    def _entries(self):
+        """
+            Iterate over the stored (key, data, hash code) items
+            :complexity: O(N + M) where N is the table size and M the number of items
+        """
+        for bucket in self.table:
+            if bucket is None:
+                continue
+            if isinstance(bucket, AVLTree):
+                bucket = bucket.in_order(bucket.root)
+            for item in bucket:
+                yield item
+
+    def _rehash(self) -> None:
+        """
+            Grow the table to the next growth size and move every item, reusing its cached hash code
+            :complexity: O(N + M) where N is the table size and M the number of items,
+                         plus the cost of treeifying buckets again
+        """
+        self.rehashing_count += 1
+        items = list(self._entries())
+        self.tablesize = next_growth_prime(self.tablesize)
+        self.table = ArrayR(self.tablesize)
+        for item in items:
+            self._append(item[2] % self.tablesize, item)
+
+    def freeze(self) -> FrozenHashTable:
+        """
+            Returns a read-only snapshot of the table, packed at a high load factor for faster
+            lookups and less memory, for tables that are only read once they are loaded
+            :see: #frozen_hash_table.FrozenHashTable
+        """
+        return FrozenHashTable(self)
@@ -0,0 +1,258 @@
+""" Compact Hash Table ADT
+
+Defines a Hash Table using Linear Probing laid out like CPython's compact dict:
+the probed array only holds small integers, the index of every key's entry in a
+dense list of (key, data, hash code) entries kept in insertion order.
+
+The keys(), values() and items() views and str() walk the dense list, O(n) over
+the live entries instead of O(tablesize) over a mostly empty array, and come out
+in insertion order.
+The index array uses the narrowest signed array typecode able to hold an entry
+index, 1 to 4 bytes per slot for any realistic size, where LinearProbeTable pays an
+8-byte reference for every slot, empty or not.
+
+A deletion leaves a hole in the entries list. The holes are squeezed out once they
+outnumber the live entries, and on every resize.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from array import array
+from hash_table import LinearProbeTable
+from typing import TypeVar
+T = TypeVar('T')
+
+
+class CompactLinearProbeTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table with a compact, insertion-ordered layout, a drop-in replacement for LinearProbeTable.
+
+        attributes:
+            table: the index array, FREE or the index in entries of the key stored at every slot
+            entries: the (key, data, hash code) entries in insertion order, None for a deleted one
+            holes: the number of deleted entries still in entries
+    """
+
+    # Index of a free slot
+    FREE = -1
+    # Signed array typecodes from the narrowest, with the largest index each can hold
+    INDEX_TYPECODES = (('b', 2 ** 7 - 1), ('h', 2 ** 15 - 1), ('i', 2 ** 31 - 1), ('q', 2 ** 63 - 1))
+
+    @classmethod
+    def _index_typecode(cls, tablesize: int) -> str:
+        """
+            The narrowest typecode for the index array of a table of tablesize slots.
+            Leaves room for twice as many entries as slots, the most the holes can add up to.
+            :complexity: O(1)
+        """
+        for typecode, largest in cls.INDEX_TYPECODES:
+            if 2 * tablesize <= largest:
+                return typecode
+        return 'q'
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate a free index array of tablesize slots and an empty entries list
+            :complexity: O(tablesize)
+        """
+        self.table = array(self._index_typecode(tablesize), [self.FREE]) * tablesize
+        self.entries = []
+        self.holes = 0
+
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
+        """
+            Find the correct position for this key in the index array using linear probing,
+            counting conflicts and probe distances like LinearProbeTable does
+            :param code: the hash code of key, computed here when not given
+            :complexity best: O(K) first position is empty
+                            where K is the size of the key
+            :complexity worst: O(K + N) when we've searched the entire table
+                            where N is the tablesize
+            :raises KeyError: When a position can't be found
+        """
+        if code is None:
+            code = self.hash(key)
+
+        if is_insert and self.is_full():
+            raise KeyError(key)
+
+        table = self.table
+        entries = self.entries
+        tablesize = len(table)
+        position = code % tablesize
+        distance_probed_current = 0
+        for _ in range(tablesize):
+            index = table[position]
+            if index == self.FREE:  # found empty slot
+                if not is_insert:
+                    raise KeyError(key)  # so the key is not in
+                break
+            item = entries[index]
+            if item[2] == code and item[0] == key:  # found key
+                break
+            distance_probed_current += 1
+            position = (position + 1) % tablesize
+        else:
+            raise KeyError(key)
+
+        if is_insert and distance_probed_current > 0:
+            self.conflict += 1
+            self.total_distance_probed += distance_probed_current
+            if distance_probed_current > self.length_longest_probe:
+                self.length_longest_probe = distance_probed_current
+        return position
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key in the index array without raising or touching the statistics
+            :returns: the position of key, or -1 when it is not in the table
+            :complexity best: O(1) first position is empty or holds key
+            :complexity worst: O(N) when we've searched the entire table
+                            where N is the tablesize
+        """
+        table = self.table
+        entries = self.entries
+        tablesize = len(table)
+        position = code % tablesize
+
+        for _ in range(tablesize):
+            index = table[position]
+            if index == self.FREE:  # so the key is not in
+                return -1
+            item = entries[index]
+            if item[2] == code and item[0] == key:  # found key
+                return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def _is_free(self, position: int) -> bool:
+        """
+            Returns whether the slot at position is empty
+            :complexity: O(1)
+        """
+        return self.table[position] == self.FREE
+
+    def _value_at(self, position: int) -> T:
+        """
+            Returns the data of the entry the slot at position points to
+            :complexity: O(1)
+        """
+        return self.entries[self.table[position]][1]
+
+    def _code_at(self, position: int) -> int:
+        """
+            Returns the hash code of the entry the occupied slot at position points to
+            :complexity: O(1)
+        """
+        return self.entries[self.table[position]][2]
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) for the slot at position, found by self._linear_probe() for key.
+            A new key is appended to the entries, an existing one keeps its place in the insertion order.
+            :complexity: O(1) amortised
+        """
+        if self.table[position] == self.FREE:
+            self.table[position] = len(self.entries)
+            self.entries.append((key, data, code))
+            self.count += 1
+        else:
+            self.entries[self.table[position]] = (key, data, code)
+
+    def _remove_at(self, position: int) -> None:
+        """
+            Empty the slot at position using backward-shift deletion on the index array, leaving
+            a hole in the entries that is squeezed out once the holes outnumber the live entries
+            :see: #LinearProbeTable._remove_at(position: int)
+        """
+        table = self.table
+        entries = self.entries
+        tablesize = len(table)
+        entries[table[position]] = None
+        table[position] = self.FREE
+        self.count -= 1
+        self.holes += 1
+
+        hole = position
+        position = (position + 1) % tablesize
+        while table[position] != self.FREE:
+            index = table[position]
+            # the entry may move into the hole if the hole is between its home and where it is
+            if (position - entries[index][2] % tablesize) % tablesize >= (position - hole) % tablesize:
+                table[hole] = index
+                table[position] = self.FREE
+                hole = position
+            position = (position + 1) % tablesize
+
+        if self.holes > self.count:
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+            Squeeze the holes out of the entries, renumbering the index array in place so no key moves
+            :complexity: O(N + M) where N is the tablesize and M the length of entries
+        """
+        renumbered = array(self.table.typecode, [self.FREE]) * len(self.entries)
+        live = []
+        for index in range(len(self.entries)):
+            item = self.entries[index]
+            if item is not None:
+                renumbered[index] = len(live)
+                live.append(item)
+
+        table = self.table
+        for position in range(len(table)):
+            if table[position] != self.FREE:
+                table[position] = renumbered[table[position]]
+        self.entries = live
+        self.holes = 0
+
+    def _entries(self):
+        """
+            Iterate over the stored (key, data, hash code) entries in insertion order
+            :complexity: O(M) where M is the length of entries, at most twice the number of keys
+        """
+        for item in self.entries:
+            if item is not None:
+                yield item
+
+    def _reinsert(self, item: tuple) -> int:
+        """
+            Append an entry taken from the previous table and point the first free slot from
+            its home position at it, counting the distance probed like LinearProbeTable does
+            :returns: the position the entry was placed at
+            :complexity best: O(1) home position is empty
+            :complexity worst: O(N) where N is the tablesize
+        """
+        table = self.table
+        tablesize = len(table)
+        position = item[2] % tablesize
+        distance_probed_current = 0
+        while table[position] != self.FREE:
+            distance_probed_current += 1
+            position = (position + 1) % tablesize
+
+        if distance_probed_current > 0:
+            self.conflict += 1
+            self.total_distance_probed += distance_probed_current
+            if distance_probed_current > self.length_longest_probe:
+                self.length_longest_probe = distance_probed_current
+
+        table[position] = len(self.entries)
+        self.entries.append(item)
+        return position
+
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Move every entry, in insertion order and without the holes, behind a new index array
+            of new_table_size slots
+            :complexity: O(N + M) where N is the new table size and M the length of entries
+        """
+        items = list(self._entries())
+        self._allocate(new_table_size)
+        self.tablesize = new_table_size
+        for item in items:
+            self._reinsert(item)
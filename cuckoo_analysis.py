@@ -0,0 +1,34 @@
+""" File to compare the cuckoo hash table with the linear probe table on the analysis datasets"""
+
+import time
+
+from analysis import datasets, table_sizes
+from cuckoo_hash_table import CuckooHashTable
+from hash_table import LinearProbeTable
+
+
+def benchmark(table_type, cities: list, table_size: int) -> tuple:
+    """
+        Insert every city into a new table of table_type (treating city name (data) as key an value),
+        then look every city up again.
+        Returns the statistics of the table and the insert and lookup throughputs in keys per second.
+    """
+    table = table_type(table_size)
+    start = time.perf_counter()
+    for city in cities:
+        table[city] = city
+    inserted = time.perf_counter()
+    for city in cities:
+        _ = table[city]
+    looked_up = time.perf_counter()
+    return table.statistics(), len(cities) / (inserted - start), len(cities) / (looked_up - inserted)
+
+
+if __name__ == '__main__':
+    for dataset, cities in datasets:
+        print("__" + dataset + "__")
+        for table_type in (LinearProbeTable, CuckooHashTable):
+            for table_size in table_sizes:
+                statistics, inserts, lookups = benchmark(table_type, cities, table_size)
+                print(table_type.__name__, table_size, statistics,
+                      round(inserts), "inserts/s", round(lookups), "lookups/s")
@@ -0,0 +1,330 @@
+""" Cuckoo Hash Table ADT
+
+Defines a Hash Table using cuckoo hashing for conflict resolution. Every key has
+exactly two possible slots, one in each of two arrays chosen by two independent
+hash functions, plus a small stash for the few keys that fit in neither. A lookup
+checks at most those two slots and the stash, so it is O(1) in the worst case.
+
+An insert whose two slots are taken evicts ("kicks") the key in its first slot,
+which moves to its other slot, evicting the key there, and so on. A path longer
+than max_kicks is taken as a cycle: the homeless key goes to the stash, or the
+table is rebuilt with fresh hash functions when the stash is full.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from hash_functions import fnv1a_hash, random_universal_parameters, universal_hash
+from primes import next_growth_prime, prime_at_least
+from referential_array import ArrayR
+from table_views import TableViewsMixin
+from typing import TypeVar, Generic
+T = TypeVar('T')
+
+
+class CuckooHashTable(TableViewsMixin, Generic[T]):
+    """
+        Cuckoo Hash Table.
+        Slots hold (key, data, code1, code2) where code1 and code2 are the two hash codes of key.
+
+        attributes:
+            count: number of elements in the hash table
+            table1, table2: the two arrays, a key is either at code1 % tablesize of table1
+                            or at code2 % tablesize of table2
+            stash: the keys that fit in neither array, at most stash_size of them
+            tablesize: size of each of the two arrays
+            hash1, hash2: the two hash functions
+            max_kicks: the longest eviction path before an insert gives up
+    """
+
+    MAX_KICKS = 32
+    STASH_SIZE = 4
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, max_kicks: int = MAX_KICKS,
+                 stash_size: int = STASH_SIZE) -> None:
+        """
+            Initialiser.
+            :param max_kicks: the number of evictions an insert may make before it gives up
+            :param stash_size: the number of keys kept aside when no eviction path is found
+            :raises ValueError: when max_kicks is smaller than 1 or stash_size is negative
+        """
+        if max_kicks < 1:
+            raise ValueError("max_kicks should be at least 1.")
+        if stash_size < 0:
+            raise ValueError("stash_size should not be negative.")
+
+        self.max_kicks = max_kicks
+        self.stash_size = stash_size
+        # two unrelated families, so the two slots of a key are independent
+        self.hash1 = universal_hash()
+        self.hash2 = fnv1a_hash()
+        self.count = 0
+
+        if tablesize_override == -1:
+            self.tablesize = prime_at_least(expected_size)
+        else:
+            self.tablesize = tablesize_override
+        self._allocate(self.tablesize)
+
+        # Values to return when statistics method is called
+        self.conflict = 0
+        self.total_kicks = 0
+        self.longest_kick_path = 0
+        self.rehashing_count = 0
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate the two empty arrays of tablesize slots and an empty stash
+            :complexity: O(tablesize)
+        """
+        self.table1 = ArrayR(tablesize)
+        self.table2 = ArrayR(tablesize)
+        self.stash = []
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of inserts finding both slots taken, the total number of kicks,
+            the longest eviction path and the number of times the table is rehashed
+            :complexity: O(1)
+        """
+        return (self.conflict, self.total_kicks, self.longest_kick_path, self.rehashing_count)
+
+    def __len__(self) -> int:
+        """
+            Returns number of elements in the hash table
+            :complexity: O(1)
+        """
+        return self.count
+
+    def is_empty(self) -> bool:
+        """
+            Returns whether the hash table is empty
+            :complexity: O(1)
+        """
+        return self.count == 0
+
+    def _locate(self, key: str, code1: int = None, code2: int = None) -> tuple:
+        """
+            Find the slot holding key. The hash codes are computed here when not given,
+            the second one only when key is not in its first slot.
+            :returns: (array, index) where array is table1, table2 or the stash, (None, -1) when key is not in the table
+            :complexity: O(K + S) where K is the size of the key and S the stash size
+        """
+        if code1 is None:
+            code1 = self.hash1(key)
+        position = code1 % self.tablesize
+        item = self.table1[position]
+        if item is not None and item[2] == code1 and item[0] == key:
+            return self.table1, position
+
+        if code2 is None:
+            code2 = self.hash2(key)
+        position = code2 % self.tablesize
+        item = self.table2[position]
+        if item is not None and item[3] == code2 and item[0] == key:
+            return self.table2, position
+
+        for index in range(len(self.stash)):
+            if self.stash[index][0] == key:
+                return self.stash, index
+        return None, -1
+
+    def __contains__(self, key: str) -> bool:
+        """
+            Checks to see if the given key is in the Hash Table
+            :see: #self._locate(key: str)
+        """
+        return self._locate(key)[0] is not None
+
+    def __getitem__(self, key: str) -> T:
+        """
+            Get the item at a certain key
+            :see: #self._locate(key: str)
+            :raises KeyError: when the item doesn't exist
+        """
+        array, index = self._locate(key)
+        if array is None:
+            raise KeyError(key)
+        return array[index][1]
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+            Returns the data of key, or default when key is not in the table
+            :see: #self._locate(key: str)
+        """
+        array, index = self._locate(key)
+        if array is None:
+            return default
+        return array[index][1]
+
+    def __setitem__(self, key: str, data: T) -> None:
+        """
+            Set an (key, data) pair in our hash table, growing the table once it is half full
+            :complexity: O(K + S) for an update, O(K + max_kicks) for a new key unless it rehashes
+        """
+        code1 = self.hash1(key)
+        code2 = self.hash2(key)
+        item = (key, data, code1, code2)
+        array, index = self._locate(key, code1, code2)
+        if array is not None:
+            array[index] = item
+            return
+
+        if self.count >= self.tablesize:
+            self._rehash(True)
+            item = (key, data, self.hash1(key), self.hash2(key))
+        self._add(item)
+        self.count += 1
+
+    def insert(self, key: str, data: T) -> None:
+        """
+            Utility method to call our setitem method
+            :see: #__setitem__(self, key: str, data: T)
+        """
+        self[key] = data
+
+    def __delitem__(self, key: str) -> None:
+        """
+            Remove key from the table
+            :raises KeyError: when key is not in the table
+            :see: #self.pop(key: str)
+        """
+        self.pop(key)
+
+    def pop(self, key: str, *default: T) -> T:
+        """
+            Remove key and return its data, then move stashed keys back into the arrays if they now fit
+            :param default: returned when key is not in the table, if given
+            :raises KeyError: when key is not in the table and no default is given
+            :complexity: O(K + S) where K is the size of the key and S the stash size
+        """
+        array, index = self._locate(key)
+        if array is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        data = array[index][1]
+        if array is self.stash:
+            self.stash.pop(index)
+        else:
+            array[index] = None
+            self._drain_stash()
+        self.count -= 1
+        return data
+
+    def _drain_stash(self) -> None:
+        """
+            Move every stashed key whose first or second slot is free into it
+            :complexity: O(S) where S is the stash size
+        """
+        for item in list(self.stash):
+            position = item[2] % self.tablesize
+            if self.table1[position] is None:
+                self.table1[position] = item
+                self.stash.remove(item)
+                continue
+            position = item[3] % self.tablesize
+            if self.table2[position] is None:
+                self.table2[position] = item
+                self.stash.remove(item)
+
+    def _place(self, item: tuple) -> tuple:
+        """
+            Put an item in one of its two slots, kicking other items out along an eviction path
+            of at most max_kicks steps
+            :returns: None when every item found a slot, otherwise the item left homeless
+            :complexity best: O(1) a slot of item is free
+            :complexity worst: O(max_kicks)
+        """
+        tablesize = self.tablesize
+        position = item[2] % tablesize
+        if self.table1[position] is None:
+            self.table1[position] = item
+            return None
+        if self.table2[item[3] % tablesize] is None:
+            self.table2[item[3] % tablesize] = item
+            return None
+
+        self.conflict += 1
+        table, code_index = self.table1, 2
+        kicks = 0
+        while item is not None and kicks < self.max_kicks:
+            position = item[code_index] % tablesize
+            evicted = table[position]
+            table[position] = item
+            item = evicted
+            if item is not None:
+                kicks += 1
+                # the evicted item moves to its slot in the other array
+                if table is self.table1:
+                    table, code_index = self.table2, 3
+                else:
+                    table, code_index = self.table1, 2
+
+        self.total_kicks += kicks
+        if kicks > self.longest_kick_path:
+            self.longest_kick_path = kicks
+        return item
+
+    def _add(self, item: tuple) -> None:
+        """
+            Place a new item, stashing it when no eviction path is found, rehashing when the stash is full
+            :complexity: O(max_kicks), or O(self._rehash()) when it rehashes
+        """
+        homeless = self._place(item)
+        if homeless is not None:
+            if len(self.stash) < self.stash_size:
+                self.stash.append(homeless)
+            else:
+                self._rehash(False, homeless)
+
+    def _rebuild(self, items: list) -> bool:
+        """
+            Place every item in the empty arrays with the current hash functions
+            :returns: whether every item found a slot or a place in the stash
+            :complexity: O(N * max_kicks) where N is the number of items
+        """
+        for key, data, _, _ in items:
+            homeless = self._place((key, data, self.hash1(key), self.hash2(key)))
+            if homeless is not None:
+                if len(self.stash) == self.stash_size:
+                    return False
+                self.stash.append(homeless)
+        return True
+
+    def _rehash(self, grow: bool, pending: tuple = None) -> None:
+        """
+            Rebuild the table with two fresh hash functions drawn from RandomGen,
+            after a cycle at the same size, or at the next growth size when grow is set.
+            A rebuild that fails again is retried at a bigger size.
+            :param pending: an item to add to the table, left homeless by a cycle
+            :complexity: O(N * max_kicks) per attempt where N is the number of items
+        """
+        items = list(self._entries())
+        if pending is not None:
+            items.append(pending)
+
+        while True:
+            self.rehashing_count += 1
+            if grow:
+                self.tablesize = next_growth_prime(self.tablesize)
+            self.hash1 = universal_hash(*random_universal_parameters())
+            self.hash2 = universal_hash(*random_universal_parameters())
+            self._allocate(self.tablesize)
+            if self._rebuild(items):
+                return
+            grow = True
+
+    def _entries(self):
+        """
+            Iterate over the stored (key, data, code1, code2) items
+            :complexity: O(N) where N is the table size
+        """
+        for table in (self.table1, self.table2):
+            for item in table:
+                if item is not None:
+                    yield item
+        for item in self.stash:
+            yield item
@@ -0,0 +1,156 @@
+""" Frozen Hash Table ADT
+
+Defines a read-only Hash Table, a compact snapshot of another table made by its
+freeze() method. Reference data (the city files, ...) is loaded once and only read
+afterwards, so it does not need the headroom and bookkeeping of a table that grows.
+
+The snapshot is built once at a high load factor, MAX_LOAD instead of a half, in
+the parallel arrays of ParallelLinearProbeTable: keys, values and the hash codes
+precomputed by the original table, with no tuple per entry. The entries are placed
+Robin Hood style and every slot records its distance from home, so a lookup for a
+missing key stops as soon as it reaches an entry closer to home than the key would
+be, instead of running to the end of a long cluster.
+
+Every read of LinearProbeTable works on it, every write raises TypeError.
+
+Usage:
+```
+cities = LinearProbeTable(1000)
+cities.bulk_insert(load_cities())
+cities = cities.freeze()
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from array import array
+from compact_hash_table import CompactLinearProbeTable
+from hash_table import LinearProbeTable
+from parallel_hash_table import ParallelLinearProbeTable
+from typing import TypeVar
+T = TypeVar('T')
+
+
+class FrozenHashTable(ParallelLinearProbeTable[T]):
+    """
+        Read-only Linear Probe Table packed at a high load factor.
+
+        attributes:
+            distances: how far the entry in every slot is from its home position
+            max_load: the load factor the table was packed to
+    """
+
+    MAX_LOAD = 0.85
+
+    def __init__(self, table, max_load: float = MAX_LOAD) -> None:
+        """
+            Initialiser, a snapshot of the entries of table hashing with the same hash function
+            :param table: a hash table with _entries() yielding (key, data, hash code, ...) and a hash function
+            :param max_load: the load factor the snapshot is packed to
+            :raises ValueError: when max_load is not in (0, 1)
+            :complexity: O(N) expected where N is the number of entries
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be between 0 and 1.")
+
+        entries = list(table._entries())
+        tablesize = self._prime_at_least(int(len(entries) / max_load) + 1)
+        LinearProbeTable.__init__(self, tablesize, tablesize)
+        self.max_load = max_load
+        self.key_type = getattr(table, 'key_type', str)
+
+        # keep the hash of the table, rebound to this one when it is a method other than the default
+        hash_function = table.hash
+        if not hasattr(hash_function, '__func__'):
+            self.hash = hash_function
+        elif hash_function.__func__ is not LinearProbeTable.hash:
+            self.hash = hash_function.__func__.__get__(self)
+
+        for item in entries:
+            self._place(item[0], item[1], item[2])
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate the parallel arrays and the distances for tablesize slots, the distances
+            in the narrowest typecode able to hold any distance below tablesize
+            :complexity: O(tablesize)
+        """
+        ParallelLinearProbeTable._allocate(self, tablesize)
+        typecode = next(typecode for typecode, largest in CompactLinearProbeTable.INDEX_TYPECODES
+                        if tablesize <= largest)
+        self.distances = array(typecode, [0]) * tablesize
+
+    def _place(self, key: str, data: T, code: int) -> None:
+        """
+            Robin Hood insert of a new key: it takes the slot of any entry closer to its home
+            than itself, and that entry carries on probing in its place
+            :complexity best: O(1) home position is empty
+            :complexity worst: O(N) where N is the tablesize
+        """
+        hashes, keys_array, values_array, distances = self.hashes, self.keys_array, self.values_array, self.distances
+        tablesize = self.tablesize
+        position = code % tablesize
+        distance = 0
+        while hashes[position] != self.EMPTY:
+            if distances[position] < distance:  # the resident is richer, it gives up its slot
+                key, keys_array[position] = keys_array[position], key
+                data, values_array[position] = values_array[position], data
+                code, hashes[position] = hashes[position], code
+                distance, distances[position] = distances[position], distance
+            distance += 1
+            position = (position + 1) % tablesize
+
+        keys_array[position] = key
+        values_array[position] = data
+        hashes[position] = code
+        distances[position] = distance
+        self.count += 1
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key, or -1 when it is not there. The search stops as soon as
+            it reaches an entry closer to its home than the key would be.
+            :complexity best: O(1) first position is empty or holds key
+            :complexity worst: O(D) where D is the longest distance stored in the table
+        """
+        hashes, keys_array, distances = self.hashes, self.keys_array, self.distances
+        tablesize = self.tablesize
+        position = code % tablesize
+
+        for distance in range(tablesize):
+            slot_code = hashes[position]
+            if slot_code == self.EMPTY or distances[position] < distance:  # key would have been placed here
+                return -1
+            elif slot_code == code and keys_array[position] == key:  # found key
+                return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of keys away from their home position, total probe length,
+            longest probe length and number of times the table is rehashed (always 0)
+            :see: #LinearProbeTable.scan_statistics()
+        """
+        return self.scan_statistics()
+
+    def freeze(self) -> FrozenHashTable:
+        """
+            Returns this table, it is already frozen
+            :complexity: O(1)
+        """
+        return self
+
+    def _read_only(self, *args, **kwargs) -> None:
+        """
+            Reject a write
+            :raises TypeError: always
+        """
+        raise TypeError(type(self).__name__ + " is read-only.")
+
+    # every method writing to the table
+    __setitem__ = insert = __delitem__ = pop = setdefault = update_with = _read_only
+    insert_many = bulk_insert = _read_only
@@ -10,6 +10,7 @@ from trader import HardTrader, RandomTrader, RangeTrader, Trader
 from material import Material
 from cave import Cave
 from food import Food
+from name_catalogs import name_index
 from random_gen import RandomGen
 
 __author__ = "Rachit Bhatia"
@@ -149,6 +150,38 @@ class Game:
                 self.materials.append(new_material)
 
 
+    def catalog_names_taken(self, catalog: str, existing: list) -> bytearray:
+        """
+        Mark the names of a catalog (see name_catalogs) used by the existing objects
+        :param catalog: the name list the objects got their names from
+        :param existing: the objects already in the game, anything with a name
+        :returns: a bytearray holding 1 at the catalog position of every name taken
+        :complexity: Best-case = Worst-case = O(N), where N is the length of existing
+        """
+        names = name_index(catalog)
+        names_taken = bytearray(len(names))
+        for item in existing:
+            position = names.index(item.name)
+            if position != -1:
+                names_taken[position] = 1
+        return names_taken
+
+    def is_name_taken(self, catalog: str, name: str, names_taken: bytearray, existing: list) -> bool:
+        """
+        Check if name is already used by one of the existing objects, marking it taken otherwise.
+        Names from the catalog are looked up in O(1) with its perfect hash, any other name by scanning existing.
+        :param names_taken: the names of the catalog taken, see catalog_names_taken()
+        :complexity: Best-case = O(1) when the name is in the catalog, Worst-case = O(N), where N is the length of existing
+        """
+        position = name_index(catalog).index(name)
+        if position == -1:
+            return any(item.name == name for item in existing)
+        if names_taken[position]:
+            return True
+        names_taken[position] = 1
+        return False
+
+
     def generate_random_caves(self, amount: int) -> None:
         """
         Generates <amount> random caves using Cave.random_cave
@@ -156,17 +189,14 @@ class Game:
         (You may have to call Cave.random_cave more than <amount> times.)
 
         :param amount: the amount of caves to be set in the game 
-        :complexity: Best-case = Worst-case = O(amount * N), where N is the number of caves in self.caves
+        :complexity: Best-case = Worst-case = O(amount + N), where N is the number of caves in self.caves
         """
+        names_taken = self.catalog_names_taken("cave", self.caves)
         while len(self.caves) < amount:
             new_cave = Cave.random_cave(self.materials)
-            similar_cave = False 
 
-            #iterating through the Game's caves list to check for existing caves with same name
-            for cave in self.caves:
-                if (new_cave.name == cave.name):
-                    similar_cave = True
-                    break
+            #checking the names already taken for an existing cave with same name
+            similar_cave = self.is_name_taken("cave", new_cave.name, names_taken, self.caves)
 
             #add the randomly generated cave only if a cave with the same name does not exist in the self.caves list
             if not similar_cave:
@@ -182,13 +212,12 @@ class Game:
         (You may have to call <TraderClass>.random_trader() more than <amount> times.)
 
         :param amount: the amount of traders to be set in the game 
-        :complexity: Best-case = Worst-case = O(amount * N) + O(amount * S), where N is the number of traders in self.traders and
+        :complexity: Best-case = Worst-case = O(amount + N) + O(amount * S), where N is the number of traders in self.traders and
                      S is the length of the list subset which is copied to a new list in the random_traders_setup function
         """
 
-
+        names_taken = self.catalog_names_taken("trader", self.traders)
         while len(self.traders) < amount:
-            similar_trader = False
             trader_type_number = RandomGen.randint(1,3) #randomly generating a number to randomly choose a trader class
             
             if trader_type_number == 1:
@@ -201,11 +230,8 @@ class Game:
                 new_trader = self.random_traders_setup(HardTrader) #HardTrader selected if random number generated was 3
 
 
-            #iterating through the Game's Traders list to check for existing traders with same name
-            for trader in self.traders:
-                if (new_trader.name == trader.name):
-                    similar_trader = True
-                    break
+            #checking the names already taken for an existing trader with same name
+            similar_trader = self.is_name_taken("trader", new_trader.name, names_taken, self.traders)
             
             #add the randomly generated Trader only if a trader with the same name does not exist in the self.traders list
             if not similar_trader:
@@ -391,17 +417,14 @@ class MultiplayerGame(Game):
         Generate <amount> random players. Don't need anything unique, but you can do so if you'd like.
         
         :param amount: the number of players to be generated
-        :complexity: Best-case = Worst-case = O(amount * P), where P is the number of players in self.players
+        :complexity: Best-case = Worst-case = O(amount + P), where P is the number of players in self.players
         """
+        names_taken = self.catalog_names_taken("player", self.players)
         while len(self.players) < amount:
             new_player = Player.random_player()
-            similar_player = False
 
-            #iterating through the Game's players list to check for existing players with same name
-            for player in self.players:
-                if player.name == new_player.name:
-                    similar_player = True
-                    break
+            #checking the names already taken for an existing player with same name
+            similar_player = self.is_name_taken("player", new_player.name, names_taken, self.players)
             
             #add the randomly generated player only if a player with the same name does not exist in self.players
             if not similar_player:
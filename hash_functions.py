@@ -0,0 +1,305 @@
+""" Hash Functions
+
+A registry of hash strategies the hash tables can be constructed with.
+Every entry is a factory: it takes the parameters of the strategy (a base, a seed, ...)
+and returns a function mapping a key to a non-negative 63-bit hash code.
+The codes do not depend on the table size, the tables reduce them to a position.
+
+Usage:
+```
+hash_function = make_hash_function("polynomial", base=9929)
+table = LinearProbeTable(1000, hash_function=hash_function)
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import numbers
+from random_gen import RandomGen
+from typing import Callable
+
+# Hash codes are kept to 63 bits so they fit in a signed 64-bit integer
+HASH_MASK = (1 << 63) - 1
+MASK_64 = (1 << 64) - 1
+
+FNV_OFFSET_BASIS = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+
+# xxHash primes, combining the element codes of a tuple like CPython's tuple hash
+XXPRIME_1 = 11400714785074694791
+XXPRIME_2 = 14029467366897019727
+XXPRIME_5 = 2870177450012600261
+
+HASH_FUNCTIONS = {}
+
+
+def register_hash_function(name: str, factory: Callable[..., Callable]) -> None:
+    """
+        Add a hash strategy to the registry, replacing any strategy with the same name
+        :complexity: O(1)
+    """
+    HASH_FUNCTIONS[name] = factory
+
+
+def make_hash_function(name: str, **parameters) -> Callable:
+    """
+        Build the hash function of a registered strategy
+        :param name: the name the strategy was registered with
+        :param parameters: keyword arguments passed on to the factory of the strategy
+        :raises ValueError: when no strategy is registered under name
+        :complexity: O(1) plus the cost of the factory
+    """
+    if name not in HASH_FUNCTIONS:
+        raise ValueError("Unknown hash function " + str(name))
+    return HASH_FUNCTIONS[name](**parameters)
+
+
+def polynomial_hash(base: int = 31) -> Callable[[str], int]:
+    """
+        Polynomial (Horner) string hash: value = value * base + ord(char) for every character.
+        A base of 1 just adds the characters up, so all anagrams collide.
+        :complexity: O(len(key)) per call
+    """
+    def hash_function(key: str) -> int:
+        value = 0
+        for char in key:
+            value = (value * base + ord(char)) & HASH_MASK
+        return value
+    return hash_function
+
+
+def universal_hash(a: int = 31415, b: int = 27183) -> Callable[[str], int]:
+    """
+        Universal-style polynomial whose multiplier changes on every character (a = a * b).
+        With the default parameters it is the default hash of LinearProbeTable.
+        :complexity: O(len(key)) per call
+    """
+    def hash_function(key: str) -> int:
+        value = 0
+        multiplier = a
+        for char in key:
+            value = (ord(char) + multiplier * value) & HASH_MASK
+            multiplier = multiplier * b & HASH_MASK
+        return value
+    return hash_function
+
+
+def random_universal_parameters() -> tuple:
+    """
+        Draw fresh (a, b) parameters for universal_hash from RandomGen,
+        odd 63-bit numbers each made of two 32-bit draws
+        :complexity: O(1)
+    """
+    a = (RandomGen.random() << 32 | RandomGen.random() | 1) & HASH_MASK
+    b = (RandomGen.random() << 32 | RandomGen.random() | 1) & HASH_MASK
+    return a, b
+
+
+def fnv1a_hash() -> Callable[[str], int]:
+    """
+        64-bit FNV-1a over the UTF-8 bytes of the key, truncated to 63 bits.
+        :complexity: O(len(key)) per call
+    """
+    def hash_function(key: str) -> int:
+        value = FNV_OFFSET_BASIS
+        for byte in key.encode():
+            value = ((value ^ byte) * FNV_PRIME) & MASK_64
+        return value & HASH_MASK
+    return hash_function
+
+
+def mix64(code: int) -> int:
+    """
+        MurmurHash3 64-bit finaliser, so every bit of the result depends on every bit of code
+        :complexity: O(1)
+    """
+    code ^= code >> 33
+    code = (code * 0xff51afd7ed558ccd) & MASK_64
+    code ^= code >> 33
+    code = (code * 0xc4ceb9fe1a85ec53) & MASK_64
+    code ^= code >> 33
+    return code
+
+
+def _rotate_left(value: int, bits: int) -> int:
+    """
+        Rotate a 64-bit value left by bits
+        :complexity: O(1)
+    """
+    return ((value << bits) | (value >> (64 - bits))) & MASK_64
+
+
+def siphash24(k0: int, k1: int, data: bytes) -> int:
+    """
+        SipHash-2-4 of data under the 128-bit key (k0, k1), as a 64-bit integer.
+        :complexity: O(len(data))
+    """
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sip_round():
+        nonlocal v0, v1, v2, v3
+        v0 = (v0 + v1) & MASK_64
+        v1 = _rotate_left(v1, 13) ^ v0
+        v0 = _rotate_left(v0, 32)
+        v2 = (v2 + v3) & MASK_64
+        v3 = _rotate_left(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASK_64
+        v3 = _rotate_left(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASK_64
+        v1 = _rotate_left(v1, 17) ^ v2
+        v2 = _rotate_left(v2, 32)
+
+    length = len(data)
+    end = length - length % 8
+    for start in range(0, end, 8):
+        word = int.from_bytes(data[start:start + 8], 'little')
+        v3 ^= word
+        sip_round()
+        sip_round()
+        v0 ^= word
+
+    # last block holds the remaining bytes and the length of the data in its top byte
+    word = ((length & 0xff) << 56) | int.from_bytes(data[end:], 'little')
+    v3 ^= word
+    sip_round()
+    sip_round()
+    v0 ^= word
+
+    v2 ^= 0xff
+    for _ in range(4):
+        sip_round()
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+def siphash_hash(key: int = 0) -> Callable[[str], int]:
+    """
+        Keyed SipHash-2-4 over the UTF-8 bytes of the key, truncated to 63 bits.
+        :param key: the 128-bit secret, its low 64 bits are k0 and its high 64 bits are k1
+        :complexity: O(len(key)) per call
+    """
+    k0 = key & MASK_64
+    k1 = (key >> 64) & MASK_64
+
+    def hash_function(key: str) -> int:
+        return siphash24(k0, k1, key.encode()) & HASH_MASK
+    return hash_function
+
+
+def multiply_shift_hash(a: int = 0x9e3779b97f4a7c15, b: int = 0) -> Callable[[int], int]:
+    """
+        Multiply-add-shift hash for integer keys: ((a * key + b) mod 2^64) >> 1.
+        :param a: the multiplier, made odd so no bit of the key is lost
+        :param b: the increment
+        :complexity: O(1) per call
+    """
+    a = (a | 1) & MASK_64
+
+    def hash_function(key: int) -> int:
+        return ((a * (key & MASK_64) + b) & MASK_64) >> 1
+    return hash_function
+
+
+def bytes_hash(a: int = 31415, b: int = 27183) -> Callable[[bytes], int]:
+    """
+        universal_hash over the byte values of a bytes key, read directly without an ord() per character.
+        An ASCII string and its encoding get the same hash code.
+        :complexity: O(len(key)) per call
+    """
+    def hash_function(key: bytes) -> int:
+        value = 0
+        multiplier = a
+        for byte in key:
+            value = (byte + multiplier * value) & HASH_MASK
+            multiplier = multiplier * b & HASH_MASK
+        return value
+    return hash_function
+
+
+def tuple_hash(a: int = None, b: int = None) -> Callable[[tuple], int]:
+    """
+        Hash for tuple keys, combining the codes of the elements in order with the xxHash
+        round of CPython's tuple hash. Strings, ints, bytes and nested tuples, subclasses
+        included (a bool is an int), are hashed with the strategies of this module.
+        Equal elements get equal codes like they do under the built-in hash(): any other number
+        equal to an int (1.0, Fraction(2, 1), Decimal(3), 1+0j) is hashed as that int, every
+        other hashable element with the built-in hash().
+        :param a, b: parameters the element strategies are all built with, their own defaults when not given
+        :complexity: O(S) per call where S is the total size of the elements
+    """
+    if a is None:
+        element_hashes = {str: universal_hash(), int: multiply_shift_hash(), bytes: bytes_hash()}
+    else:
+        element_hashes = {str: universal_hash(a, b), int: multiply_shift_hash(a, b), bytes: bytes_hash(a, b)}
+
+    def element_code(element) -> int:
+        element_hash = element_hashes.get(type(element))
+        if element_hash is not None:
+            return element_hash(element)
+        for element_type in (str, int, bytes, tuple):
+            if isinstance(element, element_type):
+                return element_hashes[element_type](element)
+        if isinstance(element, numbers.Number):
+            try:
+                integer = int(element.real)
+            except (OverflowError, ValueError):  # infinity or NaN
+                integer = None
+            if integer is not None and element == integer:
+                return element_hashes[int](integer)
+        return hash(element) & MASK_64
+
+    def hash_function(key: tuple) -> int:
+        value = XXPRIME_5
+        for element in key:
+            value = (value + element_code(element) * XXPRIME_2) & MASK_64
+            value = _rotate_left(value, 31) * XXPRIME_1 & MASK_64
+        return (value + (len(key) ^ XXPRIME_5 ^ 3527539)) & HASH_MASK
+
+    element_hashes[tuple] = hash_function
+    return hash_function
+
+
+# The hash function of every key type a table can be specialised for, built once and shared
+# so that tables of the same key type give the same hash codes
+KEY_TYPE_HASHES = {str: universal_hash(), int: multiply_shift_hash(), bytes: bytes_hash(), tuple: tuple_hash()}
+
+
+def key_type_hash(key_type: type) -> Callable:
+    """
+        Returns the hash function for keys of key_type, so a table picks it once instead of
+        checking the type of every key
+        :raises ValueError: when there is no hash function for key_type
+        :complexity: O(1)
+    """
+    if key_type not in KEY_TYPE_HASHES:
+        raise ValueError("No hash function for keys of type " + key_type.__name__)
+    return KEY_TYPE_HASHES[key_type]
+
+
+# The factory of KEY_TYPE_HASHES for every key type, taking (a, b) parameters
+SEEDED_KEY_TYPE_HASHES = {str: universal_hash, int: multiply_shift_hash, bytes: bytes_hash, tuple: tuple_hash}
+
+
+def seeded_key_type_hash(key_type: type, a: int, b: int) -> Callable:
+    """
+        Returns a new hash function for keys of key_type built with the parameters (a, b),
+        such as the ones drawn by random_universal_parameters()
+        :raises ValueError: when there is no hash function for key_type
+        :complexity: O(1)
+    """
+    if key_type not in SEEDED_KEY_TYPE_HASHES:
+        raise ValueError("No hash function for keys of type " + key_type.__name__)
+    return SEEDED_KEY_TYPE_HASHES[key_type](a, b)
+
+
+register_hash_function("polynomial", polynomial_hash)
+register_hash_function("universal", universal_hash)
+register_hash_function("fnv1a", fnv1a_hash)
+register_hash_function("siphash", siphash_hash)
+register_hash_function("multiply_shift", multiply_shift_hash)
+register_hash_function("bytes", bytes_hash)
+register_hash_function("tuple", tuple_hash)
@@ -3,7 +3,7 @@
 Defines a Hash Table using Linear Probing for conflict resolution.
 """
 from __future__ import annotations
-from primes import LargestPrimeIterator
+from primes import is_prime, next_growth_prime, prime_at_least
 
 __author__ = 'Brendon Taylor. Modified by Graeme Gange, Alexey Ignatiev, Jackson Goerner , Tan Jun Yu'
 __docformat__ = 'reStructuredText'
@@ -11,13 +11,17 @@ __modified__ = '21/05/2020'
 __since__ = '14/05/2020'
 
 
+import batch_hash
+import math
+from hash_functions import HASH_MASK, key_type_hash
 from referential_array import ArrayR
-from typing import TypeVar, Generic
+from table_views import TableViewsMixin
+from typing import Callable, TypeVar, Generic
 T = TypeVar('T')
 
 
 
-class LinearProbeTable(Generic[T]):
+class LinearProbeTable(TableViewsMixin, Generic[T]):
     """
         Linear Probe Table.
 
@@ -25,51 +29,54 @@ class LinearProbeTable(Generic[T]):
             count: number of elements in the hash table
             table: used to represent our internal array
             tablesize: current size of the hash table
+            key_type: the type of the keys
+
+        Every occupied slot holds a (key, data, hash code) tuple. The hash code does not
+        depend on the table size, so a resize only has to reduce the cached codes again.
     """
 
     def check_prime(self,num : int) -> bool:
         '''
         Function to check if the num is prime . Returns True or False
         :param num : the number to be checked if it is prime or not 
-        :complexity: best : O(1) when num is less than or equal to 1
-                     worst: O(N) where N is num since the for loop is depending on the num 
+        :complexity: O(log(num)^3), see primes.is_prime()
         '''
-        if num > 1:
-        # Iterate from 2 to n / 2
-            for i in range(2, int(num/2)+1):
-            # If num is divisible by any number between
-            # 2 and n / 2, it is not prime
-                if (num % i) == 0:
-                    return False
-            else:
-                return True
-        else:
-            return False
+        return is_prime(num)
 
 
-    def __init__(self, expected_size: int, tablesize_override: int = -1) -> None:
+    def __init__(self, expected_size: int, tablesize_override: int = -1, hash_function: Callable[[str], int] = None,
+                 shrink_threshold: float = 0, key_type: type = str) -> None:
         """
             Initialiser.
+            :param hash_function: a hash strategy (see hash_functions) used instead of self.hash
+            :param shrink_threshold: load factor under which a deletion shrinks the table back
+                                     towards its initial size, 0 never shrinks
+            :param key_type: the type of the keys (str, int, bytes or tuple), the hash function
+                             specialised for it is picked here once, unless hash_function is given
+            :raises ValueError: when shrink_threshold is not in [0, 0.25), or there is no hash for key_type
         """
+        if not 0 <= shrink_threshold < 0.25:
+            raise ValueError("shrink_threshold should be at least 0 and below 0.25.")
+        self.shrink_threshold = shrink_threshold
+
+        self.key_type = key_type
+        if hash_function is not None:
+            self.hash = hash_function
+        elif key_type is not str:
+            self.hash = key_type_hash(key_type)
         self.count = 0
         self.tablesize = None
 
         
         if tablesize_override == -1 :
-            # if expected_size is prime number, set the table_size to expected_size
-            if self.check_prime(expected_size) :
-                self.tablesize = expected_size
-            # if expected_size is not prime number
-            else : 
-                # Increment the expected_size by 1 untill it becomes a prime number then only set it as the table_size
-                while not self.check_prime(expected_size):
-                    expected_size += 1
-                self.tablesize = expected_size    
+            # the table_size is expected_size if it is prime, or the next prime after it
+            self.tablesize = self._prime_at_least(expected_size)
         else : 
             # Set the table_size to tablesize_override if tablesize_override is not -1
             self.tablesize = tablesize_override
         
-        self.table = ArrayR(self.tablesize)
+        self.min_tablesize = self.tablesize
+        self._allocate(self.tablesize)
 
         # Values to return when statistics method is called
         self.conflict = 0   
@@ -78,9 +85,24 @@ class LinearProbeTable(Generic[T]):
         self.rehashing_count = 0
 
 
+    def _prime_at_least(self, number: int) -> int:
+        """
+            Returns the smallest prime number greater than or equal to number
+            :see: #primes.prime_at_least(number: int)
+        """
+        return prime_at_least(number)
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate empty slot storage for tablesize slots
+            :complexity: O(tablesize)
+        """
+        self.table = ArrayR(tablesize)
+
     def hash(self, key: str) -> int:
         """
-        Hash a key for insertion into the hashtable.
+        Hash a key into a full-width hash code, independent of the table size.
+        The position in the table is the code modulo the table size.
         :param key : the key to hash
         :Time complexity : Best Case = Worst Case = O(len(key))
         """
@@ -88,8 +110,8 @@ class LinearProbeTable(Generic[T]):
         a = 31415
         b = 27183
         for char in key:
-            value = (ord(char) + a*value) % self.tablesize
-            a = a*b %(self.tablesize-1)
+            value = (ord(char) + a*value) & HASH_MASK
+            a = a*b & HASH_MASK
 
         return value
 
@@ -100,6 +122,63 @@ class LinearProbeTable(Generic[T]):
         """
         return (self.conflict,self.total_distance_probed,self.length_longest_probe,self.rehashing_count)
 
+    def probe_lengths(self) -> list[int]:
+        """
+            Scan the table for the probe length of every stored key, the distance from its
+            home position to the slot it sits in. Unlike the counters of self.statistics(),
+            nothing is recorded while inserting, so this costs nothing until it is called.
+            :complexity: O(N) where N is the table size
+        """
+        tablesize = self.tablesize
+        return [(position - self._code_at(position) % tablesize) % tablesize
+                for position in range(tablesize) if not self._is_free(position)]
+
+    def probe_histogram(self) -> list[int]:
+        """
+            Returns a list whose i-th value is the number of keys with a probe length of i
+            :see: #self.probe_lengths()
+        """
+        lengths = self.probe_lengths()
+        histogram = [0] * (max(lengths, default=-1) + 1)
+        for length in lengths:
+            histogram[length] += 1
+        return histogram
+
+    def cluster_sizes(self) -> list[int]:
+        """
+            Scan the table for the size of every cluster, a run of occupied slots between two
+            empty ones. A run wrapping around the end of the array counts as one cluster.
+            :complexity: O(N) where N is the table size
+        """
+        tablesize = self.tablesize
+        start = 0
+        while start < tablesize and not self._is_free(start):
+            start += 1
+        if start == tablesize:  # no empty slot, the whole table is one cluster
+            return [tablesize] if tablesize > 0 else []
+
+        sizes = []
+        size = 0
+        for offset in range(1, tablesize + 1):
+            if self._is_free((start + offset) % tablesize):
+                if size > 0:
+                    sizes.append(size)
+                size = 0
+            else:
+                size += 1
+        return sizes
+
+    def scan_statistics(self) -> tuple:
+        """
+            Same figures as self.statistics(), worked out by scanning the current layout instead of
+            counted while probing: the number of keys away from their home position, the total and
+            longest probe lengths, and the number of times the table is rehashed
+            :see: #self.probe_lengths()
+        """
+        lengths = self.probe_lengths()
+        return (sum(1 for length in lengths if length > 0), sum(lengths), max(lengths, default=0),
+                self.rehashing_count)
+
     def __len__(self) -> int:
         """
             Returns number of elements in the hash table
@@ -107,16 +186,20 @@ class LinearProbeTable(Generic[T]):
         """
         return self.count
 
-    def _linear_probe(self, key: str, is_insert: bool) -> int:
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
         """
-            Find the correct position for this key in the hash table using linear probing
+            Find the correct position for this key in the hash table using linear probing.
+            Cached hash codes are compared before the keys themselves.
+            :param code: the hash code of key, computed here when not given
             :complexity best: O(K) first position is empty
                             where K is the size of the key
             :complexity worst: O(K + N) when we've searched the entire table
                             where N is the tablesize
             :raises KeyError: When a position can't be found
         """
-        position = self.hash(key)  # get the position using hash
+        if code is None:
+            code = self.hash(key)
+        position = code % len(self.table)  # get the position using the hash code
 
         conflict_counted = False
 
@@ -131,7 +214,7 @@ class LinearProbeTable(Generic[T]):
                     return position
                 else:
                     raise KeyError(key)  # so the key is not in
-            elif self.table[position][0] == key:  # found key
+            elif self.table[position][2] == code and self.table[position][0] == key:  # found key
                 return position
             else:  # there is something but not the key, try next
                 if is_insert :
@@ -150,64 +233,207 @@ class LinearProbeTable(Generic[T]):
 
         raise KeyError(key)
 
-    def keys(self) -> list[str]:
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key without raising or touching the statistics
+            :returns: the position of key, or -1 when it is not in the table
+            :complexity best: O(1) first position is empty or holds key
+            :complexity worst: O(N) when we've searched the entire table
+                            where N is the tablesize
+        """
+        table = self.table
+        tablesize = len(table)
+        position = code % tablesize
+
+        for _ in range(tablesize):
+            item = table[position]
+            if item is None:  # so the key is not in
+                return -1
+            elif item[2] == code and item[0] == key:  # found key
+                return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def _is_free(self, position: int) -> bool:
         """
-            Returns all keys in the hash table.
+            Returns whether the slot at position is empty
+            :complexity: O(1)
         """
-        res = []
-        for x in range(len(self.table)):
-            if self.table[x] is not None:
-                res.append(self.table[x][0])
-        return res
+        return self.table[position] is None
 
-    def values(self) -> list[T]:
+    def _value_at(self, position: int) -> T:
         """
-            Returns all values in the hash table.
+            Returns the data stored in the slot at position
+            :complexity: O(1)
         """
-        res = []
-        for x in range(len(self.table)):
-            if self.table[x] is not None:
-                res.append(self.table[x][1])
-        return res
+        return self.table[position][1]
+
+    def _code_at(self, position: int) -> int:
+        """
+            Returns the hash code cached in the occupied slot at position
+            :complexity: O(1)
+        """
+        return self.table[position][2]
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) in the slot at position, found by self._linear_probe() for key
+            :complexity: O(1)
+        """
+        if self.table[position] is None:
+            self.count += 1
+
+        self.table[position] = (key, data, code)
+
+    def _remove_at(self, position: int) -> None:
+        """
+            Empty the slot at position using backward-shift deletion: every later item of the
+            cluster that may live in the hole is moved back into it, so no tombstone is left
+            and the remaining probe chains stay unbroken.
+            :complexity best: O(1) next slot is empty
+            :complexity worst: O(C) where C is the length of the cluster
+        """
+        table = self.table
+        tablesize = len(table)
+        table[position] = None
+        self.count -= 1
+
+        hole = position
+        position = (position + 1) % tablesize
+        while table[position] is not None:
+            item = table[position]
+            # the item may move into the hole if the hole is between its home and where it is
+            if (position - item[2] % tablesize) % tablesize >= (position - hole) % tablesize:
+                table[hole] = item
+                table[position] = None
+                hole = position
+            position = (position + 1) % tablesize
 
     def __contains__(self, key: str) -> bool:
         """
             Checks to see if the given key is in the Hash Table
-            :see: #self.__getitem__(self, key: str)
+            :see: #self._find(key: str, code: int)
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self._find(key, self.hash(key)) != -1
 
     def __getitem__(self, key: str) -> T:
         """
             Get the item at a certain key
-            :see: #self._linear_probe(key: str, is_insert: bool)
+            :see: #self._lookup(key: str, code: int)
             :raises KeyError: when the item doesn't exist
         """
-        position = self._linear_probe(key, False)
-        return self.table[position][1]
+        return self._lookup(key, self.hash(key))
+
+    def _lookup(self, key: str, code: int) -> T:
+        """
+            Get the item at a key whose hash code is already known
+            :see: #self._find(key: str, code: int)
+            :raises KeyError: when the item doesn't exist
+        """
+        position = self._find(key, code)
+        if position == -1:
+            raise KeyError(key)
+        return self._value_at(position)
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+            Returns the data of key, or default when key is not in the table
+            :complexity: one probe sequence, see self._find()
+        """
+        position = self._find(key, self.hash(key))
+        if position == -1:
+            return default
+        return self._value_at(position)
+
+    def setdefault(self, key: str, default: T = None) -> T:
+        """
+            Returns the data of key, inserting (key, default) first when key is not in the table
+            :complexity: one probe sequence, see self._linear_probe()
+        """
+        self._check_load()
+        code = self.hash(key)
+        position = self._linear_probe(key, True, code)
+        if self._is_free(position):
+            self._store(position, key, default, code)
+            return default
+        return self._value_at(position)
+
+    def update_with(self, key: str, fn: Callable[[T], T], default: T = None) -> T:
+        """
+            Read-modify-write: store fn(data) as the new data of key, using default as the
+            data when key is not in the table yet
+            :returns: the new data of key
+            :complexity: one probe sequence plus the cost of fn, see self._linear_probe()
+        """
+        self._check_load()
+        code = self.hash(key)
+        position = self._linear_probe(key, True, code)
+        data = fn(default if self._is_free(position) else self._value_at(position))
+        self._store(position, key, data, code)
+        return data
+
+    def pop(self, key: str, *default: T) -> T:
+        """
+            Remove key and return its data.
+            :param default: returned when key is not in the table, if given
+            :raises KeyError: when key is not in the table and no default is given
+            :complexity: one probe sequence plus the backward shift, see self._remove_at()
+        """
+        position = self._find(key, self.hash(key))
+        if position == -1:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        data = self._value_at(position)
+        self._remove_at(position)
+        self._check_underflow()
+        return data
+
+    def __delitem__(self, key: str) -> None:
+        """
+            Remove key from the table, without leaving a tombstone behind
+            :see: #self._remove_at(position: int)
+            :raises KeyError: when key is not in the table
+        """
+        position = self._find(key, self.hash(key))
+        if position == -1:
+            raise KeyError(key)
+        self._remove_at(position)
+        self._check_underflow()
 
     def __setitem__(self, key: str, data: T) -> None:
         """
             Set an (key, data) pair in our hash table
-            :see: #self._linear_probe(key: str, is_insert: bool)
-            :see: #self.__contains__(key: str)
+            :see: #self._insert(key: str, data: T, code: int)
         """
+        self._insert(key, data, self.hash(key))
 
-        # Rehash the table if the the number of items in the hash table is greater than half of its capacity
-        if self.count > ( self.tablesize // 2):
-            self._rehash()
-        
-        position = self._linear_probe(key, True)
+    def _insert(self, key: str, data: T, code: int) -> None:
+        """
+            Set an (key, data) pair whose hash code is already known
+            :see: #self._linear_probe(key: str, is_insert: bool)
+            :see: #self._store(position: int, key: str, data: T, code: int)
+        """
+        self._check_load()
+        position = self._linear_probe(key, True, code)
+        self._store(position, key, data, code)
 
-        if self.table[position] is None:
-            self.count += 1
+    def _max_load(self) -> float:
+        """
+            The load factor the table may reach before an insert rehashes it, a half
+            :complexity: O(1)
+        """
+        return 0.5
 
-        self.table[position] = (key, data)
+    def _check_load(self) -> None:
+        """
+            Rehash the table if the the number of items in the hash table is greater than its maximum load
+            :see: #self._max_load()
+            :complexity: O(1), or O(self._rehash()) when it rehashes
+        """
+        if self.count > self.tablesize * self._max_load():
+            self._rehash()
 
     def is_empty(self):
         """
@@ -230,45 +456,160 @@ class LinearProbeTable(Generic[T]):
         """
         self[key] = data
 
+    def _check_underflow(self) -> None:
+        """
+            Shrink the table if the load factor dropped below shrink_threshold. The new size is
+            the smallest prime keeping the load around a quarter, but never below the initial size.
+            :complexity: O(1), or O(self._resize()) when it shrinks
+        """
+        if self.count < self.tablesize * self.shrink_threshold and self.tablesize > self.min_tablesize:
+            new_table_size = max(self._prime_at_least(4 * self.count), self.min_tablesize)
+            if new_table_size < self.tablesize:
+                self.rehashing_count += 1
+                self._resize(new_table_size)
+
+    def _reserve(self, extra: int) -> None:
+        """
+            Grow the table once, so that extra more keys can be inserted without a rehash
+            :see: #self._max_load()
+            :complexity: O(N) for the resize plus O(self._prime_at_least()) for the new size
+        """
+        needed = self.count + extra
+        max_load = self._max_load()
+        if needed - 1 > self.tablesize * max_load:
+            self.rehashing_count += 1
+            self._resize(self._prime_at_least(math.ceil(needed / max_load)))
+
+    def _entries(self):
+        """
+            Iterate over the stored entries, tuples whose first three fields are key, data and hash code
+            :complexity: O(N) where N is the table size
+        """
+        for item in self.table:
+            if item is not None:
+                yield item
+
+    def _hash_function(self):
+        """
+            Returns the function behind self.hash, two tables with the same one give the same hash codes
+            :complexity: O(1)
+        """
+        return getattr(self.hash, '__func__', self.hash)
+
+    def insert_many(self, items) -> None:
+        """
+            Insert many (key, data) pairs, growing the table at most once up front.
+            items is either an iterable of (key, data) pairs or a mapping to merge in, any hash table
+            with an items() view or a dict; the entries of a LinearProbeTable hashing the same way
+            are moved with their cached hash codes.
+            :complexity: O(N) for the resize plus the cost of inserting every pair,
+                         without hashing them again when merging a table with the same hash
+        """
+        if isinstance(items, LinearProbeTable) and items._hash_function() is self._hash_function():
+            entries = list(items._entries())
+        else:
+            if hasattr(items, 'items'):
+                items = items.items()
+            pairs = list(items)
+            keys = [pair[0] for pair in pairs]
+            entries = list(zip(keys, [pair[1] for pair in pairs], self.hash_many(keys)))
+
+        self._reserve(len(entries))
+        insert = self._insert
+        for item in entries:
+            insert(item[0], item[1], item[2])
+
+    def get_many(self, keys: list[str]) -> list[T]:
+        """
+            Returns the data of every key, the keys being hashed together with self.hash_many()
+            :raises KeyError: when one of the keys doesn't exist
+            :complexity: O(hash_many()) plus one lookup per key
+        """
+        lookup = self._lookup
+        return [lookup(key, code) for key, code in zip(keys, self.hash_many(keys))]
+
+    def hash_many(self, keys: list[str]) -> list[int]:
+        """
+            Hash a batch of keys. When NumPy is available and the table uses its own hash,
+            all keys are hashed together by batch_hash, otherwise one at a time.
+            :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+        """
+        if batch_hash.HAS_NUMPY and getattr(self.hash, '__func__', None) is LinearProbeTable.hash:
+            return batch_hash.universal_codes(keys).tolist()
+        return [self.hash(key) for key in keys]
+
+    def bulk_insert(self, keys: list[str], values: list[T] = None) -> None:
+        """
+            Insert a batch of keys, hashing them all up front with self.hash_many()
+            :param values: the data of every key, the keys themselves when not given
+            :raises ValueError: when there are not as many values as keys
+            :see: #self.insert_many(items)
+        """
+        if values is None:
+            values = keys
+        elif len(values) != len(keys):
+            raise ValueError("Expected as many values as keys.")
+
+        self.insert_many(zip(keys, values))
+
+    def _reinsert(self, item: tuple) -> int:
+        """
+            Place an item taken from the previous table in the first free slot from its home position.
+            Keys are known to be unique, so only the cached hash code is used, no key is hashed or compared.
+            :returns: the position the item was placed at
+            :complexity best: O(1) home position is empty
+            :complexity worst: O(N) where N is the tablesize
+        """
+        tablesize = len(self.table)
+        position = item[2] % tablesize
+        distance_probed_current = 0
+
+        while self.table[position] is not None:
+            distance_probed_current += 1
+            position = (position + 1) % tablesize
+
+        if distance_probed_current > 0:
+            self.conflict += 1
+            self.total_distance_probed += distance_probed_current
+            if distance_probed_current > self.length_longest_probe:
+                self.length_longest_probe = distance_probed_current
+
+        self.table[position] = item
+        return position
+
     def _rehash(self) -> None:
         """
             Need to resize table and reinsert all values
-            Time complexity : Best = Worst = O(len(self.table) + len(self.table) + next() ) where O(next) is O(n^2). 
-            Thus overall complexity is  O(len(self.table) + len(self.table) + O(n^2)) where n is the value of self.tablesize
+            Time complexity : Best = Worst = O(len(self.table) + len(self.table) + log(L)) where L is the
+            length of the growth ladder searched for the new size, see primes.next_growth_prime()
         """
         self.rehashing_count += 1
-        self.count = 0
 
-        # Find the next biggest prime number with the upper bound of twice the value of the current table size 
-        prime_iterator = LargestPrimeIterator(self.tablesize,2)
-        next_1 = next(prime_iterator)
-        new_table_size = next(prime_iterator)
+        # The largest prime below twice the current table size, from the precomputed growth ladder
+        new_table_size = next_growth_prime(self.tablesize)
 
-        new_table = ArrayR(new_table_size)
-        
-        temp = []
-        # Copy all the items from the previous hash table to temp array
-        for item in self.table:
-            if item is not None:
-                temp.append(item)
+        self._resize(new_table_size)
 
-        self.table = new_table
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Move every item into a new array of new_table_size slots
+            :complexity: O(N + M) where N and M are the old and new table sizes
+        """
+        old_table = self.table
+        self._allocate(new_table_size)
         self.tablesize = new_table_size
 
-        # Insert back all the items from the previous hash table to the new hash table after resizing 
-        for data in temp :
-            if data is not None:
-                self[data[0]] = data[1]
+        # Insert back all the items from the previous hash table to the new hash table after resizing,
+        # reusing their cached hash codes
+        for item in old_table:
+            if item is not None:
+                self._reinsert(item)
 
-    def __str__(self) -> str:
+    def freeze(self):
         """
-            Returns all they key/value pairs in our hash table (no particular
-            order).
-            :complexity: O(N) where N is the table size
+            Returns a read-only snapshot of the table, packed at a high load factor for faster
+            lookups and less memory, for tables that are only read once they are loaded
+            :see: #frozen_hash_table.FrozenHashTable
         """
-        result = ""
-        for item in self.table:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
-        return result
+        from frozen_hash_table import FrozenHashTable  # imported here, it builds on this module
+        return FrozenHashTable(self)
@@ -0,0 +1,222 @@
+""" Incremental Hash Table ADT
+
+Defines a Linear Probe Table whose resizes are spread over many operations.
+Instead of reinserting every item inside a single insert, the old array is kept
+alive next to the new one and a bounded number of its slots are migrated on
+every later insert or lookup.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from hash_table import LinearProbeTable
+from primes import next_growth_prime
+from referential_array import ArrayR
+from typing import Callable, TypeVar
+T = TypeVar('T')
+
+
+class IncrementalLinearProbeTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table with amortised (incremental) rehashing.
+
+        attributes:
+            old_table: the array being migrated, None when no migration is in progress
+            old_tablesize: size of the array being migrated
+            migrate_position: index of the next slot of old_table to migrate
+            migrate_step: number of old slots migrated on every insert or lookup
+    """
+
+    MIGRATE_STEP = 8
+
+    # Left in an old slot whose entry has moved, its hash code never matches any key
+    MIGRATED = (None, None, -1)
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, migrate_step: int = MIGRATE_STEP,
+                 hash_function: Callable[[str], int] = None, shrink_threshold: float = 0,
+                 key_type: type = str) -> None:
+        """
+            Initialiser.
+            :param migrate_step: the number of slots of the old array moved per operation,
+                                 it has to be at least 2 so a migration always ends before
+                                 the new array needs to grow again
+            :raises ValueError: when migrate_step is smaller than 2
+        """
+        if migrate_step < 2:
+            raise ValueError("migrate_step should be at least 2.")
+
+        LinearProbeTable.__init__(self, expected_size, tablesize_override, hash_function, shrink_threshold, key_type)
+        self.migrate_step = migrate_step
+        self.old_table = None
+        self.old_tablesize = 0
+        self.migrate_position = 0
+
+    def is_migrating(self) -> bool:
+        """
+            Returns whether a resize is still being migrated
+            :complexity: O(1)
+        """
+        return self.old_table is not None
+
+    def migration_progress(self) -> float:
+        """
+            Returns the fraction of the old array that has been migrated, 1.0 when idle
+            :complexity: O(1)
+        """
+        if self.old_table is None:
+            return 1.0
+        return self.migrate_position / self.old_tablesize
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of conflicts, total distance probed, length of longest probe,
+            number of times the table is rehashed and the migration progress
+            :complexity: O(1)
+        """
+        return LinearProbeTable.statistics(self) + (self.migration_progress(),)
+
+    def probe_lengths(self) -> list[int]:
+        """
+            Scan the table for the probe length of every stored key, finishing any migration
+            in progress first so the keys still in the old array are counted too
+            :see: #LinearProbeTable.probe_lengths()
+        """
+        self._finish_migration()
+        return LinearProbeTable.probe_lengths(self)
+
+    def cluster_sizes(self) -> list[int]:
+        """
+            Scan the table for the size of every cluster, finishing any migration in progress first
+            :see: #LinearProbeTable.cluster_sizes()
+        """
+        self._finish_migration()
+        return LinearProbeTable.cluster_sizes(self)
+
+    def _old_position(self, key: str, code: int) -> int:
+        """
+            Find the position of key in the array being migrated, or -1 if it is not there.
+            The search runs on self.table, so the old array is put in its place while searching.
+            :complexity: same as LinearProbeTable._find() on the old array
+        """
+        new_table = self.table
+        self.table = self.old_table
+        try:
+            return LinearProbeTable._find(self, key, code)
+        finally:
+            self.table = new_table
+
+    def _migrate(self, slots: int) -> None:
+        """
+            Move up to slots entries of the old array into the current array, reusing their hash codes.
+            Moved entries are replaced by MIGRATED, which keeps the probe chains of the old array intact.
+            :complexity: O(slots * probe) where probe is the cost of self._reinsert()
+        """
+        end = min(self.migrate_position + slots, self.old_tablesize)
+        for index in range(self.migrate_position, end):
+            item = self.old_table[index]
+            if item is not None and item is not self.MIGRATED:
+                self._reinsert(item)
+                self.old_table[index] = self.MIGRATED
+        self.migrate_position = end
+
+        if self.migrate_position == self.old_tablesize:
+            self.old_table = None
+            self.old_tablesize = 0
+            self.migrate_position = 0
+
+    def _finish_migration(self) -> None:
+        """
+            Migrate everything that is left in the old array
+            :complexity: O(N) where N is the size of the old array
+        """
+        if self.old_table is not None:
+            self._migrate(self.old_tablesize)
+
+    def _promote(self, key: str, code: int) -> int:
+        """
+            Move key from the old array into the current one ahead of the migration,
+            so every operation only has to deal with the current array.
+            :returns: the new position of key, or -1 when it is not in the old array
+            :complexity: O(self._old_position()) plus O(self._reinsert())
+        """
+        old_position = self._old_position(key, code)
+        if old_position == -1:
+            return -1
+        item = self.old_table[old_position]
+        self.old_table[old_position] = self.MIGRATED
+        return self._reinsert(item)
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key in the current array, or -1 when it is not in the table.
+            A key still in the old array is moved over first.
+            :complexity: O(migrate_step) slots migrated plus the searches of both arrays
+        """
+        if self.old_table is not None:
+            self._migrate(self.migrate_step)
+
+        position = LinearProbeTable._find(self, key, code)
+        if position == -1 and self.old_table is not None:
+            position = self._promote(key, code)
+        return position
+
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
+        """
+            Find the correct position for this key in the current array.
+            A key still in the old array is moved over first, so an insert updates it there.
+            :see: #LinearProbeTable._linear_probe(key: str, is_insert: bool)
+        """
+        if code is None:
+            code = self.hash(key)
+        if self.old_table is not None:
+            self._migrate(self.migrate_step)
+            if self.old_table is not None:
+                self._promote(key, code)
+        return LinearProbeTable._linear_probe(self, key, is_insert, code)
+
+    def _rehash(self) -> None:
+        """
+            Start migrating into a bigger array.
+            A migration still in progress is finished first.
+            Time complexity : O(next_growth_prime()) for the new size plus O(N) if a migration had to be finished
+        """
+        self._finish_migration()
+        self.rehashing_count += 1
+
+        # The largest prime below twice the current table size, from the precomputed growth ladder
+        new_table_size = next_growth_prime(self.tablesize)
+
+        self.old_table = self.table
+        self.old_tablesize = self.tablesize
+        self.migrate_position = 0
+        self.table = ArrayR(new_table_size)
+        self.tablesize = new_table_size
+
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Resize in one go, finishing any migration in progress first
+            :see: #LinearProbeTable._resize(new_table_size: int)
+        """
+        self._finish_migration()
+        LinearProbeTable._resize(self, new_table_size)
+
+    def _entries(self):
+        """
+            Iterate over the stored entries, including the ones that are not migrated yet
+            :complexity: O(N + M) where N and M are the sizes of the two arrays
+        """
+        return iter(self._items())
+
+    def _items(self) -> list[tuple]:
+        """
+            Returns all (key, data, hash code) entries, including the ones that are not migrated yet.
+            :complexity: O(N + M) where N and M are the sizes of the two arrays
+        """
+        res = [item for item in self.table if item is not None]
+        if self.old_table is not None:
+            for index in range(self.migrate_position, self.old_tablesize):
+                item = self.old_table[index]
+                if item is not None and item is not self.MIGRATED:
+                    res.append(item)
+        return res
@@ -0,0 +1,225 @@
+""" LRU Cache
+
+A cache holding at most capacity entries, evicting the least recently used one
+when a new entry needs room. Entries are nodes of a circular doubly linked list
+ordered from most to least recently used, and a hash table maps every key to its
+node, so get, put and evict are all O(1).
+
+The index is a FastLinearProbeTable: its backward-shift deletion leaves no
+tombstones behind, so after any number of evictions it still never holds more
+than capacity keys and never needs to grow. Its keys are strings by default, or
+any key type the tables have a hash for (see hash_functions.key_type_hash).
+
+Usage:
+```
+cache = LRUCache(100)
+cache.put("seed-42", world)
+cache.get("seed-42")
+
+@lru_cache(100)
+def generate(seed: int) -> World:
+    ...
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import functools
+from fast_hash_table import FastLinearProbeTable
+from typing import Callable, TypeVar, Generic
+T = TypeVar('T')
+
+
+class LRUNode(Generic[T]):
+    """
+        Node of the recency list.
+
+        attributes:
+            key: the key of the entry
+            value: the value of the entry
+            previous: the node used more recently, the sentinel for the most recent node
+            next: the node used less recently, the sentinel for the least recent node
+    """
+
+    def __init__(self, key: str = None, value: T = None) -> None:
+        """ Object initializer. """
+        self.key = key
+        self.value = value
+        self.previous = self
+        self.next = self
+
+
+class LRUCache(Generic[T]):
+    """
+        Least Recently Used cache.
+
+        attributes:
+            capacity: the most entries the cache holds
+            index: the node of every key
+            sentinel: the node before the most recent and after the least recent entry
+            hits, misses, evictions: counters of the gets finding their key, the gets
+                                     not finding it and the entries evicted
+    """
+
+    def __init__(self, capacity: int, key_type: type = str) -> None:
+        """
+            Initialiser.
+            :param key_type: the type of the keys, str, int, bytes or tuple
+            :raises ValueError: when capacity is smaller than 1, or there is no hash for key_type
+        """
+        if capacity < 1:
+            raise ValueError("capacity should be at least 1.")
+
+        self.capacity = capacity
+        self.key_type = key_type
+        # twice the capacity, so the index stays at most half full and never rehashes
+        self.index = FastLinearProbeTable(2 * capacity, key_type=key_type)
+        self.sentinel = LRUNode()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """
+            Returns the number of entries in the cache
+            :complexity: O(1)
+        """
+        return len(self.index)
+
+    def __contains__(self, key: str) -> bool:
+        """
+            Checks to see if key is cached, without counting it as a use
+            :complexity: O(K) where K is the size of the key
+        """
+        return key in self.index
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of hits, misses and evictions
+            :complexity: O(1)
+        """
+        return (self.hits, self.misses, self.evictions)
+
+    def _unlink(self, node: LRUNode) -> None:
+        """
+            Take node out of the recency list
+            :complexity: O(1)
+        """
+        node.previous.next = node.next
+        node.next.previous = node.previous
+
+    def _push_front(self, node: LRUNode) -> None:
+        """
+            Put node at the front of the recency list, as the most recently used entry
+            :complexity: O(1)
+        """
+        node.previous = self.sentinel
+        node.next = self.sentinel.next
+        self.sentinel.next.previous = node
+        self.sentinel.next = node
+
+    def get(self, key: str, default: T = None) -> T:
+        """
+            Returns the value of key, making it the most recently used entry, or default on a miss
+            :complexity: O(K) where K is the size of the key
+        """
+        node = self.index.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._unlink(node)
+        self._push_front(node)
+        return node.value
+
+    def put(self, key: str, value: T) -> None:
+        """
+            Cache value under key as the most recently used entry, evicting the least
+            recently used entry when the cache is full
+            :complexity: O(K) where K is the size of the keys
+        """
+        node = self.index.get(key)
+        if node is not None:
+            node.value = value
+            self._unlink(node)
+            self._push_front(node)
+            return
+
+        if len(self.index) == self.capacity:
+            oldest = self.sentinel.previous
+            self._unlink(oldest)
+            del self.index[oldest.key]
+            self.evictions += 1
+
+        node = LRUNode(key, value)
+        self.index[key] = node
+        self._push_front(node)
+
+    def pop(self, key: str, *default: T) -> T:
+        """
+            Remove key from the cache and return its value
+            :param default: returned when key is not cached, if given
+            :raises KeyError: when key is not cached and no default is given
+            :complexity: O(K) where K is the size of the key
+        """
+        node = self.index.pop(key, None)
+        if node is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._unlink(node)
+        return node.value
+
+    def keys(self) -> list[str]:
+        """
+            Returns all keys, from the most to the least recently used
+            :complexity: O(N) where N is the number of entries
+        """
+        res = []
+        node = self.sentinel.next
+        while node is not self.sentinel:
+            res.append(node.key)
+            node = node.next
+        return res
+
+    def clear(self) -> None:
+        """
+            Remove every entry, the counters are kept
+            :complexity: O(C) where C is the capacity, for the new index
+        """
+        self.index = FastLinearProbeTable(2 * self.capacity, key_type=self.key_type)
+        self.sentinel = LRUNode()
+
+
+def lru_cache(capacity: int) -> Callable[[Callable], Callable]:
+    """
+        Decorator memoising a pure function in an LRUCache of capacity entries.
+        A call is keyed by the tuple of its arguments, followed by its keyword arguments
+        in name order, so the arguments have to be hashable. The cache is available as the
+        cache attribute of the decorated function, every function decorated gets its own.
+        :raises ValueError: when capacity is smaller than 1
+    """
+    if capacity < 1:
+        raise ValueError("capacity should be at least 1.")
+    missing = object()
+    # separates the positional from the keyword arguments in a key
+    keywords = object()
+
+    def decorator(function: Callable) -> Callable:
+        cache = LRUCache(capacity, tuple)
+
+        @functools.wraps(function)
+        def memoised(*args, **kwargs):
+            key = args + (keywords,) + tuple(sorted(kwargs.items())) if kwargs else args
+            result = cache.get(key, missing)
+            if result is missing:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        memoised.cache = cache
+        return memoised
+    return decorator
@@ -0,0 +1,329 @@
+""" Memory-Mapped Hash Table
+
+A read-only Hash Table using Linear Probing stored in a file and read through mmap,
+so reference data such as the city files is hashed once by a builder instead of
+on every process start. Opening a table only reads its header, and a lookup only
+pages in the slots it probes and the bytes of the keys it compares.
+
+File layout, every region starting on an 8-byte boundary:
+    header          HEADER: MAGIC, key type, byte order of the slot arrays,
+                    tablesize, count and the offset of the arena
+    slot arrays     four arrays of tablesize native integers:
+                    hash codes ('q', EMPTY for a free slot), key offsets in the arena ('q'),
+                    key lengths ('i') and value lengths ('i')
+    string arena    every key followed by its value: the key encoded as in KEY_TYPES,
+                    the value as a tag byte and its encoding: b's' for a str,
+                    b'b' for bytes, b'p' for any other value, pickled
+
+Keys are str, bytes or int and are hashed with the hash of their type from
+hash_functions, the same codes as a LinearProbeTable with that key_type, so a
+lookup behaves exactly as in the table the file was built from. Pickled values are
+loaded with pickle, so only open table files from a trusted source.
+
+Usage:
+```
+build_from_key_file("us_cities.txt", "us_cities.table")
+with MmapHashTable("us_cities.table") as cities:
+    cities["Springfield"]
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from array import array
+from hash_functions import key_type_hash
+from hash_table import LinearProbeTable
+from primes import prime_at_least
+from table_views import TableViewsMixin
+import mmap
+import operator
+import os
+import pickle
+import struct
+import sys
+from typing import TypeVar, Generic
+T = TypeVar('T')
+
+MAGIC = b"LPTABLE1"
+# magic, key type, byte order, padding, tablesize, count, arena offset
+HEADER = struct.Struct('<8scc6xQQQ')
+# Hash codes are never negative, so -1 marks a free slot
+EMPTY = -1
+
+# The one byte code of every key type and how its keys are turned into bytes and back
+KEY_TYPES = {
+    str: (b's', lambda key: key.encode(), lambda data: data.decode()),
+    bytes: (b'b', bytes, bytes),
+    # an int-like key (True, a NumPy integer, ...) is stored and looked up as the int it equals
+    int: (b'i', lambda key: str(operator.index(key)).encode(), int),
+}
+
+
+def _encode_value(data) -> bytes:
+    """
+        The tag byte and encoding of a value
+        :complexity: O(size of data)
+    """
+    if type(data) is str:
+        return b's' + data.encode()
+    if type(data) is bytes:
+        return b'b' + data
+    return b'p' + pickle.dumps(data)
+
+
+def _decode_value(data: bytes):
+    """
+        The value encoded by _encode_value()
+        :raises ValueError: when the tag is unknown
+        :complexity: O(len(data))
+    """
+    tag, payload = data[:1], data[1:]
+    if tag == b's':
+        return payload.decode()
+    if tag == b'b':
+        return payload
+    if tag == b'p':
+        return pickle.loads(payload)
+    raise ValueError("Unknown value tag " + repr(tag))
+
+
+def _align(offset: int) -> int:
+    """ The first multiple of 8 from offset on """
+    return (offset + 7) // 8 * 8
+
+
+def write_mmap_table(path: str, items, key_type: type = str) -> None:
+    """
+        Write (key, data, hash code) entries to a table file at path. The file is written next
+        to path and moved over it once complete, so an open reader never sees half a table.
+        :param items: (key, data, hash code) entries with distinct keys, the codes given by key_type_hash(key_type)
+        :raises ValueError: when key_type can't be stored
+        :complexity: O(N + S) expected where N is the number of entries and S their encoded size
+    """
+    if key_type not in KEY_TYPES:
+        raise ValueError("Keys of type " + key_type.__name__ + " can't be stored.")
+    type_code, encode_key, _ = KEY_TYPES[key_type]
+
+    items = list(items)
+    tablesize = prime_at_least(2 * len(items) + 1)
+    codes = array('q', [EMPTY]) * tablesize
+    key_offsets = array('q', [0]) * tablesize
+    key_lengths = array('i', [0]) * tablesize
+    value_lengths = array('i', [0]) * tablesize
+    arena = bytearray()
+
+    for key, data, code in items:
+        position = code % tablesize
+        while codes[position] != EMPTY:
+            position = (position + 1) % tablesize
+        encoded_key = encode_key(key)
+        encoded_value = _encode_value(data)
+        codes[position] = code
+        key_offsets[position] = len(arena)
+        key_lengths[position] = len(encoded_key)
+        value_lengths[position] = len(encoded_value)
+        arena += encoded_key
+        arena += encoded_value
+
+    arena_offset = _align(HEADER.size) + 24 * tablesize
+    byte_order = b'<' if sys.byteorder == 'little' else b'>'
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as table_file:
+        table_file.write(HEADER.pack(MAGIC, type_code, byte_order, tablesize, len(items), arena_offset))
+        table_file.write(bytes(_align(HEADER.size) - HEADER.size))
+        for region in (codes, key_offsets, key_lengths, value_lengths):
+            table_file.write(region.tobytes())
+        table_file.write(arena)
+    os.replace(temporary, path)
+
+
+def build_from_table(table, path: str, key_type: type = None) -> None:
+    """
+        Write the entries of a hash table to a table file at path, reusing their cached hash
+        codes when the table hashes like the file does
+        :param table: any hash table whose _entries() yield (key, data, hash code, ...)
+        :param key_type: the type of the keys, the key_type of table (str when it has none) when not given
+        :see: #write_mmap_table(path: str, items, key_type: type)
+    """
+    if key_type is None:
+        key_type = getattr(table, 'key_type', str)
+    hash_function = key_type_hash(key_type)
+    entries = list(table._entries())
+    # the default hash of LinearProbeTable is the hash of str keys
+    reusable = (hash_function, LinearProbeTable.hash) if key_type is str else (hash_function,)
+    if getattr(table.hash, '__func__', table.hash) in reusable:
+        items = [(item[0], item[1], item[2]) for item in entries]
+    else:
+        items = [(item[0], item[1], hash_function(item[0])) for item in entries]
+    write_mmap_table(path, items, key_type)
+
+
+def build_from_key_file(key_file: str, path: str) -> None:
+    """
+        Write the lines of a text file, one key per line, to a table file at path, every key
+        being its own data like the city tables of analysis.py. A repeated key is stored once.
+        :see: #write_mmap_table(path: str, items, key_type: type)
+    """
+    hash_function = key_type_hash(str)
+    with open(key_file, "r") as lines:
+        keys = dict.fromkeys(line.strip() for line in lines)
+    write_mmap_table(path, [(key, key, hash_function(key)) for key in keys])
+
+
+class MmapHashTable(TableViewsMixin, Generic[T]):
+    """
+        Read-only Linear Probe Table in a file written by write_mmap_table().
+
+        attributes:
+            count: number of elements in the hash table
+            tablesize: size of the hash table
+            key_type: the type of the keys
+            hash: the hash function of key_type
+            mapping: the mapped file
+            arena_offset: the offset in the file of the string arena
+            codes, key_offsets, key_lengths, value_lengths: the slot arrays, views of the mapped file
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+            Open the table file at path, reading nothing but its header
+            :raises ValueError: when the file is not a table file, or was written on a machine of the other byte order
+            :complexity: O(1)
+        """
+        with open(path, "rb") as table_file:
+            self.mapping = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, type_code, byte_order, self.tablesize, self.count, self.arena_offset = \
+                HEADER.unpack_from(self.mapping)
+        except struct.error as error:
+            self.mapping.close()
+            raise ValueError(path + " is not a table file.") from error
+        key_types = {code: key_type for key_type, (code, _, _) in KEY_TYPES.items()}
+        if magic != MAGIC or type_code not in key_types:
+            self.mapping.close()
+            raise ValueError(path + " is not a table file.")
+        if byte_order != (b'<' if sys.byteorder == 'little' else b'>'):
+            self.mapping.close()
+            raise ValueError(path + " was written with the other byte order.")
+
+        self.key_type = key_types[type_code]
+        _, self._encode_key, self._decode_key = KEY_TYPES[self.key_type]
+        self.hash = key_type_hash(self.key_type)
+
+        tablesize = self.tablesize
+        view = memoryview(self.mapping)
+        start = _align(HEADER.size)
+        self.codes = view[start:start + 8 * tablesize].cast('q')
+        self.key_offsets = view[start + 8 * tablesize:start + 16 * tablesize].cast('q')
+        self.key_lengths = view[start + 16 * tablesize:start + 20 * tablesize].cast('i')
+        self.value_lengths = view[start + 20 * tablesize:start + 24 * tablesize].cast('i')
+        view.release()
+
+    def close(self) -> None:
+        """
+            Unmap the file, the table can't be read afterwards
+            :complexity: O(1)
+        """
+        for region in (self.codes, self.key_offsets, self.key_lengths, self.value_lengths):
+            region.release()
+        self.mapping.close()
+
+    def __enter__(self) -> MmapHashTable:
+        """ Use the table in a with statement, closing it at the end """
+        return self
+
+    def __exit__(self, *exception) -> None:
+        """ Close the table at the end of a with statement """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+            Returns number of elements in the hash table
+            :complexity: O(1)
+        """
+        return self.count
+
+    def is_empty(self) -> bool:
+        """
+            Returns whether the hash table is empty
+            :complexity: O(1)
+        """
+        return self.count == 0
+
+    def _find(self, key, code: int) -> int:
+        """
+            Find the position of key, comparing the stored key bytes only for matching hash codes
+            :returns: the position of key, or -1 when it is not in the table
+            :complexity best: O(K) first position is empty or holds key
+                            where K is the size of the key
+            :complexity worst: O(K + N) when we've searched the entire table
+                            where N is the tablesize
+        """
+        codes = self.codes
+        tablesize = self.tablesize
+        position = code % tablesize
+        encoded = None
+
+        for _ in range(tablesize):
+            slot_code = codes[position]
+            if slot_code == EMPTY:  # so the key is not in
+                return -1
+            elif slot_code == code:
+                if encoded is None:
+                    encoded = self._encode_key(key)
+                start = self.arena_offset + self.key_offsets[position]
+                if self.key_lengths[position] == len(encoded) and self.mapping[start:start + len(encoded)] == encoded:
+                    return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def _value_at(self, position: int) -> T:
+        """
+            Returns the data stored in the slot at position, decoded from the arena
+            :complexity: O(size of the data)
+        """
+        start = self.arena_offset + self.key_offsets[position] + self.key_lengths[position]
+        return _decode_value(self.mapping[start:start + self.value_lengths[position]])
+
+    def __contains__(self, key) -> bool:
+        """
+            Checks to see if the given key is in the Hash Table
+            :see: #self._find(key, code: int)
+        """
+        return self._find(key, self.hash(key)) != -1
+
+    def __getitem__(self, key) -> T:
+        """
+            Get the item at a certain key
+            :see: #self._find(key, code: int)
+            :raises KeyError: when the item doesn't exist
+        """
+        position = self._find(key, self.hash(key))
+        if position == -1:
+            raise KeyError(key)
+        return self._value_at(position)
+
+    def get(self, key, default: T = None) -> T:
+        """
+            Returns the data of key, or default when key is not in the table
+            :see: #self._find(key, code: int)
+        """
+        position = self._find(key, self.hash(key))
+        if position == -1:
+            return default
+        return self._value_at(position)
+
+    def _entries(self):
+        """
+            Iterate over the stored (key, data, hash code) entries, decoding them from the arena
+            :complexity: O(N + S) where N is the table size and S the size of the arena
+        """
+        codes = self.codes
+        for position in range(self.tablesize):
+            if codes[position] != EMPTY:
+                start = self.arena_offset + self.key_offsets[position]
+                key = self._decode_key(self.mapping[start:start + self.key_lengths[position]])
+                yield (key, self._value_at(position), codes[position])
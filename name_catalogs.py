@@ -0,0 +1,68 @@
+""" Name Catalogs
+
+Perfect hashes (see perfect_hash) of the fixed name lists the game picks random
+names from. They are read from NAME_CATALOGS_FILE the first time they are needed;
+when the file is missing, or was made from different lists, they are built and
+written there again for the next run.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import json
+import os
+from cave import CAVE_NAMES
+from food import FOOD_NAMES
+from material import RANDOM_MATERIAL_NAMES
+from perfect_hash import PerfectHash
+from player import PLAYER_NAMES
+from trader import TRADER_NAMES
+
+NAME_CATALOGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "name_catalogs.json")
+
+CATALOGS = {
+    "cave": CAVE_NAMES,
+    "food": FOOD_NAMES,
+    "material": RANDOM_MATERIAL_NAMES,
+    "player": PLAYER_NAMES,
+    "trader": TRADER_NAMES,
+}
+
+# catalog name -> PerfectHash, once loaded
+_indexes = None
+
+
+def _load() -> dict:
+    """
+        Read every catalog from NAME_CATALOGS_FILE, building (and saving) them when the file is missing or stale
+        :complexity: O(N) to read them, O(N) expected to build them, where N is the total number of names
+    """
+    try:
+        with open(NAME_CATALOGS_FILE, "r") as catalogs_file:
+            serialised = json.load(catalogs_file)
+        indexes = {catalog: PerfectHash.loads(serialised[catalog]) for catalog in CATALOGS}
+        if all(indexes[catalog].keys == names for catalog, names in CATALOGS.items()):
+            return indexes
+    except (OSError, ValueError, KeyError):
+        pass
+
+    indexes = {catalog: PerfectHash(names) for catalog, names in CATALOGS.items()}
+    try:
+        with open(NAME_CATALOGS_FILE, "w") as catalogs_file:
+            json.dump({catalog: index.dumps() for catalog, index in indexes.items()}, catalogs_file, indent=1)
+    except OSError:  # read-only install, keep them in memory only
+        pass
+    return indexes
+
+
+def name_index(catalog: str) -> PerfectHash:
+    """
+        The perfect hash of a catalog: the position of any of its names, -1 for any other name
+        :raises KeyError: when there is no catalog of that name
+        :complexity: O(1) once loaded, see _load()
+    """
+    global _indexes
+    if _indexes is None:
+        _indexes = _load()
+    return _indexes[catalog]
@@ -0,0 +1,210 @@
+""" Parallel Array Hash Table ADT
+
+Defines a Hash Table using Linear Probing that stores its slots as three
+parallel arrays (keys, values and hash codes) instead of one array of tuples.
+No tuple is allocated per entry, updates only write the value array and probes
+scan a typed array of hash codes before touching any key.
+
+The key and value arrays are plain lists rather than ArrayR: ctypes keeps every
+object stored in a py_object array alive through an extra dictionary entry per
+slot, which costs more than the tuples this layout is meant to save.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from array import array
+from hash_table import LinearProbeTable
+from typing import TypeVar
+T = TypeVar('T')
+
+
+class ParallelLinearProbeTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table with struct-of-arrays slot storage.
+
+        attributes:
+            keys_array: the key stored in every slot
+            values_array: the data stored in every slot
+            hashes: the hash code stored in every slot, EMPTY for a free slot
+    """
+
+    # Hash codes are never negative, so -1 marks a free slot
+    EMPTY = -1
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate the three parallel arrays for tablesize slots
+            :complexity: O(tablesize)
+        """
+        self.keys_array = [None] * tablesize
+        self.values_array = [None] * tablesize
+        self.hashes = array('q', [self.EMPTY]) * tablesize
+
+    def is_full(self) -> bool:
+        """
+            Returns whether the hash table is full
+            :complexity: O(1)
+        """
+        return self.count == self.tablesize
+
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
+        """
+            Find the correct position for this key in the hash table using linear probing.
+            Only slots whose hash code matches have their key compared.
+            :complexity best: O(K) first position is empty
+                            where K is the size of the key
+            :complexity worst: O(K + N) when we've searched the entire table
+                            where N is the tablesize
+            :raises KeyError: When a position can't be found
+        """
+        if code is None:
+            code = self.hash(key)
+        hashes = self.hashes
+        tablesize = self.tablesize
+        position = code % tablesize
+
+        conflict_counted = False
+        distance_probed_current = 0
+
+        if is_insert and self.is_full():
+            raise KeyError(key)
+
+        for _ in range(tablesize):
+            slot_code = hashes[position]
+            if slot_code == self.EMPTY:  # found empty slot
+                if is_insert:
+                    return position
+                else:
+                    raise KeyError(key)  # so the key is not in
+            elif slot_code == code and self.keys_array[position] == key:  # found key
+                return position
+            else:  # there is something but not the key, try next
+                if is_insert:
+                    if not conflict_counted:
+                        self.conflict += 1
+                        conflict_counted = True
+
+                    self.total_distance_probed += 1
+                    distance_probed_current += 1
+
+                    # Find the longest distance probed
+                    if distance_probed_current > self.length_longest_probe:
+                        self.length_longest_probe = distance_probed_current
+
+                position = (position + 1) % tablesize
+
+        raise KeyError(key)
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key by scanning the hash codes, or -1 when it is not in the table
+            :see: #LinearProbeTable._find(key: str, code: int)
+        """
+        hashes = self.hashes
+        tablesize = self.tablesize
+        position = code % tablesize
+
+        for _ in range(tablesize):
+            slot_code = hashes[position]
+            if slot_code == self.EMPTY:
+                return -1
+            elif slot_code == code and self.keys_array[position] == key:
+                return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def _is_free(self, position: int) -> bool:
+        """
+            Returns whether the slot at position is empty
+            :complexity: O(1)
+        """
+        return self.hashes[position] == self.EMPTY
+
+    def _code_at(self, position: int) -> int:
+        """
+            Returns the hash code of the occupied slot at position
+            :complexity: O(1)
+        """
+        return self.hashes[position]
+
+    def _value_at(self, position: int) -> T:
+        """
+            Returns the data stored in the slot at position
+            :complexity: O(1)
+        """
+        return self.values_array[position]
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) in the slot at position, an update only writes the value array
+            :complexity: O(1)
+        """
+        if self.hashes[position] == self.EMPTY:
+            self.count += 1
+            self.keys_array[position] = key
+            self.hashes[position] = code
+
+        self.values_array[position] = data
+
+    def _remove_at(self, position: int) -> None:
+        """
+            Empty the slot at position using backward-shift deletion
+            :see: #LinearProbeTable._remove_at(position: int)
+        """
+        hashes, keys_array, values_array = self.hashes, self.keys_array, self.values_array
+        tablesize = self.tablesize
+        hashes[position] = self.EMPTY
+        keys_array[position] = values_array[position] = None
+        self.count -= 1
+
+        hole = position
+        position = (position + 1) % tablesize
+        while hashes[position] != self.EMPTY:
+            code = hashes[position]
+            # the entry may move into the hole if the hole is between its home and where it is
+            if (position - code % tablesize) % tablesize >= (position - hole) % tablesize:
+                hashes[hole], keys_array[hole], values_array[hole] = code, keys_array[position], values_array[position]
+                hashes[position] = self.EMPTY
+                keys_array[position] = values_array[position] = None
+                hole = position
+            position = (position + 1) % tablesize
+
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Resize the parallel arrays and move every entry by its cached hash code
+            :see: #LinearProbeTable._resize(new_table_size: int)
+        """
+        old_keys, old_values, old_hashes = self.keys_array, self.values_array, self.hashes
+        self._allocate(new_table_size)
+        self.tablesize = new_table_size
+
+        for old_position in range(len(old_hashes)):
+            code = old_hashes[old_position]
+            if code != self.EMPTY:
+                position = code % new_table_size
+                distance_probed_current = 0
+                while self.hashes[position] != self.EMPTY:
+                    distance_probed_current += 1
+                    position = (position + 1) % new_table_size
+
+                if distance_probed_current > 0:
+                    self.conflict += 1
+                    self.total_distance_probed += distance_probed_current
+                    if distance_probed_current > self.length_longest_probe:
+                        self.length_longest_probe = distance_probed_current
+
+                self.keys_array[position] = old_keys[old_position]
+                self.values_array[position] = old_values[old_position]
+                self.hashes[position] = code
+
+    def _entries(self):
+        """
+            Iterate over the stored entries as (key, data, hash code) tuples
+            :complexity: O(N) where N is the table size
+        """
+        for x in range(self.tablesize):
+            if self.hashes[x] != self.EMPTY:
+                yield (self.keys_array[x], self.values_array[x], self.hashes[x])
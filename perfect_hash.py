@@ -0,0 +1,183 @@
+""" Minimal Perfect Hash
+
+Builds a minimal perfect hash function for a fixed set of keys with the CHD
+(compress, hash and displace) algorithm: every key gets a distinct slot in
+0..n-1, so an exact lookup is one hash, one displacement and one key comparison.
+
+The keys are split into buckets of about BUCKET_LOAD keys by their hash. Buckets are
+placed biggest first: each one tries displacements d = 0, 1, 2, ... until
+(f1 + d0 * f2 + d1) % n, where (d0, d1) = divmod(d, n), sends all its keys to free
+slots, and only d is stored per bucket. A seed whose hashes can't be placed is
+replaced by the next one, so the same keys always give the same function.
+
+A PerfectHash is read-only once built. dumps() / loads() turn it into a JSON string
+and back without searching the displacements again.
+
+Usage:
+```
+names = PerfectHash(CAVE_NAMES)
+names.index("Bleakcoast Cave")   # position of the name in CAVE_NAMES
+"Nowhere" in names               # False
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import json
+from array import array
+from hash_functions import FNV_OFFSET_BASIS, FNV_PRIME, MASK_64, mix64
+
+# Average number of keys per bucket, larger values give a smaller table but a slower build
+BUCKET_LOAD = 4
+# Number of seeds tried before giving up
+MAX_SEEDS = 100
+
+
+def seeded_hash(key: str, seed: int) -> int:
+    """
+        64-bit FNV-1a over the UTF-8 bytes of key, started from a seed dependent basis
+        and finished with the MurmurHash3 mixer so every bit depends on every byte
+        :complexity: O(len(key))
+    """
+    value = (FNV_OFFSET_BASIS ^ (seed * 0x9e3779b97f4a7c15)) & MASK_64
+    for byte in key.encode():
+        value = ((value ^ byte) * FNV_PRIME) & MASK_64
+    return mix64(value)
+
+
+class PerfectHash:
+    """
+        Read-only minimal perfect hash over a fixed list of distinct string keys.
+
+        attributes:
+            keys: the keys, in the order they were given
+            seed: the seed of seeded_hash the function was built with
+            displacements: the displacement d of every bucket
+            slots: the index in keys of the key placed in every slot
+    """
+
+    def __init__(self, keys: list[str], seed: int = None, displacements: list[int] = None,
+                 slots: list[int] = None) -> None:
+        """
+            Build the perfect hash of keys, or wrap an already built one when seed,
+            displacements and slots are given (see loads())
+            :raises ValueError: when keys holds a duplicate, or no seed in MAX_SEEDS works
+            :complexity: O(N) expected for the build, where N is the number of keys
+        """
+        self.keys = list(keys)
+        if seed is not None:
+            self.seed = seed
+            self.displacements = array('L', displacements)
+            self.slots = array('L', slots)
+            return
+
+        if len(set(self.keys)) != len(self.keys):
+            raise ValueError("Keys of a perfect hash must be distinct.")
+        for seed in range(MAX_SEEDS):
+            if self._build(seed):
+                return
+        raise ValueError("No perfect hash found in " + str(MAX_SEEDS) + " seeds.")
+
+    def _split(self, code: int) -> tuple:
+        """
+            The bucket and the two slot hashes f1 and f2 of a hash code, from disjoint bits of it
+            :complexity: O(1)
+        """
+        size = len(self.keys)
+        return code % len(self.displacements), (code >> 22) % size, (code >> 43) % size
+
+    def _build(self, seed: int) -> bool:
+        """
+            Search a displacement for every bucket with the hashes of seed
+            :returns: whether every key found a slot
+            :complexity: O(N) expected, where N is the number of keys
+        """
+        size = len(self.keys)
+        self.seed = seed
+        self.displacements = array('L', [0]) * max(1, (size + BUCKET_LOAD - 1) // BUCKET_LOAD)
+        self.slots = array('L', [0]) * size
+
+        buckets = [[] for _ in range(len(self.displacements))]
+        for index in range(size):
+            bucket, f1, f2 = self._split(seeded_hash(self.keys[index], seed))
+            buckets[bucket].append((index, f1, f2))
+
+        taken = bytearray(size)
+        for bucket in sorted(range(len(buckets)), key=lambda number: -len(buckets[number])):
+            members = buckets[bucket]
+            if len(members) == 0:
+                break
+            for displacement in range(size * size):
+                d0, d1 = divmod(displacement, size)
+                positions = [(f1 + d0 * f2 + d1) % size for _, f1, f2 in members]
+                if len(set(positions)) == len(positions) and not any(taken[position] for position in positions):
+                    break
+            else:  # this bucket fits nowhere with these hashes
+                return False
+
+            self.displacements[bucket] = displacement
+            for position, (index, _, _) in zip(positions, members):
+                taken[position] = 1
+                self.slots[position] = index
+        return True
+
+    def index(self, key: str) -> int:
+        """
+            Returns the position of key in keys, or -1 when key is not one of them
+            :complexity: O(len(key))
+        """
+        size = len(self.keys)
+        if size == 0:
+            return -1
+        bucket, f1, f2 = self._split(seeded_hash(key, self.seed))
+        d0, d1 = divmod(self.displacements[bucket], size)
+        index = self.slots[(f1 + d0 * f2 + d1) % size]
+        return index if self.keys[index] == key else -1
+
+    def __contains__(self, key: str) -> bool:
+        """
+            Checks to see if key is one of the keys
+            :see: #self.index(key: str)
+        """
+        return self.index(key) != -1
+
+    def __getitem__(self, key: str) -> int:
+        """
+            Returns the position of key in keys
+            :raises KeyError: when key is not one of the keys
+            :see: #self.index(key: str)
+        """
+        index = self.index(key)
+        if index == -1:
+            raise KeyError(key)
+        return index
+
+    def __len__(self) -> int:
+        """
+            Returns the number of keys
+            :complexity: O(1)
+        """
+        return len(self.keys)
+
+    def dumps(self) -> str:
+        """
+            Serialise the perfect hash to a JSON string
+            :complexity: O(N) where N is the number of keys
+        """
+        return json.dumps({"keys": self.keys, "seed": self.seed,
+                           "displacements": self.displacements.tolist(), "slots": self.slots.tolist()})
+
+    @classmethod
+    def loads(cls, text: str) -> PerfectHash:
+        """
+            Rebuild a perfect hash from a string made by dumps(), without searching displacements again
+            :raises ValueError: when text is not a serialised perfect hash
+            :complexity: O(N) where N is the number of keys
+        """
+        try:
+            data = json.loads(text)
+            return cls(data["keys"], data["seed"], data["displacements"], data["slots"])
+        except (KeyError, TypeError) as error:
+            raise ValueError("Not a serialised perfect hash.") from error
@@ -1,12 +1,284 @@
 """
 An iterator of the largest prime number to find the next greatest prime under a bound.
+
+The primes come from a segmented sieve of Eratosthenes: the numbers are split into
+segments of SEGMENT_SIZE, each sieved into a bytearray (1 for a prime, 0 otherwise)
+the first time it is needed. Sieved segments are kept in a module-level cache shared by
+every iterator, so the repeated lookups of successive resizes reuse earlier work. The
+cache holds at most MAX_CACHED_SEGMENTS segments, evicting the least recently used one.
+
+Table sizing goes through is_prime(), next_prime() and prev_prime(): numbers of the
+first segment are looked up in the sieve, bigger ones are tested with Miller-Rabin
+over a fixed set of bases, which is deterministic for every 64-bit integer.
+prev_prime() of a bound up to SIEVE_LIMIT, the span the cache can hold (which covers
+the analysis table sizes walked by LargestPrimeIterator), scans the sieve instead.
+
+Table growth uses a precomputed ladder of primes up to 2^40 shipped in
+growth_primes.txt and loaded on first use, so a resize only binary searches it.
 """
 
 from __future__ import annotations
 
-__author__ = 'Shyam Kamalesh Borkar'
+__author__ = 'Shyam Kamalesh Borkar, Tan Jun Yu'
 __docformat__ = 'reStructuredText'
 
+import bisect
+import os
+from collections import OrderedDict
+
+# How many consecutive numbers one sieved segment covers
+SEGMENT_SIZE = 1 << 16
+# Most segments kept in the cache at once (4 MiB with the default segment size)
+MAX_CACHED_SEGMENTS = 64
+# Largest bound prev_prime() looks up in the sieve rather than with Miller-Rabin
+SIEVE_LIMIT = MAX_CACHED_SEGMENTS * SEGMENT_SIZE
+
+# File holding the growth ladder, one prime per line, next to this module
+GROWTH_LADDER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "growth_primes.txt")
+# Largest size covered by the growth ladder
+GROWTH_LADDER_LIMIT = 2 ** 40
+# Table sizes used by analysis.py, always on the ladder
+ANALYSIS_TABLE_SIZES = (20021, 402221, 1000081)
+
+# segment index -> bytearray whose byte i is 1 when index * SEGMENT_SIZE + i is prime
+_segments = OrderedDict()
+# Every prime up to _base_limit, used to cross out the composites of a segment
+_base_primes = []
+_base_limit = 1
+# The growth ladder once loaded, see growth_ladder()
+_growth_ladder = None
+
+
+def _primes_up_to(limit: int) -> list[int]:
+    """
+        Plain sieve of Eratosthenes over a bytearray.
+        :returns: every prime less than or equal to limit
+        :complexity: O(limit log log limit)
+    """
+    if limit < 2:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    candidate = 2
+    while candidate * candidate <= limit:
+        if sieve[candidate]:
+            start = candidate * candidate
+            sieve[start::candidate] = bytes((limit - start) // candidate + 1)
+        candidate += 1
+    return [number for number in range(2, limit + 1) if sieve[number]]
+
+
+def _base_primes_up_to(limit: int) -> list[int]:
+    """
+        Every prime up to at least limit, extending the cached list (to twice the limit) when it is too short
+        :complexity: O(1) when cached, O(limit log log limit) otherwise
+    """
+    global _base_primes, _base_limit
+    if limit > _base_limit:
+        _base_limit = 2 * limit
+        _base_primes = _primes_up_to(_base_limit)
+    return _base_primes
+
+
+def _sieve_segment(index: int) -> bytearray:
+    """
+        Sieve the numbers from index * SEGMENT_SIZE (included) to (index + 1) * SEGMENT_SIZE (excluded)
+        :complexity: O(S log log H) where S is SEGMENT_SIZE and H the highest number of the segment
+    """
+    low = index * SEGMENT_SIZE
+    high = low + SEGMENT_SIZE
+    segment = bytearray([1]) * SEGMENT_SIZE
+    for number in range(low, min(2, high)):  # 0 and 1 are not primes
+        segment[number - low] = 0
+
+    for prime in _base_primes_up_to(int((high - 1) ** 0.5) + 1):
+        if prime * prime >= high:
+            break
+        # first multiple of prime in the segment, smaller multiples were crossed out by smaller primes
+        start = max(prime * prime, (low + prime - 1) // prime * prime) - low
+        segment[start::prime] = bytes((SEGMENT_SIZE - 1 - start) // prime + 1)
+    return segment
+
+
+def prime_segment(index: int) -> bytearray:
+    """
+        The sieved segment number index, from the cache when it was already sieved.
+        The least recently used segment is evicted once the cache holds MAX_CACHED_SEGMENTS.
+        :complexity: O(1) when cached, see _sieve_segment() otherwise
+    """
+    segment = _segments.get(index)
+    if segment is not None:
+        _segments.move_to_end(index)
+        return segment
+
+    segment = _sieve_segment(index)
+    _segments[index] = segment
+    while len(_segments) > MAX_CACHED_SEGMENTS:
+        _segments.popitem(last=False)
+    return segment
+
+
+def largest_prime_below(bound: int) -> int:
+    """
+        Scan the sieve downwards from bound for the largest prime strictly smaller than it
+        :raises ValueError: when bound is 2 or less, there is no prime under it
+        :complexity: O(S log log B) per segment sieved, where S is SEGMENT_SIZE and B the bound,
+                     one segment is almost always enough since the gaps between primes are tiny
+    """
+    if bound <= 2:
+        raise ValueError("There is no prime under " + str(bound) + ".")
+
+    index, offset = divmod(bound - 1, SEGMENT_SIZE)
+    while True:
+        position = prime_segment(index).rfind(1, 0, offset + 1)
+        if position != -1:
+            return index * SEGMENT_SIZE + position
+        index -= 1
+        offset = SEGMENT_SIZE - 1
+
+
+def clear_prime_cache() -> None:
+    """
+        Forget every sieved segment and base prime
+        :complexity: O(1)
+    """
+    global _base_primes, _base_limit
+    _segments.clear()
+    _base_primes = []
+    _base_limit = 1
+
+
+# Miller-Rabin with these bases gives the right answer for every number below 3.18 * 10^23
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(number: int) -> bool:
+    """
+        Deterministic primality test for any 64-bit integer (and far beyond, see MILLER_RABIN_BASES)
+        :complexity: O(1) for numbers under SEGMENT_SIZE once the first segment is sieved,
+                     O(log(number)^3) otherwise
+    """
+    if number < SEGMENT_SIZE:
+        return number >= 2 and prime_segment(0)[number] == 1
+
+    for prime in MILLER_RABIN_BASES:
+        if number % prime == 0:
+            return False
+
+    # number - 1 = d * 2^s with d odd
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:  # base is a witness that number is composite
+            return False
+    return True
+
+
+def next_prime(number: int) -> int:
+    """
+        Returns the smallest prime strictly greater than number
+        :complexity: O(G * is_prime()) where G is the gap to the next prime, O(log(number)) on average
+    """
+    if number < 2:
+        return 2
+    candidate = number + 1 if number % 2 == 0 else number + 2
+    while not is_prime(candidate):
+        candidate += 2
+    return candidate
+
+
+def prev_prime(number: int) -> int:
+    """
+        Returns the largest prime strictly smaller than number, from the sieve up to SIEVE_LIMIT
+        :raises ValueError: when number is 2 or less, there is no prime under it
+        :complexity: O(G * is_prime()) where G is the gap to the previous prime, O(log(number)) on average,
+                     see largest_prime_below() up to SIEVE_LIMIT
+    """
+    if number <= 2:
+        raise ValueError("There is no prime under " + str(number) + ".")
+    if number <= SIEVE_LIMIT:
+        return largest_prime_below(number)
+    candidate = number - 1 if number % 2 == 0 else number - 2
+    while not is_prime(candidate):
+        candidate -= 2
+    return candidate
+
+
+def prime_at_least(number: int) -> int:
+    """
+        Returns number if it is prime, the next prime after it otherwise
+        :see: #next_prime(number: int)
+    """
+    return number if is_prime(number) else next_prime(number)
+
+
+def build_growth_ladder() -> list[int]:
+    """
+        Compute the growth ladder: the doubling sequence of "largest prime below twice the
+        last one" from 2, the analysis table sizes, and primes spaced by a factor of 2^(1/16)
+        in between, so that a prime close to twice any size is always on it
+        :complexity: O(L * is_prime()) where L is the length of the ladder, about 700 primes
+    """
+    ladder = set(ANALYSIS_TABLE_SIZES)
+    prime = 2
+    while prime <= GROWTH_LADDER_LIMIT:
+        ladder.add(prime)
+        prime = prev_prime(2 * prime)
+
+    step = 0
+    while 2 ** (step / 16) <= GROWTH_LADDER_LIMIT:
+        ladder.add(prime_at_least(int(2 ** (step / 16))))
+        step += 1
+    return sorted(prime for prime in ladder if prime <= GROWTH_LADDER_LIMIT)
+
+
+def growth_ladder() -> list[int]:
+    """
+        The growth ladder, read from GROWTH_LADDER_FILE the first time it is needed.
+        When the file is missing it is computed once and written there for the next process.
+        :complexity: O(1) once loaded, O(L) to read it where L is the length of the ladder
+    """
+    global _growth_ladder
+    if _growth_ladder is None:
+        try:
+            with open(GROWTH_LADDER_FILE, "r") as ladder_file:
+                _growth_ladder = [int(line) for line in ladder_file if line.strip()]
+        except OSError:
+            _growth_ladder = build_growth_ladder()
+            try:
+                with open(GROWTH_LADDER_FILE, "w") as ladder_file:
+                    ladder_file.write("\n".join(str(prime) for prime in _growth_ladder) + "\n")
+            except OSError:  # read-only install, keep the ladder in memory only
+                pass
+    return _growth_ladder
+
+
+def next_growth_prime(size: int) -> int:
+    """
+        The size a table of size slots grows to: the largest prime on the ladder below twice
+        size (at least 1.85 times size past the first few primes), always bigger than size.
+        Beyond the ladder it is computed directly.
+        :complexity: O(log L) where L is the length of the ladder, O(prev_prime()) beyond it
+    """
+    ladder = growth_ladder()
+    if 2 * size > ladder[-1]:
+        return max(prev_prime(2 * size), next_prime(size))
+    # ladder[index - 1] < 2 * size <= ladder[index]
+    index = bisect.bisect_left(ladder, 2 * size)
+    return max(ladder[index - 1], next_prime(size)) if index > 0 else next_prime(size)
+
+
 class LargestPrimeIterator():
     """ Iterator to find the next largest prime smaller than an upper bound."""
 
@@ -24,33 +296,21 @@ class LargestPrimeIterator():
         :complexity: Best and worst case O(1)
         """
         return self
-    
+
     def __next__(self):
         """Magic method to get the next item in the iterable object
-        :complexity: Best and worst case = O(largest_prime()) that is O(n^2)
+        :complexity: Best and worst case = O(largest_prime())
         """
         new_prime = self.largest_prime(self.upper_bound)
         self.upper_bound = new_prime * self.factor
-        
+
         return new_prime
 
 
     def largest_prime(self, number: int) -> int:
-        """ Using the sieve of eratosthenes get the largest prime number under bound
-        :param number: the bound under which the list of prime numbers are generated
+        """ Get the largest prime number under bound
+        :param number: the bound under which the largest prime number is found
         :returns: the largest prime under the bound
-        :complexity: Best and worst case O(n^2) where n is number, the upper bound
+        :complexity: see prev_prime()
         """
-
-        numbers = list(range(2, number))
-
-        for prime_candidate in numbers:
-            trial_prime = prime_candidate * prime_candidate
-            while trial_prime <= number:
-
-                if trial_prime in numbers:
-                    numbers.remove(trial_prime)
-                
-                trial_prime += prime_candidate
-        
-        return numbers[-1]
+        return prev_prime(number)
@@ -0,0 +1,135 @@
+""" Re-seeding Hash Table ADT
+
+Defines a Linear Probe Table that watches the probe length of every insert.
+When a key lands more than max_probe slots away from its home position, the
+hash function is assumed to be a bad fit for the keys (anagrams under a sum of
+characters, an adversarial key set, ...) and the table is rebuilt at the same
+size with a hash whose parameters are freshly drawn from RandomGen: the universal
+hash for str keys, and for the other key types the strategy of their type in
+hash_functions built with those parameters.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+import batch_hash
+from hash_functions import random_universal_parameters, seeded_key_type_hash
+from hash_table import LinearProbeTable
+from typing import Callable, TypeVar
+T = TypeVar('T')
+
+
+class ReseedingLinearProbeTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table that re-seeds its hash function when probe chains get too long.
+
+        attributes:
+            max_probe: the probe length above which an insert re-seeds the table
+            seed: the (a, b) parameters of the hash in use, None until the first re-seed
+            reseed_count: number of times the table is re-seeded
+            batch_seed: the seed the codes of the batch being inserted were computed with,
+                        NO_BATCH outside of insert_many()
+    """
+
+    MAX_PROBE = 32
+    # Re-seeds allowed before the table grows again, so keys that collide under
+    # every seed (or a max_probe too small for the load) can't rebuild it forever
+    MAX_RESEEDS = 3
+    # batch_seed when no batch is being inserted, never a seed
+    NO_BATCH = object()
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, max_probe: int = MAX_PROBE,
+                 hash_function: Callable[[str], int] = None, shrink_threshold: float = 0,
+                 key_type: type = str) -> None:
+        """
+            Initialiser.
+            :param max_probe: the probe length an insert may reach before the table is re-seeded
+            :param hash_function: the hash used until the first re-seed, self.hash when not given
+            :raises ValueError: when max_probe is negative
+        """
+        if max_probe < 0:
+            raise ValueError("max_probe should not be negative.")
+
+        LinearProbeTable.__init__(self, expected_size, tablesize_override, hash_function, shrink_threshold, key_type)
+        self.max_probe = max_probe
+        self.seed = None
+        self.reseed_count = 0
+        self.reseeds_left = self.MAX_RESEEDS
+        self.batch_seed = self.NO_BATCH
+
+    def statistics(self) -> tuple:
+        """
+            Return the number of conflicts, total distance probed, length of longest probe,
+            number of times the table is rehashed and number of times it is re-seeded
+            :complexity: O(1)
+        """
+        return LinearProbeTable.statistics(self) + (self.reseed_count,)
+
+    def hash_many(self, keys: list[str]) -> list[int]:
+        """
+            Hash a batch of keys, with batch_hash when NumPy is available and the table uses a re-seeded hash of str keys
+            :see: #LinearProbeTable.hash_many(keys: list[str])
+        """
+        if self.seed is not None and self.key_type is str and batch_hash.HAS_NUMPY:
+            return batch_hash.universal_codes(keys, self.seed[0], self.seed[1]).tolist()
+        return LinearProbeTable.hash_many(self, keys)
+
+    def insert_many(self, items) -> None:
+        """
+            Insert many (key, data) pairs hashed up front, hashing again the keys that come
+            after a re-seed in the middle of the batch
+            :see: #LinearProbeTable.insert_many(items)
+        """
+        self.batch_seed = self.seed
+        try:
+            LinearProbeTable.insert_many(self, items)
+        finally:
+            self.batch_seed = self.NO_BATCH
+
+    def _insert(self, key: str, data: T, code: int) -> None:
+        """
+            Set an (key, data) pair whose hash code is already known, hashing key again when the
+            code comes from a batch hashed before the table was re-seeded
+            :see: #LinearProbeTable._insert(key: str, data: T, code: int)
+        """
+        if self.batch_seed is not self.NO_BATCH and self.batch_seed is not self.seed:
+            code = self.hash(key)
+        LinearProbeTable._insert(self, key, data, code)
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) in the slot at position, re-seeding the table when a new key is
+            placed more than max_probe slots away from its home position. Updating a key already
+            in the table never re-seeds.
+            :complexity: O(1), or O(self.reseed()) when it re-seeds
+        """
+        is_new = self._is_free(position)
+        LinearProbeTable._store(self, position, key, data, code)
+        tablesize = self.tablesize
+        if is_new and (position - code % tablesize) % tablesize > self.max_probe and self.reseeds_left > 0:
+            self.reseeds_left -= 1
+            self.reseed()
+
+    def reseed(self) -> None:
+        """
+            Rebuild the table at the same size with a hash of random parameters for its key type.
+            Every key is hashed again, the statistics keep counting across the rebuild.
+            :complexity: O(N + K) where N is the table size and K the total length of the keys
+        """
+        self.reseed_count += 1
+        self.seed = random_universal_parameters()
+        self.hash = seeded_key_type_hash(self.key_type, *self.seed)
+
+        pairs = [(item[0], item[1]) for item in self._entries()]
+        self._allocate(self.tablesize)
+        for (key, data), code in zip(pairs, self.hash_many([pair[0] for pair in pairs])):
+            self._reinsert((key, data, code))
+
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Move every item into a new array of new_table_size slots, allowing MAX_RESEEDS again
+            :see: #LinearProbeTable._resize(new_table_size: int)
+        """
+        LinearProbeTable._resize(self, new_table_size)
+        self.reseeds_left = self.MAX_RESEEDS
@@ -0,0 +1,241 @@
+""" Robin Hood Hash Table ADT
+
+Defines a Hash Table using Robin Hood linear probing for conflict resolution.
+Every slot remembers how far its entry is from its home position, an insert
+displaces any entry that is closer to home than itself ("takes from the rich"),
+which keeps probe lengths short and even.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from hash_table import LinearProbeTable
+from typing import Callable, TypeVar
+T = TypeVar('T')
+
+
+class RobinHoodTable(LinearProbeTable[T]):
+    """
+        Robin Hood Table, a drop-in replacement for LinearProbeTable.
+        Slots hold (key, data, hash code, distance) where distance is how far the slot is from the key's home.
+
+        attributes:
+            max_load: load factor above which the table is rehashed
+    """
+
+    MAX_LOAD = 0.5
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, max_load: float = MAX_LOAD,
+                 hash_function: Callable[[str], int] = None, shrink_threshold: float = 0,
+                 key_type: type = str) -> None:
+        """
+            Initialiser.
+            :param max_load: the load factor the table may reach before it is rehashed
+            :raises ValueError: when max_load is not in (0, 1)
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be between 0 and 1.")
+
+        LinearProbeTable.__init__(self, expected_size, tablesize_override, hash_function, shrink_threshold, key_type)
+        self.max_load = max_load
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key in the hash table, or -1 when it is not there.
+            The search stops as soon as it reaches an entry closer to its home than
+            the key would be, since the key would have displaced that entry.
+            :complexity best: O(1) first position is empty or holds key
+            :complexity worst: O(D) where D is the longest distance stored in the table
+        """
+        table = self.table
+        tablesize = len(table)
+        position = code % tablesize
+
+        for distance in range(tablesize):
+            item = table[position]
+            if item is None or item[3] < distance:  # key would have been placed here
+                return -1
+            elif item[2] == code and item[0] == key:  # found key
+                return position
+            position = (position + 1) % tablesize
+
+        return -1
+
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
+        """
+            Find the position of key in the hash table.
+            For an insert of a new key, the slot the key belongs in is freed by shifting the rest
+            of the cluster one slot further (every shifted entry is one step further from home),
+            and its position is returned.
+            :complexity best: O(K) first position is empty or holds key
+                            where K is the size of the key
+            :complexity worst: O(K + N) where N is the tablesize
+            :raises KeyError: When the key is not in the table, or for an insert when the table is full
+        """
+        if code is None:
+            code = self.hash(key)
+        if not is_insert:
+            position = self._find(key, code)
+            if position == -1:
+                raise KeyError(key)
+            return position
+
+        position, displaces = self._insert_position(key, code)
+        if displaces:
+            self._shift_cluster(position)
+        return position
+
+    def _insert_position(self, key: str, code: int) -> tuple:
+        """
+            Find the slot an insert of key writes to, without moving anything yet
+            :returns: (position, displaces) where displaces tells whether the entry at position,
+                      closer to its home than key would be, has to be shifted out of the way first
+            :complexity best: O(1) home position is empty or holds key
+            :complexity worst: O(N) where N is the tablesize
+            :raises KeyError: When the table is full
+        """
+        if self.is_full():
+            raise KeyError(key)
+
+        table = self.table
+        tablesize = len(table)
+        position = code % tablesize
+
+        for distance in range(tablesize):
+            item = table[position]
+            if item is None:  # found empty slot
+                return position, False
+            elif item[2] == code and item[0] == key:  # found key
+                return position, False
+            elif item[3] < distance:  # the resident is richer, it gives up its slot
+                return position, True
+
+            if distance == 0:
+                self.conflict += 1
+            self.total_distance_probed += 1
+            position = (position + 1) % tablesize
+
+        raise KeyError(key)
+
+    def update_with(self, key: str, fn: Callable[[T], T], default: T = None) -> T:
+        """
+            Read-modify-write: store fn(data) as the new data of key, using default as the
+            data when key is not in the table yet.
+            The slot is found with one probe, and fn runs before the cluster is shifted, so an
+            exception from fn leaves the table as it was.
+            :see: #LinearProbeTable.update_with(key: str, fn, default: T)
+        """
+        self._check_load()
+        code = self.hash(key)
+        position, displaces = self._insert_position(key, code)
+        if displaces or self.table[position] is None:
+            data = fn(default)
+            if displaces:
+                self._shift_cluster(position)
+        else:
+            data = fn(self.table[position][1])
+        self._store(position, key, data, code)
+        return data
+
+    def _shift_cluster(self, position: int) -> None:
+        """
+            Move every entry from position up to the next empty slot one slot further
+            :complexity: O(C) where C is the length of the rest of the cluster
+        """
+        table = self.table
+        tablesize = len(table)
+        end = position
+        while table[end] is not None:
+            end = (end + 1) % tablesize
+
+        while end != position:
+            previous = (end - 1) % tablesize
+            item = table[previous]
+            table[end] = item[:3] + (item[3] + 1,)
+            if item[3] + 1 > self.length_longest_probe:
+                self.length_longest_probe = item[3] + 1
+            self.total_distance_probed += 1
+            end = previous
+        table[position] = None
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) in the slot at position, found by self._linear_probe() for key
+            :complexity: O(1)
+        """
+        tablesize = len(self.table)
+        distance = (position - code % tablesize) % tablesize
+        if self.table[position] is None:
+            self.count += 1
+            if distance > self.length_longest_probe:
+                self.length_longest_probe = distance
+
+        self.table[position] = (key, data, code, distance)
+
+    def _remove_at(self, position: int) -> None:
+        """
+            Empty the slot at position, moving the following entries of the cluster one slot
+            closer to their home until an entry already at its home (or an empty slot) is reached
+            :complexity best: O(1) next slot is empty
+            :complexity worst: O(C) where C is the length of the cluster
+        """
+        table = self.table
+        tablesize = len(table)
+        self.count -= 1
+
+        following = (position + 1) % tablesize
+        while table[following] is not None and table[following][3] > 0:
+            item = table[following]
+            table[position] = item[:3] + (item[3] - 1,)
+            position = following
+            following = (following + 1) % tablesize
+        table[position] = None
+
+    def _max_load(self) -> float:
+        """
+            The load factor the table may reach before an insert rehashes it, max_load
+            :complexity: O(1)
+        """
+        return self.max_load
+
+    def _reinsert(self, item: tuple) -> int:
+        """
+            Place an item taken from the previous table, displacing entries closer to their home.
+            Keys are known to be unique, so only the cached hash code is used.
+            :returns: the position the item was placed at
+            :complexity best: O(1) home position is empty
+            :complexity worst: O(N) where N is the tablesize
+        """
+        table = self.table
+        tablesize = len(table)
+        entry = item[:3] + (0,)
+        position = entry[2] % tablesize
+        placed = -1
+
+        while table[position] is not None:
+            resident = table[position]
+            if entry[3] == 0:
+                self.conflict += 1
+            if resident[3] < entry[3]:  # the resident is richer, it gives up its slot
+                table[position] = entry
+                if placed == -1:
+                    placed = position
+                entry = resident
+            entry = entry[:3] + (entry[3] + 1,)
+            if entry[3] > self.length_longest_probe:
+                self.length_longest_probe = entry[3]
+            self.total_distance_probed += 1
+            position = (position + 1) % tablesize
+
+        table[position] = entry
+        return position if placed == -1 else placed
+
+    def _resize(self, new_table_size: int) -> None:
+        """
+            Resize the table and reinsert all values.
+            The longest probe is measured again on the new table.
+            :see: #LinearProbeTable._resize(new_table_size: int)
+        """
+        self.length_longest_probe = 0
+        LinearProbeTable._resize(self, new_table_size)
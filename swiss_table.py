@@ -0,0 +1,215 @@
+""" Swiss Table ADT
+
+Defines a Hash Table using Linear Probing that keeps one control byte per slot in a
+bytearray next to the slot array, in the style of SwissTable. A control byte is
+EMPTY for a free slot, or a 7-bit tag of the hash code of the key stored there: the
+low 7 bits of the code after the MurmurHash3 finaliser, so short keys and weak hashes,
+whose codes have few bits set, still spread over all 128 tags.
+
+Probes scan the control bytes a group of GROUP_SIZE slots at a time with
+bytearray.find: one call finds where the probe chain ends (the first EMPTY byte)
+and another jumps straight to the slots whose 7 bits match the key. Only those
+slots are read and compared, every other slot of the chain is skipped at C speed.
+Deletion shifts entries back (see LinearProbeTable._remove_at), so there is no
+"deleted" control byte to skip over.
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from hash_functions import mix64
+from hash_table import LinearProbeTable
+from typing import Callable, TypeVar
+T = TypeVar('T')
+
+
+class SwissTable(LinearProbeTable[T]):
+    """
+        Linear Probe Table with SwissTable-style control bytes, a drop-in replacement for LinearProbeTable.
+
+        attributes:
+            ctrl: the control byte of every slot, EMPTY or the 7-bit tag of the hash code stored there
+            max_load: load factor above which the table is rehashed
+    """
+
+    # Control byte of a free slot, a tag never has its high bit set
+    EMPTY = 0x80
+    # Number of control bytes scanned by one find
+    GROUP_SIZE = 16
+    MAX_LOAD = 0.5
+
+    def __init__(self, expected_size: int, tablesize_override: int = -1, max_load: float = MAX_LOAD,
+                 hash_function: Callable[[str], int] = None, shrink_threshold: float = 0,
+                 key_type: type = str) -> None:
+        """
+            Initialiser.
+            :param max_load: the load factor the table may reach before it is rehashed,
+                             control bytes keep probes cheap at loads LinearProbeTable avoids
+            :raises ValueError: when max_load is not in (0, 1)
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load should be between 0 and 1.")
+
+        LinearProbeTable.__init__(self, expected_size, tablesize_override, hash_function, shrink_threshold, key_type)
+        self.max_load = max_load
+
+    @staticmethod
+    def _tag(code: int) -> int:
+        """
+            The control byte of a slot holding a key with this hash code, 7 bits of the mixed code
+            :complexity: O(1)
+        """
+        return mix64(code) & 0x7F
+
+    def _allocate(self, tablesize: int) -> None:
+        """
+            Allocate empty slots and their EMPTY control bytes
+            :complexity: O(tablesize)
+        """
+        LinearProbeTable._allocate(self, tablesize)
+        self.ctrl = bytearray([self.EMPTY]) * tablesize
+
+    def _max_load(self) -> float:
+        """
+            The load factor the table may reach before an insert rehashes it, max_load
+            :complexity: O(1)
+        """
+        return self.max_load
+
+    def _find(self, key: str, code: int) -> int:
+        """
+            Find the position of key by scanning the control bytes group by group,
+            comparing only the keys of the slots whose tag matches
+            :returns: the position of key, or -1 when it is not in the table
+            :complexity best: O(1) first group holds key or the end of the chain
+            :complexity worst: O(N) when we've searched the entire table
+                            where N is the tablesize
+        """
+        ctrl = self.ctrl
+        table = self.table
+        tablesize = len(ctrl)
+        tag = self._tag(code)
+        position = code % tablesize
+
+        scanned = 0
+        while scanned < tablesize:
+            end = min(position + self.GROUP_SIZE, tablesize)
+            stop = ctrl.find(self.EMPTY, position, end)
+            limit = end if stop == -1 else stop
+
+            match = ctrl.find(tag, position, limit)
+            while match != -1:
+                item = table[match]
+                if item[2] == code and item[0] == key:  # found key
+                    return match
+                match = ctrl.find(tag, match + 1, limit)
+
+            if stop != -1:  # end of the probe chain, so the key is not in
+                return -1
+            scanned += end - position
+            position = end % tablesize
+
+        return -1
+
+    def _free_slot(self, position: int) -> int:
+        """
+            Returns the first free slot from position on, wrapping around the end, -1 when the table is full
+            :complexity: O(N) where N is the tablesize, scanned by bytearray.find
+        """
+        free = self.ctrl.find(self.EMPTY, position)
+        if free == -1:
+            free = self.ctrl.find(self.EMPTY, 0, position)
+        return free
+
+    def _linear_probe(self, key: str, is_insert: bool, code: int = None) -> int:
+        """
+            Find the correct position for this key, counting the conflicts and distance probed
+            of an insert like LinearProbeTable does
+            :see: #self._find(key: str, code: int)
+            :raises KeyError: When a position can't be found
+        """
+        if code is None:
+            code = self.hash(key)
+
+        position = self._find(key, code)
+        if not is_insert:
+            if position == -1:
+                raise KeyError(key)
+            return position
+
+        if position == -1:
+            if self.is_full():
+                raise KeyError(key)
+            position = self._free_slot(code % len(self.ctrl))
+
+        distance_probed_current = (position - code) % len(self.ctrl)
+        if distance_probed_current > 0:
+            self.conflict += 1
+            self.total_distance_probed += distance_probed_current
+            if distance_probed_current > self.length_longest_probe:
+                self.length_longest_probe = distance_probed_current
+        return position
+
+    def _is_free(self, position: int) -> bool:
+        """
+            Returns whether the slot at position is empty
+            :complexity: O(1)
+        """
+        return self.ctrl[position] == self.EMPTY
+
+    def _store(self, position: int, key: str, data: T, code: int) -> None:
+        """
+            Store (key, data) in the slot at position and its tag in the control byte
+            :complexity: O(1)
+        """
+        LinearProbeTable._store(self, position, key, data, code)
+        self.ctrl[position] = self._tag(code)
+
+    def _remove_at(self, position: int) -> None:
+        """
+            Empty the slot at position using backward-shift deletion, moving control bytes along with the items
+            :see: #LinearProbeTable._remove_at(position: int)
+        """
+        table = self.table
+        ctrl = self.ctrl
+        tablesize = len(ctrl)
+        table[position] = None
+        ctrl[position] = self.EMPTY
+        self.count -= 1
+
+        hole = position
+        position = (position + 1) % tablesize
+        while ctrl[position] != self.EMPTY:
+            item = table[position]
+            # the item may move into the hole if the hole is between its home and where it is
+            if (position - item[2] % tablesize) % tablesize >= (position - hole) % tablesize:
+                table[hole] = item
+                ctrl[hole] = ctrl[position]
+                table[position] = None
+                ctrl[position] = self.EMPTY
+                hole = position
+            position = (position + 1) % tablesize
+
+    def _reinsert(self, item: tuple) -> int:
+        """
+            Place an item taken from the previous table in the first free slot from its home position,
+            found by scanning the control bytes
+            :returns: the position the item was placed at
+            :complexity best: O(1) home position is empty
+            :complexity worst: O(N) where N is the tablesize
+        """
+        tablesize = len(self.ctrl)
+        home = item[2] % tablesize
+        position = self._free_slot(home)
+
+        distance_probed_current = (position - home) % tablesize
+        if distance_probed_current > 0:
+            self.conflict += 1
+            self.total_distance_probed += distance_probed_current
+            if distance_probed_current > self.length_longest_probe:
+                self.length_longest_probe = distance_probed_current
+
+        self.table[position] = item
+        self.ctrl[position] = self._tag(item[2])
+        return position
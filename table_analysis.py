@@ -5,7 +5,7 @@ This hash table is used for the analysis. The hash function uses a static base i
 a dynamic base.
 """
 from __future__ import annotations
-from primes import LargestPrimeIterator
+from primes import LargestPrimeIterator, is_prime, next_prime, prime_at_least
 
 __author__ = 'Brendon Taylor. Modified by Graeme Gange, Alexey Ignatiev, and Jackson Goerner'
 __docformat__ = 'reStructuredText'
@@ -13,8 +13,9 @@ __modified__ = '21/05/2020'
 __since__ = '14/05/2020'
 
 
+import batch_hash
 from referential_array import ArrayR
-from typing import TypeVar, Generic
+from typing import Callable, TypeVar, Generic
 T = TypeVar('T')
 
 
@@ -32,38 +33,24 @@ class LinearProbeTable(Generic[T]):
         '''
         Function to check if the num is prime . Returns True or False
         '''
-        if num > 1:
-        # Iterate from 2 to n / 2
-            for i in range(2, int(num/2)+1):
-            # If num is divisible by any number between
-            # 2 and n / 2, it is not prime
-                if (num % i) == 0:
-                    return False
-            else:
-                return True
-        else:
-            return False
+        return is_prime(num)
 
 
-    def __init__(self, expected_size: int, tablesize_override: int = -1) -> None:
+    def __init__(self, expected_size: int, tablesize_override: int = -1, hash_function: Callable[[str], int] = None) -> None:
         """
             Initialiser.
+            :param hash_function: a hash strategy (see hash_functions) used instead of the static base hash
         """
+        if hash_function is not None:
+            self.hash = hash_function
         self.count = 0
         self.tablesize = None
         self.base = 1
 
         
         if tablesize_override == -1 :
-            # if expected_size is prime number, set the table_size to expected_size
-            if self.check_prime(expected_size) :
-                self.tablesize = expected_size
-            # if expected_size is not prime number
-            else : 
-                # Increment the expected_size by 1 untill it becomes a prime number then only set it as the table_size
-                while not self.check_prime(expected_size):
-                    expected_size += 1
-                self.tablesize = expected_size    
+            # the table_size is expected_size if it is prime, or the next prime after it
+            self.tablesize = prime_at_least(expected_size)
         else : 
             # Set the table_size to tablesize_override if tablesize_override is not -1
             self.tablesize = tablesize_override
@@ -93,16 +80,18 @@ class LinearProbeTable(Generic[T]):
         """
         return self.count
 
-    def _linear_probe(self, key: str, is_insert: bool) -> int:
+    def _linear_probe(self, key: str, is_insert: bool, position: int = None) -> int:
         """
             Find the correct position for this key in the hash table using linear probing
+            :param position: the home position of key, hashed here when not given
             :complexity best: O(K) first position is empty
                             where K is the size of the key
             :complexity worst: O(K + N) when we've searched the entire table
                             where N is the tablesize
             :raises KeyError: When a position can't be found
         """
-        position = self.hash(key)  # get the position using hash
+        if position is None:
+            position = self.hash(key) % self.tablesize  # get the position using hash
 
         conflict_counted = False
 
@@ -168,6 +157,29 @@ class LinearProbeTable(Generic[T]):
         else:
             return True
 
+    def __delitem__(self, key: str) -> None:
+        """
+            Remove key from the table using backward-shift deletion: every later item of the
+            cluster that may live in the hole is moved back into it, so no tombstone is left
+            :see: #self._linear_probe(key: str, is_insert: bool)
+            :raises KeyError: when the item doesn't exist
+        """
+        position = self._linear_probe(key, False)
+        self.table[position] = None
+        self.count -= 1
+
+        hole = position
+        position = (position + 1) % self.tablesize
+        while self.table[position] is not None:
+            item = self.table[position]
+            home = self.hash(item[0]) % self.tablesize
+            # the item may move into the hole if the hole is between its home and where it is
+            if (position - home) % self.tablesize >= (position - hole) % self.tablesize:
+                self.table[hole] = item
+                self.table[position] = None
+                hole = position
+            position = (position + 1) % self.tablesize
+
     def __getitem__(self, key: str) -> T:
         """
             Get the item at a certain key
@@ -180,6 +192,14 @@ class LinearProbeTable(Generic[T]):
     def __setitem__(self, key: str, data: T) -> None:
         """
             Set an (key, data) pair in our hash table
+            :see: #self._insert(key: str, data: T, home: int)
+        """
+        self._insert(key, data, None)
+
+    def _insert(self, key: str, data: T, home: int) -> None:
+        """
+            Set an (key, data) pair in our hash table
+            :param home: the home position of key for the current table size, or None to hash it
             :see: #self._linear_probe(key: str, is_insert: bool)
             :see: #self.__contains__(key: str)
         """
@@ -187,8 +207,9 @@ class LinearProbeTable(Generic[T]):
         # Rehash the table if the the number of items in the hash table is greater than half of its capacity
         if self.count > ( self.tablesize // 2):
             self._rehash()
-        
-        position = self._linear_probe(key, True)
+            home = None
+
+        position = self._linear_probe(key, True, home)
 
         if self.table[position] is None:
             self.count += 1
@@ -216,6 +237,36 @@ class LinearProbeTable(Generic[T]):
         """
         self[key] = data
 
+    def hash_many(self, keys: list[str]) -> list[int]:
+        """
+            Home position of a batch of keys for the current table size. When NumPy is available
+            and the table uses its static base hash, all keys are hashed together by batch_hash.
+            :complexity: O(N * L) where N is the number of keys and L the length of the longest key
+        """
+        if batch_hash.HAS_NUMPY and getattr(self.hash, '__func__', None) is LinearProbeTable.hash \
+                and self.tablesize <= batch_hash.MAX_BATCH_TABLESIZE:
+            return batch_hash.polynomial_slots(keys, self.base, self.tablesize).tolist()
+        return [self.hash(key) % self.tablesize for key in keys]
+
+    def bulk_insert(self, keys: list[str], values: list[T] = None) -> None:
+        """
+            Insert a batch of keys, hashing them all up front with self.hash_many().
+            Positions depend on the table size, so the table is first grown as far as
+            inserting every key one at a time would grow it (counting every key as new).
+            :param values: the data of every key, the keys themselves when not given
+            :raises ValueError: when there are not as many values as keys
+        """
+        if values is None:
+            values = keys
+        elif len(values) != len(keys):
+            raise ValueError("Expected as many values as keys.")
+
+        while len(keys) > 0 and self.count + len(keys) - 1 > self.tablesize // 2:
+            self._rehash()
+
+        for key, data, home in zip(keys, values, self.hash_many(keys)):
+            self._insert(key, data, home)
+
     def _rehash(self) -> None:
         """
             Need to resize table and reinsert all values
@@ -227,7 +278,8 @@ class LinearProbeTable(Generic[T]):
         # Find the next biggest prime number with the upper bound of twice the value of the current table size 
         prime_iterator = LargestPrimeIterator(self.tablesize,2)
         next_1 = next(prime_iterator)
-        new_table_size = next(prime_iterator)
+        # the iterator stays on the same size for tiny tables (5 -> 3 -> 5), always grow by at least a prime
+        new_table_size = max(next(prime_iterator), next_prime(self.tablesize))
 
         new_table = ArrayR(new_table_size)
         
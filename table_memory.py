@@ -0,0 +1,29 @@
+""" File to compare the memory used by the two slot layouts of the hash table"""
+
+import tracemalloc
+
+from hash_table import LinearProbeTable
+from parallel_hash_table import ParallelLinearProbeTable
+
+us_cities_file = open("us_cities.txt", "r")
+us_cities = [line.strip() for line in us_cities_file]
+us_cities_file.close()
+
+
+def table_memory(table_type) -> int:
+    """
+        Load the US cities into a new table of table_type and return the bytes it holds on to.
+        The table is sized up front so no rehash happens while it is measured.
+    """
+    tracemalloc.start()
+    table = table_type(2 * len(us_cities) + 1)
+    for city in us_cities:
+        table[city] = city  # treating city name (data) as key an value
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+for table_type in (LinearProbeTable, ParallelLinearProbeTable):
+    used = table_memory(table_type)
+    print(table_type.__name__, used, "bytes,", round(used / len(us_cities), 1), "bytes per entry")
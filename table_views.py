@@ -0,0 +1,222 @@
+""" Table Views
+
+Live, lazy views over the keys, values and (key, data) items of a hash table, like the
+views of a dict. A view holds no copy: it walks the _entries() of its table every time
+it is iterated, so it always shows the current contents and costs nothing to create.
+
+TableViewsMixin gives a table its keys(), values(), items(), iteration, str() and
+dump() from its _entries() alone.
+
+The views also export their contents in one pass, straight from the table:
+to_numpy() fills a NumPy array and to_array() an array buffer, without building an
+intermediate list first. NumPy is optional (see batch_hash.HAS_NUMPY).
+
+Usage:
+```
+keys = table.keys()
+len(keys), "Eva" in keys
+codes = table.values().to_array('q')
+```
+"""
+from __future__ import annotations
+
+__author__ = 'Tan Jun Yu'
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from array import array
+import batch_hash
+
+
+class TableView(ABC):
+    """
+        Base of the views, iterating over the entries of a hash table.
+
+        attributes:
+            table: the hash table viewed, any table with _entries(), get() and len()
+    """
+
+    def __init__(self, table) -> None:
+        """ Object initializer. """
+        self.table = table
+
+    def __len__(self) -> int:
+        """
+            Returns the number of entries in the table
+            :complexity: O(1)
+        """
+        return len(self.table)
+
+    @abstractmethod
+    def _field(self, item: tuple):
+        """ The part of a (key, data, ...) entry this view shows """
+        pass
+
+    def __iter__(self):
+        """
+            Iterate over the table as it is now
+            :raises RuntimeError: when the table changes size during the iteration
+            :complexity: O(N) where N is the table size, see the _entries() of the table
+        """
+        count = len(self.table)
+        for item in self.table._entries():
+            yield self._field(item)
+            if len(self.table) != count:
+                raise RuntimeError("Table changed size during iteration.")
+
+    def __contains__(self, value) -> bool:
+        """
+            Checks to see if value is in the view, by scanning it
+            :complexity: O(N) where N is the table size
+        """
+        for field in self:
+            if field is value or field == value:
+                return True
+        return False
+
+    def to_numpy(self, dtype=object):
+        """
+            Export the view into a NumPy array of dtype, filled as the table is walked
+            :raises ImportError: when NumPy is not installed
+            :complexity: O(N) where N is the table size
+        """
+        if not batch_hash.HAS_NUMPY:
+            raise ImportError("to_numpy() needs NumPy.")
+        return batch_hash.np.fromiter(self, dtype=dtype, count=len(self))
+
+    def to_array(self, typecode: str) -> array:
+        """
+            Export the view into an array buffer of typecode ('q' for ints, 'd' for floats, ...)
+            :raises TypeError: when a field does not fit typecode
+            :complexity: O(N) where N is the table size
+        """
+        return array(typecode, self)
+
+    def __repr__(self) -> str:
+        """ Returns the view with its contents, like the views of a dict """
+        return type(self).__name__ + "([" + ", ".join(repr(field) for field in self) + "])"
+
+
+class KeysView(TableView):
+    """ Live view of the keys of a hash table. """
+
+    def _field(self, item: tuple):
+        """ The key of an entry """
+        return item[0]
+
+    def __contains__(self, key) -> bool:
+        """
+            Checks to see if key is in the table, with a lookup instead of a scan
+            :complexity: one lookup in the table
+        """
+        return key in self.table
+
+
+class ValuesView(TableView):
+    """ Live view of the data of a hash table. """
+
+    def _field(self, item: tuple):
+        """ The data of an entry """
+        return item[1]
+
+
+class ItemsView(TableView):
+    """ Live view of the (key, data) pairs of a hash table. """
+
+    # Data of a key missing from the table, never equal to stored data
+    _MISSING = object()
+
+    def _field(self, item: tuple):
+        """ The (key, data) pair of an entry """
+        return (item[0], item[1])
+
+    def __contains__(self, pair) -> bool:
+        """
+            Checks to see if pair is a (key, data) pair of the table, with a lookup instead of a scan
+            :complexity: one lookup in the table
+        """
+        key, data = pair
+        stored = self.table.get(key, self._MISSING)
+        return stored is not self._MISSING and (stored is data or stored == data)
+
+    def to_numpy(self, dtype=object):
+        """
+            Export the pairs into an N x 2 NumPy array of dtype, keys in the first column
+            :raises ImportError: when NumPy is not installed
+            :complexity: O(N) where N is the table size
+        """
+        if not batch_hash.HAS_NUMPY:
+            raise ImportError("to_numpy() needs NumPy.")
+        pairs = batch_hash.np.empty((len(self), 2), dtype=dtype)
+        row = 0
+        for key, data in self:
+            pairs[row, 0] = key
+            pairs[row, 1] = data
+            row += 1
+        return pairs
+
+    def to_array(self, typecode: str) -> array:
+        """
+            Export the pairs into one flat array buffer of typecode, key and data alternating
+            :raises TypeError: when a key or data does not fit typecode
+            :complexity: O(N) where N is the table size
+        """
+        return array(typecode, (field for pair in self for field in pair))
+
+
+class TableViewsMixin:
+    """
+        Views, iteration and str() output of a hash table, for any table with _entries()
+        yielding (key, data, ...) entries, get() and len().
+    """
+
+    def keys(self) -> KeysView:
+        """
+            Returns a live view of the keys in the hash table.
+            :complexity: O(1), iterating it costs one walk of the table
+        """
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        """
+            Returns a live view of the values in the hash table.
+            :complexity: O(1), iterating it costs one walk of the table
+        """
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+            Returns a live view of the (key, value) pairs in the hash table.
+            :complexity: O(1), iterating it costs one walk of the table
+        """
+        return ItemsView(self)
+
+    def __iter__(self):
+        """
+            Iterate over the keys in the hash table
+            :see: #self.keys()
+        """
+        return iter(KeysView(self))
+
+    def _lines(self):
+        """
+            Iterate over the "(key,value)" line of every pair in the hash table
+            :complexity: O(N) where N is the table size
+        """
+        for item in self._entries():
+            yield "(" + str(item[0]) + "," + str(item[1]) + ")\n"
+
+    def dump(self, fp) -> None:
+        """
+            Write the lines of str(self) to the text file fp one at a time, without building the whole string
+            :see: #self._lines()
+        """
+        fp.writelines(self._lines())
+
+    def __str__(self) -> str:
+        """
+            Returns all they key/value pairs in our hash table (no particular
+            order).
+            :complexity: O(N) where N is the table size
+        """
+        return "".join(self._lines())
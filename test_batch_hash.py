@@ -0,0 +1,66 @@
+"""
+Tests the NumPy batch hashing gives exactly the same results as the tables' own hash.
+"""
+
+import batch_hash
+from hash_functions import make_hash_function
+from hash_table import LinearProbeTable
+import table_analysis
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+KEYS = ["Melbourne", "", "a", "Sydney", "Wagga Wagga", "São Paulo", "Zürich", "東京", "Ann", "Nan"]
+
+
+def load_cities(filename):
+    with open(filename) as cities_file:
+        return [line.strip() for line in cities_file]
+
+
+@unittest.skipUnless(batch_hash.HAS_NUMPY, "NumPy is not installed")
+class TestBatchHash(unittest.TestCase):
+    """ Testing batch hashing against the one key at a time hashes. """
+
+    def test_encode_keys(self):
+        matrix, lengths = batch_hash.encode_keys(["ab", "", "東"])
+        self.assertEqual(lengths.tolist(), [2, 0, 1])
+        self.assertEqual(matrix.tolist(), [[97, 98], [0, 0], [ord("東"), 0]])
+        matrix, lengths = batch_hash.encode_keys([])
+        self.assertEqual(matrix.shape, (0, 0))
+
+    def test_polynomial_slots(self):
+        cities = load_cities("aust_cities.txt") + KEYS
+        for tablesize in [20021, 402221, 1000081]:
+            for base in [1, 9929, 250726]:
+                table = table_analysis.LinearProbeTable(tablesize)
+                table.base = base
+                expected = [table.hash(city) for city in cities]
+                self.assertEqual(batch_hash.polynomial_slots(cities, base, tablesize).tolist(), expected)
+
+    def test_codes(self):
+        cities = load_cities("indian_cities.txt") + KEYS
+        table = LinearProbeTable(19)
+        self.assertEqual(batch_hash.universal_codes(cities).tolist(), [table.hash(city) for city in cities])
+        self.assertEqual(table.hash_many(cities), [table.hash(city) for city in cities])
+
+        polynomial = make_hash_function("polynomial", base=9929)
+        self.assertEqual(batch_hash.polynomial_codes(cities, 9929).tolist(), [polynomial(city) for city in cities])
+
+    def test_bulk_insert(self):
+        cities = load_cities("aust_cities.txt")
+        for table_type in (LinearProbeTable, table_analysis.LinearProbeTable):
+            table = table_type(1000)
+            table.bulk_insert(cities)
+            self.assertEqual(len(table), len(set(cities)))
+            for city in cities:
+                self.assertEqual(table[city], city)
+
+        table = LinearProbeTable(1000)
+        self.assertRaises(ValueError, lambda: table.bulk_insert(cities, [1, 2]))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests the Bloom filter and the filtered table.
+"""
+
+from bloom_filter import BloomFilter, FilteredTable
+from hash_functions import key_type_hash, make_hash_function
+from hash_table import LinearProbeTable
+from swiss_table import SwissTable
+import itertools
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+class TestBloomFilter(unittest.TestCase):
+    """ Testing Bloom Filter functionality. """
+
+    def test_sizing(self):
+        bloom = BloomFilter(1000, 0.01)
+        # 9.59 bits and 7 hashes per key for 1%
+        self.assertEqual(bloom.size, 9586)
+        self.assertEqual(bloom.hash_count, 7)
+        self.assertEqual(bloom.memory(), 1199)
+        self.assertRaises(ValueError, lambda: BloomFilter(0))
+        self.assertRaises(ValueError, lambda: BloomFilter(10, 1))
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.01)
+        for number in range(1000):
+            bloom.add("key" + str(number))
+        self.assertEqual(len(bloom), 1000)
+        for number in range(1000):
+            self.assertIn("key" + str(number), bloom)
+
+        false_positives = sum("other" + str(number) in bloom for number in range(10000))
+        self.assertLess(false_positives / 10000, 0.02)
+        self.assertAlmostEqual(bloom.expected_false_positive_rate(), 0.01, delta=0.002)
+
+        bloom.clear()
+        self.assertNotIn("key1", bloom)
+        self.assertEqual(bloom.expected_false_positive_rate(), 0)
+
+    def test_int_keys(self):
+        bloom = BloomFilter(100, hash_function=key_type_hash(int))
+        for number in range(0, 1000, 10):
+            bloom.add(number)
+        for number in range(0, 1000, 10):
+            self.assertIn(number, bloom)
+        self.assertLess(sum(number in bloom for number in range(5, 1000, 10)), 10)
+
+
+class TestFilteredTable(unittest.TestCase):
+    """ Testing Filtered Table functionality. """
+
+    def test_anagram_misses(self):
+        # with base 1 every anagram of a name lands in the name's cluster
+        table = LinearProbeTable(200, hash_function=make_hash_function("polynomial", base=1))
+        names = FilteredTable(table)
+        for name in NAMES:
+            names[name] = name + "-value"
+        anagrams = {"".join(letters) for name in NAMES for letters in itertools.permutations(name)} - set(NAMES)
+        for anagram in anagrams:
+            self.assertNotIn(anagram, names)
+            self.assertIsNone(names.get(anagram))
+        for name in NAMES:
+            self.assertIn(name, names)
+            self.assertEqual(names[name], name + "-value")
+
+        statistics = names.statistics()
+        self.assertEqual(statistics[:4], table.statistics())
+        self.assertEqual(names.rejected + names.false_positives, 2 * len(anagrams))
+        self.assertLess(statistics[4], 0.05)
+        self.assertEqual(statistics[5], names.filter.memory())
+
+    def test_writes_keep_filter(self):
+        names = FilteredTable(SwissTable(19))
+        for number in range(500):
+            names["key" + str(number)] = number
+        names.setdefault("Eva", 1)
+        names.update_with("Eva", lambda data: data + 1)
+        names.insert_many([("Amy", 1), ("Tim", 2)])
+        names.bulk_insert(["Ron", "Jan"])
+        other = LinearProbeTable(19)
+        other["Kim"] = 3
+        names.insert_many(other)
+        for key in ["Eva", "Amy", "Tim", "Ron", "Jan", "Kim"] + ["key" + str(number) for number in range(500)]:
+            self.assertIn(key, names)
+        self.assertEqual(names["Eva"], 2)
+        self.assertEqual(len(names), 506)
+        self.assertGreaterEqual(names.filter.capacity, 506)
+
+        for number in range(400):
+            del names["key" + str(number)]
+        self.assertNotIn("key1", names)
+        self.assertRaises(KeyError, lambda: names.pop("key1"))
+        self.assertEqual(names.pop("key1", None), None)
+        self.assertEqual(names.pop("key450"), 450)
+        # the stale keys have been dropped by a rebuild
+        self.assertLess(names.stale, len(names))
+        self.assertEqual(sorted(names.keys()), sorted(names.table.keys()))
+
+    def test_wraps_filled_table(self):
+        table = LinearProbeTable(19)
+        for name in NAMES:
+            table[name] = name
+        names = FilteredTable(table)
+        for name in NAMES:
+            self.assertEqual(names[name], name)
+        self.assertRaises(KeyError, lambda: names["Joe"])
+
+
+    def test_key_types(self):
+        numbers = FilteredTable(LinearProbeTable(19, key_type=int))
+        numbers[1] = 'one'
+        numbers.insert_many([(number, str(number)) for number in range(2, 50)])
+        self.assertEqual(numbers[1], 'one')
+        self.assertEqual(numbers.get(49), '49')
+        self.assertFalse(50 in numbers)
+        self.assertIs(numbers.filter.hash, key_type_hash(int))
+
+        pairs = FilteredTable(SwissTable(19, key_type=tuple))
+        pairs[('coal', 1)] = 1
+        self.assertTrue(('coal', 1) in pairs)
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests the separate chaining hash table and its tree buckets.
+"""
+
+from chaining_hash_table import ChainingHashTable
+from hash_functions import make_hash_function
+import itertools
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestChainingHashTable(unittest.TestCase):
+    """ Testing Separate Chaining Hash Table functionality. """
+
+    def test_initialisation(self):
+        table = ChainingHashTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        conflict, probe_total, probe_max, rehash = table.statistics()
+        self.assertEqual(conflict, 4)     # Tim, Ann, Jim, Jon
+        self.assertEqual(probe_total, 6)  # Tim: 1, Ann: 2, Jim: 1, Jon: 2
+        self.assertEqual(probe_max, 2)    # Ann and Jon: 2
+        self.assertEqual(rehash, 0)       # No rehash
+
+        for name in NAMES:
+            self.assertEqual(table[name], name + "-value")
+        self.assertRaises(KeyError, lambda: table["Joe"])
+        self.assertNotIn("Bob", table)
+
+        table["Tim"] = "Tim-new"
+        self.assertEqual(table["Tim"], "Tim-new")
+        self.assertEqual(len(table), len(NAMES))
+
+    def test_treeify(self):
+        table = ChainingHashTable(1000, hash_function=make_hash_function("polynomial", base=1))
+        # every permutation of the same letters hashes to the same bucket
+        anagrams = ["".join(letters) for letters in itertools.permutations("abcde")]
+        for number, key in enumerate(anagrams):
+            table[key] = number
+        position = table.hash(anagrams[0]) % table.tablesize
+        self.assertTrue(table.is_tree(position))
+        self.assertEqual(len(table), len(anagrams))
+        # an insert searches past the height of the tree, not the 119 keys before it
+        self.assertLessEqual(table.statistics()[2], 8)
+        for number, key in enumerate(anagrams):
+            self.assertEqual(table[key], number)
+        table[anagrams[3]] = "new"
+        self.assertEqual(table[anagrams[3]], "new")
+        self.assertEqual(len(table), len(anagrams))
+
+        # deleting down to UNTREEIFY_THRESHOLD keys turns the bucket back into a list
+        for key in anagrams[ChainingHashTable.UNTREEIFY_THRESHOLD:]:
+            del table[key]
+        self.assertFalse(table.is_tree(position))
+        self.assertEqual(sorted(table.keys()), sorted(anagrams[:ChainingHashTable.UNTREEIFY_THRESHOLD]))
+
+    def test_rehash(self):
+        table = ChainingHashTable(19)
+        for number in range(1000):
+            table["key" + str(number)] = number
+        self.assertGreater(table.tablesize, 1000 / ChainingHashTable.MAX_LOAD)
+        self.assertGreater(table.statistics()[3], 0)
+        for number in range(1000):
+            self.assertEqual(table["key" + str(number)], number)
+
+        for number in range(0, 1000, 2):
+            self.assertEqual(table.pop("key" + str(number)), number)
+        self.assertEqual(table.pop("key0", None), None)
+        self.assertRaises(KeyError, lambda: table.__delitem__("key0"))
+        self.assertEqual(sorted(table.values()), list(range(1, 1000, 2)))
+        self.assertEqual(table.get("key0", -1), -1)
+
+    def test_invalid_threshold(self):
+        self.assertRaises(ValueError, lambda: ChainingHashTable(10, treeify_threshold=6))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests the compact, insertion-ordered hash table.
+"""
+
+from array import array
+from compact_hash_table import CompactLinearProbeTable
+from hash_table import LinearProbeTable
+import random
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestCompactHashTable(unittest.TestCase):
+    """ Testing Compact Hash Table functionality. """
+
+    def test_insertion_order(self):
+        table = CompactLinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        self.assertEqual(list(table.keys()), NAMES)
+        self.assertEqual(list(table.values()), [name + "-value" for name in NAMES])
+        # the same probe sequences as LinearProbeTable
+        self.assertEqual(table.statistics(), (4, 8, 3, 0))
+        self.assertEqual(table.scan_statistics(), (4, 8, 3, 0))
+        self.assertEqual(table.cluster_sizes(), [1, 5, 4])
+
+        table["Eva"] = "Eva-new"  # an update keeps its place
+        self.assertEqual(list(table.keys()), NAMES)
+        self.assertEqual(table["Eva"], "Eva-new")
+        self.assertEqual(str(table).splitlines()[:2], ["(Eva,Eva-new)", "(Amy,Amy-value)"])
+
+    def test_delete(self):
+        table = CompactLinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        del table["Amy"]
+        self.assertEqual(table.pop("Tim"), "Tim-value")
+        self.assertEqual(table.holes, 2)
+        self.assertEqual(list(table.keys()), [name for name in NAMES if name not in ("Amy", "Tim")])
+        for name in NAMES:
+            self.assertEqual(name in table, name not in ("Amy", "Tim"))
+        self.assertEqual(table.scan_statistics()[:3], (2, 5, 3))  # as in LinearProbeTable
+
+        for name in NAMES[3:7]:
+            del table[name]
+        # the 6 holes outnumber Eva, Ann, Jim and Jon, so they have been squeezed out
+        self.assertEqual(table.entries, [(name, name + "-value", silly_hash(name)) for name in ("Eva", "Ann", "Jim", "Jon")])
+        self.assertEqual(table.holes, 0)
+        del table["Ann"]
+        self.assertEqual(table["Jon"], "Jon-value")
+        table["Amy"] = "Amy-again"
+        self.assertEqual(list(table.keys()), ["Eva", "Jim", "Jon", "Amy"])
+
+    def test_same_as_dict(self):
+        random.seed(20)
+        table = CompactLinearProbeTable(5, shrink_threshold=0.1)
+        reference = {}
+        for _ in range(5000):
+            key = "key" + str(random.randrange(400))
+            if random.random() < 0.4 and key in reference:
+                self.assertEqual(table.pop(key), reference.pop(key))
+            else:
+                table[key] = reference[key] = random.random()
+        self.assertEqual(list(table.keys()), list(reference.keys()))
+        self.assertEqual(list(table.values()), list(reference.values()))
+        self.assertEqual(len(table), len(reference))
+        for key in reference:
+            self.assertEqual(table[key], reference[key])
+        self.assertLessEqual(len(table.entries), 2 * len(table) + 1)
+
+    def test_index_typecode(self):
+        self.assertEqual(CompactLinearProbeTable(19).table.typecode, 'b')
+        self.assertEqual(CompactLinearProbeTable(1000).table.typecode, 'h')
+        self.assertEqual(CompactLinearProbeTable._index_typecode(10 ** 6), 'i')
+        self.assertEqual(array('i').itemsize, 4)
+        table = CompactLinearProbeTable(19)
+        for number in range(200):
+            table["key" + str(number)] = number
+        self.assertEqual(table.table.typecode, 'h')
+        self.assertEqual(list(table.keys()), ["key" + str(number) for number in range(200)])
+
+    def test_merge(self):
+        table = CompactLinearProbeTable(19)
+        other = LinearProbeTable(19)
+        for name in NAMES:
+            other[name] = name + "-value"
+        table.insert_many(other)
+        self.assertEqual(sorted(table.keys()), sorted(NAMES))
+        self.assertEqual(table.get("Kim"), "Kim-value")
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests the cuckoo hash table.
+"""
+
+from cuckoo_hash_table import CuckooHashTable
+from random_gen import RandomGen
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+def other_silly_hash(key):
+    return (ord(key[-1]) % FIX_TABLESIZE)
+
+
+class TestCuckooHashTable(unittest.TestCase):
+    """ Testing Cuckoo Hash Table functionality. """
+
+    def setUp(self):
+        RandomGen.set_seed(123)
+
+    def test_kicks(self):
+        table = CuckooHashTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash1 = silly_hash
+        table.hash2 = other_silly_hash
+        for name in ["Amy", "Tim", "Aim"]:
+            table[name] = name + "-value"
+        # Amy: table1 at A, Tim: table2 at m (A taken), Aim: both A and m taken,
+        # Aim kicks Amy out of A and Amy moves to table2 at y
+        self.assertEqual(table.statistics(), (1, 1, 1, 0))
+        self.assertEqual(table.table1[silly_hash("Aim")][0], "Aim")
+        self.assertEqual(table.table2[other_silly_hash("Amy")][0], "Amy")
+        self.assertEqual(table.table2[other_silly_hash("Tim")][0], "Tim")
+        for name in ["Amy", "Tim", "Aim"]:
+            self.assertEqual(table[name], name + "-value")
+
+    def test_stash(self):
+        table = CuckooHashTable(10, tablesize_override=FIX_TABLESIZE, stash_size=1)
+        table.hash1 = silly_hash
+        table.hash2 = silly_hash
+        # every key starting with J has the same two slots, the third one is stashed after max_kicks
+        for name in ["Jan", "Jim", "Jon"]:
+            table[name] = name + "-value"
+        self.assertEqual(len(table.stash), 1)
+        self.assertEqual(table.statistics(), (1, CuckooHashTable.MAX_KICKS, CuckooHashTable.MAX_KICKS, 0))
+        for name in ["Jan", "Jim", "Jon"]:
+            self.assertEqual(table[name], name + "-value")
+
+        # freeing a slot moves the stashed key back
+        stashed = table.stash[0][0]
+        del table["Jan" if stashed != "Jan" else "Jim"]
+        self.assertEqual(table.stash, [])
+        self.assertIn(stashed, table)
+        self.assertEqual(len(table), 2)
+
+    def test_cycle(self):
+        table = CuckooHashTable(10, tablesize_override=FIX_TABLESIZE, stash_size=1)
+        table.hash1 = silly_hash
+        table.hash2 = silly_hash
+        # the fourth J key is a cycle with a full stash: the table is rebuilt with fresh hashes
+        for name in ["Jan", "Jim", "Jon", "Joe"]:
+            table[name] = name + "-value"
+        self.assertGreaterEqual(table.statistics()[3], 1)
+        self.assertIsNot(table.hash1, silly_hash)
+        self.assertEqual(len(table), 4)
+        for name in ["Jan", "Jim", "Jon", "Joe"]:
+            self.assertEqual(table[name], name + "-value")
+
+    def test_many(self):
+        table = CuckooHashTable(19)
+        for number in range(2000):
+            table["key" + str(number)] = number
+        self.assertEqual(len(table), 2000)
+        self.assertGreater(table.tablesize, 2000 // 2)
+        for number in range(2000):
+            self.assertEqual(table["key" + str(number)], number)
+        self.assertRaises(KeyError, lambda: table["key2000"])
+
+        for number in range(0, 2000, 2):
+            self.assertEqual(table.pop("key" + str(number)), number)
+        self.assertEqual(table.pop("key0", None), None)
+        self.assertRaises(KeyError, lambda: table.__delitem__("key0"))
+        for number in range(2000):
+            self.assertEqual(table.get("key" + str(number)), None if number % 2 == 0 else number)
+        self.assertEqual(sorted(table.values()), list(range(1, 2000, 2)))
+
+    def test_update(self):
+        table = CuckooHashTable(10)
+        for name in NAMES:
+            table[name] = name + "-value"
+        for name in NAMES:
+            table[name] = name + "-new"
+        self.assertEqual(len(table), len(NAMES))
+        self.assertEqual(sorted(table.keys()), sorted(NAMES))
+        for name in NAMES:
+            self.assertIn(name, table)
+            self.assertEqual(table[name], name + "-new")
+
+    def test_invalid_parameters(self):
+        self.assertRaises(ValueError, lambda: CuckooHashTable(10, max_kicks=0))
+        self.assertRaises(ValueError, lambda: CuckooHashTable(10, stash_size=-1))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests the uninstrumented hash table and the scan-based statistics.
+"""
+
+from fast_hash_table import FastLinearProbeTable
+from hash_table import LinearProbeTable
+from parallel_hash_table import ParallelLinearProbeTable
+from robin_hood_table import RobinHoodTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestFastHashTable(unittest.TestCase):
+    """ Testing Uninstrumented Hash Table functionality. """
+
+    def test_scan_statistics(self):
+        for table_type in (FastLinearProbeTable, LinearProbeTable, ParallelLinearProbeTable):
+            with self.subTest(table_type=table_type.__name__):
+                table = table_type(10, tablesize_override=FIX_TABLESIZE)
+                table.hash = silly_hash
+                for name in NAMES:
+                    table[name] = name + "-value"
+                # Tim: 1, Ann: 2, Jim: 2, Jon: 3
+                self.assertEqual(table.scan_statistics(), (4, 8, 3, 0))
+                self.assertEqual(table.probe_histogram(), [6, 1, 2, 1])
+                # [Ron], [Amy, Tim, Ann, Dot, Eva] and [Jan, Kim, Jim, Jon] wrapping around the end
+                self.assertEqual(table.cluster_sizes(), [1, 5, 4])
+
+    def test_no_bookkeeping(self):
+        table = FastLinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        self.assertEqual((table.conflict, table.total_distance_probed, table.length_longest_probe), (0, 0, 0))
+        self.assertEqual(table.statistics(), (4, 8, 3, 0))
+        self.assertEqual(table["Jon"], "Jon-value")
+        self.assertRaises(KeyError, lambda: table["Joe"])
+
+    def test_same_as_linear_probe_table(self):
+        table = FastLinearProbeTable(19)
+        reference = LinearProbeTable(19)
+        for number in range(500):
+            key = "key" + str(number)
+            table[key] = number
+            reference[key] = number
+        self.assertEqual(list(table.keys()), list(reference.keys()))
+        self.assertEqual(list(table.values()), list(reference.values()))
+        self.assertEqual(table.statistics(), reference.scan_statistics())
+        self.assertEqual(table.statistics()[3], reference.statistics()[3])
+        self.assertEqual(sum(table.probe_histogram()), 500)
+        self.assertEqual(sum(table.cluster_sizes()), 500)
+
+    def test_robin_hood(self):
+        table = RobinHoodTable(19)
+        for number in range(500):
+            table["key" + str(number)] = number
+        self.assertEqual(table.probe_lengths(), [item[3] for item in table._entries()])
+
+    def test_full_and_empty(self):
+        table = FastLinearProbeTable(5, tablesize_override=5)
+        self.assertEqual(table.cluster_sizes(), [])
+        self.assertEqual(table.probe_histogram(), [])
+        self.assertEqual(table.scan_statistics(), (0, 0, 0, 0))
+        for name in NAMES[:5]:
+            table.table[len(table) % 5] = (name, name, table.hash(name))
+            table.count += 1
+        self.assertEqual(table.cluster_sizes(), [5])
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests the read-only snapshot made by freeze().
+"""
+
+from chaining_hash_table import ChainingHashTable
+from compact_hash_table import CompactLinearProbeTable
+from frozen_hash_table import FrozenHashTable
+from hash_table import LinearProbeTable
+from reseeding_hash_table import ReseedingLinearProbeTable
+from swiss_table import SwissTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestFrozenHashTable(unittest.TestCase):
+    """ Testing Frozen Hash Table functionality. """
+
+    def test_read_api(self):
+        for table_type in (LinearProbeTable, CompactLinearProbeTable, SwissTable, ReseedingLinearProbeTable,
+                           ChainingHashTable):
+            with self.subTest(table_type=table_type.__name__):
+                table = table_type(19)
+                for number in range(1000):
+                    table["key" + str(number)] = number
+                frozen = table.freeze()
+
+                self.assertIsInstance(frozen, FrozenHashTable)
+                self.assertEqual(len(frozen), 1000)
+                self.assertGreater(len(frozen) / frozen.tablesize, 0.8)
+                for number in range(1000):
+                    self.assertEqual(frozen["key" + str(number)], number)
+                self.assertNotIn("key1000", frozen)
+                self.assertRaises(KeyError, lambda: frozen["key1000"])
+                self.assertEqual(frozen.get("key1000", -1), -1)
+                self.assertEqual(frozen.get_many(["key1", "key2"]), [1, 2])
+                self.assertEqual(sorted(frozen.items()), sorted(table.items()))
+                self.assertEqual(sorted(str(frozen).splitlines()), sorted(str(table).splitlines()))
+
+    def test_keeps_hash_function(self):
+        table = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE, hash_function=silly_hash)
+        for name in NAMES:
+            table[name] = name + "-value"
+        frozen = table.freeze()
+        self.assertIs(frozen.hash, silly_hash)
+        self.assertEqual(frozen.tablesize, 13)
+        for name in NAMES:
+            self.assertEqual(frozen[name], name + "-value")
+        self.assertNotIn("Joe", frozen)
+        self.assertNotIn("Bob", frozen)
+        # Robin Hood placement evens the probes out
+        self.assertLessEqual(frozen.statistics()[2], table.scan_statistics()[2])
+
+        numbers = LinearProbeTable(19, key_type=tuple)
+        for number in range(100):
+            numbers[("coal", number)] = number
+        frozen = numbers.freeze()
+        self.assertEqual(frozen[("coal", 42)], 42)
+        self.assertNotIn(("coal", 100), frozen)
+        self.assertEqual(len(LinearProbeTable(19).freeze()), 0)
+
+    def test_distance_typecode(self):
+        table = LinearProbeTable(19)
+        for number in range(50):
+            table[str(number)] = number
+        self.assertEqual(table.freeze().distances.typecode, 'b')
+        for number in range(50, 1000):
+            table[str(number)] = number
+        frozen = table.freeze()
+        self.assertEqual(frozen.distances.typecode, 'h')
+        self.assertEqual(frozen.distances.itemsize, 2)
+        for number in range(1000):
+            self.assertEqual(frozen[str(number)], number)
+
+    def test_rejects_writes(self):
+        table = LinearProbeTable(19)
+        for name in NAMES:
+            table[name] = name
+        frozen = table.freeze()
+        for write in [lambda: frozen.__setitem__("Joe", 1), lambda: frozen.insert("Joe", 1),
+                      lambda: frozen.__delitem__("Eva"), lambda: frozen.pop("Eva"),
+                      lambda: frozen.setdefault("Joe", 1), lambda: frozen.update_with("Eva", len),
+                      lambda: frozen.insert_many([("Joe", 1)]), lambda: frozen.bulk_insert(["Joe"])]:
+            self.assertRaises(TypeError, write)
+        self.assertEqual(len(frozen), len(NAMES))
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertRaises(ValueError, lambda: FrozenHashTable(table, 1))
+
+        # the snapshot does not follow the table
+        table["Joe"] = "Joe"
+        self.assertNotIn("Joe", frozen)
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests the registry of hash strategies and the tables built with them.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from hash_functions import HASH_MASK, HASH_FUNCTIONS, key_type_hash, make_hash_function, register_hash_function, siphash24
+from hash_table import LinearProbeTable
+from swiss_table import SwissTable
+import table_analysis
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+class TestHashFunctions(unittest.TestCase):
+    """ Testing the hash strategies. """
+
+    def test_known_values(self):
+        # reference vectors of SipHash-2-4 with key 00 01 .. 0f
+        k0 = int.from_bytes(bytes(range(8)), 'little')
+        k1 = int.from_bytes(bytes(range(8, 16)), 'little')
+        self.assertEqual(siphash24(k0, k1, b""), 0x726fdb47dd0e0e31)
+        self.assertEqual(siphash24(k0, k1, bytes(range(15))), 0xa129ca6149be45e5)
+        self.assertEqual(make_hash_function("siphash", key=k0 | k1 << 64)(""), 0x726fdb47dd0e0e31 & HASH_MASK)
+
+        # reference vector of 64-bit FNV-1a
+        self.assertEqual(make_hash_function("fnv1a")("a"), 0xaf63dc4c8601ec8c & HASH_MASK)
+
+        self.assertEqual(make_hash_function("polynomial", base=1)("abc"), make_hash_function("polynomial", base=1)("cab"))
+        self.assertEqual(make_hash_function("polynomial", base=256)("ab"), ord("a") * 256 + ord("b"))
+
+    def test_universal_is_table_default(self):
+        table = LinearProbeTable(19)
+        universal = make_hash_function("universal")
+        for name in NAMES:
+            self.assertEqual(universal(name), table.hash(name))
+
+    def test_codes_fit_63_bits(self):
+        for name, parameters, keys in [("polynomial", {"base": 250726}, NAMES), ("fnv1a", {}, NAMES),
+                                       ("siphash", {"key": 12345}, NAMES), ("multiply_shift", {}, [0, 1, -1, 2 ** 70])]:
+            hash_function = make_hash_function(name, **parameters)
+            for key in keys:
+                self.assertTrue(0 <= hash_function(key) <= HASH_MASK, name)
+
+    def test_registry(self):
+        self.assertRaises(ValueError, lambda: make_hash_function("missing"))
+        register_hash_function("length", lambda: len)
+        try:
+            self.assertEqual(make_hash_function("length")("abc"), 3)
+        finally:
+            del HASH_FUNCTIONS["length"]
+
+    def test_tables_take_strategy(self):
+        for name in ("polynomial", "fnv1a", "siphash"):
+            for table_type in (LinearProbeTable, table_analysis.LinearProbeTable):
+                table = table_type(19, hash_function=make_hash_function(name))
+                for number in range(100):
+                    table[str(number)] = number
+                for number in range(100):
+                    self.assertEqual(table[str(number)], number)
+                self.assertGreater(table.statistics()[3], 0)
+
+        table = LinearProbeTable(19, hash_function=make_hash_function("multiply_shift"))
+        for number in range(100):
+            table[number] = number
+        self.assertEqual(sorted(table.values()), list(range(100)))
+
+    def test_key_types(self):
+        self.assertEqual(key_type_hash(bytes)(b"Eva"), LinearProbeTable(19).hash("Eva"))
+        tuple_hash = key_type_hash(tuple)
+        self.assertNotEqual(tuple_hash(("Eva", 1)), tuple_hash((1, "Eva")))
+        self.assertNotEqual(tuple_hash(((1, 2), 3)), tuple_hash((1, (2, 3))))
+        self.assertNotEqual(tuple_hash(()), tuple_hash((0,)))
+        # equal keys get equal codes, whatever the numeric types of their elements
+        for key in [("coal", True), ("coal", 1.0), ("coal", Fraction(1)), ("coal", Decimal(1)), ("coal", 1 + 0j)]:
+            self.assertEqual(key, ("coal", 1))
+            self.assertEqual(tuple_hash(key), tuple_hash(("coal", 1)), key)
+        self.assertNotEqual(tuple_hash(("coal", 1.5)), tuple_hash(("coal", 1)))
+        self.assertTrue(0 <= tuple_hash((float("nan"), float("inf"))) <= HASH_MASK)
+        table = LinearProbeTable(19, key_type=tuple)
+        table[("coal", 1)] = "coal"
+        self.assertEqual(table[("coal", True)], "coal")
+        self.assertEqual(table[("coal", 1.0)], "coal")
+        for key in [(), ("Eva", 1, b"x", (2.5, None)), (-1, 2 ** 70)]:
+            self.assertTrue(0 <= tuple_hash(key) <= HASH_MASK)
+        self.assertRaises(ValueError, lambda: key_type_hash(float))
+        self.assertRaises(ValueError, lambda: LinearProbeTable(19, key_type=list))
+
+        for key_type, make_key in [(int, lambda number: number * 7919), (bytes, lambda number: str(number).encode()),
+                                   (tuple, lambda number: ("coal", number))]:
+            for table_type in (LinearProbeTable, SwissTable):
+                with self.subTest(key_type=key_type.__name__, table_type=table_type.__name__):
+                    table = table_type(19, key_type=key_type)
+                    self.assertIs(table.hash, key_type_hash(key_type))
+                    for number in range(300):
+                        table[make_key(number)] = number
+                    for number in range(300):
+                        self.assertEqual(table[make_key(number)], number)
+                    self.assertNotIn(make_key(300), table)
+                    del table[make_key(0)]
+                    self.assertEqual(len(table), 299)
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -2,7 +2,10 @@
 Tests basic functionality of the hash table methods, such as statistics.
 """
 
+from chaining_hash_table import ChainingHashTable
+from cuckoo_hash_table import CuckooHashTable
 from hash_table import LinearProbeTable
+import table_analysis
 import unittest
 
 __author__ = "Jackson Goerner"
@@ -47,6 +50,121 @@ class TestHashTable(unittest.TestCase):
         self.assertGreaterEqual(probe_max, 3)    # Jon: 3  + Whatever rehash caused
         self.assertEqual(rehash, 1)              # 1 rehash
 
+    def test_insert_many(self):
+        table = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        pairs = [("key" + str(number), number) for number in range(500)]
+        table.insert_many(pairs)
+        self.assertEqual(table.statistics()[3], 1)  # grown once up front
+        self.assertEqual(len(table), 500)
+        self.assertEqual(table.get_many(["key7", "key499"]), [7, 499])
+        self.assertRaises(KeyError, lambda: table.get_many(["key7", "missing"]))
+
+        # inserting existing keys updates them
+        table.insert_many([("key7", "seven")])
+        self.assertEqual(table["key7"], "seven")
+        self.assertEqual(len(table), 500)
+
+    def test_merge(self):
+        first = LinearProbeTable(10)
+        second = LinearProbeTable(10)
+        for name in "Eva, Amy, Tim".split(", "):
+            first[name] = 1
+        for name in "Tim, Ron, Jan".split(", "):
+            second[name] = 2
+        first.insert_many(second)
+        self.assertEqual(sorted(first.keys()), ["Amy", "Eva", "Jan", "Ron", "Tim"])
+        self.assertEqual(first["Tim"], 2)
+
+        # a table hashing differently is hashed again
+        other = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        other.hash = silly_hash
+        other.insert_many(first)
+        self.assertEqual(other.get_many(["Eva", "Tim"]), [1, 2])
+
+        # any other table is merged through its items() view
+        for table_type in (ChainingHashTable, CuckooHashTable):
+            with self.subTest(table_type=table_type.__name__):
+                source = table_type(19)
+                source["Eva"] = 1
+                source["Tim"] = 2
+                merged = LinearProbeTable(19)
+                merged.insert_many(source)
+                self.assertEqual(sorted(merged.items()), [("Eva", 1), ("Tim", 2)])
+        merged = LinearProbeTable(19)
+        merged.insert_many({"Eva": 1, "Tim": 2})
+        self.assertEqual(sorted(merged.items()), [("Eva", 1), ("Tim", 2)])
+
+    def test_single_probe_operations(self):
+        table = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", "):
+            table[name] = name + "-value"
+
+        self.assertEqual(table.get("Jim"), "Jim-value")
+        self.assertIsNone(table.get("Joe"))
+        self.assertEqual(table.get("Joe", 0), 0)
+
+        self.assertEqual(table.setdefault("Jim", "other"), "Jim-value")
+        self.assertEqual(table.setdefault("Joe", "Joe-value"), "Joe-value")
+        self.assertEqual(table["Joe"], "Joe-value")
+
+        counts = LinearProbeTable(10)
+        for word in "a b a c a b".split():
+            counts.update_with(word, lambda count: count + 1, 0)
+        self.assertEqual([counts["a"], counts["b"], counts["c"]], [3, 2, 1])
+
+        # Jim, Jon and Joe all probe past Jan: removing it must keep them reachable
+        self.assertEqual(table.pop("Jan"), "Jan-value")
+        self.assertNotIn("Jan", table)
+        for name in ["Jim", "Jon", "Joe"]:
+            self.assertEqual(table[name], name + "-value")
+        self.assertEqual(len(table), 10)
+        self.assertEqual(table.pop("Jan", None), None)
+        self.assertRaises(KeyError, lambda: table.pop("Jan"))
+
+    def test_delete(self):
+        for table_type in (LinearProbeTable, table_analysis.LinearProbeTable):
+            table = table_type(10, tablesize_override=FIX_TABLESIZE)
+            table.hash = silly_hash
+            names = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+            for name in names:
+                table[name] = name + "-value"
+            for name in ["Amy", "Jan", "Jim"]:
+                del table[name]
+                names.remove(name)
+                self.assertNotIn(name, table)
+                for other in names:
+                    self.assertEqual(table[other], other + "-value")
+            self.assertEqual(len(table), 7)
+            self.assertRaises(KeyError, lambda: table.__delitem__("Amy"))
+            # backward shift leaves no tombstones: every slot is either empty or a live item
+            self.assertEqual(sum(1 for item in table.table if item is not None), 7)
+
+    def test_shrink(self):
+        table = LinearProbeTable(19, shrink_threshold=0.1)
+        for number in range(1000):
+            table[str(number)] = number
+        grown = len(table.table)
+        rehash = table.statistics()[3]
+        for number in range(995):
+            del table[str(number)]
+        self.assertLess(len(table.table), grown)
+        self.assertGreaterEqual(len(table.table), 19)
+        self.assertGreater(table.statistics()[3], rehash)
+        for number in range(995, 1000):
+            self.assertEqual(table[str(number)], number)
+
+        # without a threshold the table keeps its size
+        table = LinearProbeTable(19)
+        for number in range(100):
+            table[str(number)] = number
+        grown = len(table.table)
+        for number in range(100):
+            del table[str(number)]
+        self.assertEqual(len(table.table), grown)
+        self.assertRaises(ValueError, lambda: LinearProbeTable(19, shrink_threshold=0.5))
+
+
 if __name__ == '__main__':
 
     # running all the tests
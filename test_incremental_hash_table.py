@@ -0,0 +1,88 @@
+"""
+Tests the incremental rehashing of the hash table.
+"""
+
+from incremental_hash_table import IncrementalLinearProbeTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon, Joe, Sam, Max, Ivy, Zoe, Ben".split(", ")
+
+
+class TestIncrementalHashTable(unittest.TestCase):
+    """ Testing Incremental Hash Table functionality. """
+
+    def test_migration(self):
+        table = IncrementalLinearProbeTable(10, tablesize_override=FIX_TABLESIZE, migrate_step=2)
+        for name in NAMES[:10]:
+            table[name] = name + "-value"
+        self.assertFalse(table.is_migrating())
+
+        # The 11th insert starts the resize, but only moves a couple of slots.
+        table["Joe"] = "Joe-value"
+        self.assertTrue(table.is_migrating())
+        self.assertEqual(table.old_tablesize, FIX_TABLESIZE)
+        self.assertGreater(len(table.table), FIX_TABLESIZE)
+        self.assertLess(table.migration_progress(), 1.0)
+        self.assertEqual(table.statistics()[3], 1)
+
+        # Everything stays reachable while both arrays are alive.
+        for name in NAMES[:11]:
+            self.assertEqual(table[name], name + "-value")
+        self.assertRaises(KeyError, lambda: table["Bob"])
+
+        while table.is_migrating():
+            _ = "Bob" in table
+        self.assertEqual(table.statistics()[4], 1.0)
+        self.assertEqual(len(table), 11)
+        self.assertEqual(sorted(table.keys()), sorted(NAMES[:11]))
+
+    def test_update_during_migration(self):
+        table = IncrementalLinearProbeTable(10, tablesize_override=FIX_TABLESIZE, migrate_step=2)
+        for name in NAMES:
+            table[name] = name + "-value"
+        self.assertTrue(table.is_migrating())
+
+        for name in NAMES:
+            table[name] = name + "-new"
+        self.assertEqual(len(table), len(NAMES))
+        for name in NAMES:
+            self.assertEqual(table[name], name + "-new")
+        self.assertEqual(sorted(table.values()), sorted(name + "-new" for name in NAMES))
+
+    def test_pop_during_migration(self):
+        table = IncrementalLinearProbeTable(10, tablesize_override=FIX_TABLESIZE, migrate_step=2)
+        for name in NAMES:
+            table[name] = name + "-value"
+        self.assertTrue(table.is_migrating())
+
+        for name in NAMES[::2]:
+            self.assertEqual(table.pop(name), name + "-value")
+        while table.is_migrating():
+            _ = "Bob" in table
+        for name in NAMES:
+            self.assertEqual(table.get(name), None if name in NAMES[::2] else name + "-value")
+        self.assertEqual(len(table), len(NAMES) // 2)
+
+    def test_scan_during_migration(self):
+        table = IncrementalLinearProbeTable(10, tablesize_override=FIX_TABLESIZE, migrate_step=2)
+        for name in NAMES[:11]:
+            table[name] = name + "-value"
+        self.assertTrue(table.is_migrating())
+        self.assertEqual(len(table.probe_lengths()), 11)
+        self.assertEqual(sum(table.probe_histogram()), 11)
+        self.assertEqual(sum(table.cluster_sizes()), 11)
+        self.assertEqual(table.scan_statistics()[1], sum(table.probe_lengths()))
+        for name in NAMES[:11]:
+            self.assertEqual(table[name], name + "-value")
+
+    def test_invalid_step(self):
+        self.assertRaises(ValueError, lambda: IncrementalLinearProbeTable(10, migrate_step=1))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
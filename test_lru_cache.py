@@ -0,0 +1,127 @@
+"""
+Tests the LRU cache and its decorator.
+"""
+
+from lru_cache import LRUCache, lru_cache
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+class TestLRUCache(unittest.TestCase):
+    """ Testing LRU Cache functionality. """
+
+    def test_eviction(self):
+        cache = LRUCache(3)
+        for name in NAMES[:3]:
+            cache.put(name, name + "-value")
+        self.assertEqual(cache.keys(), ["Tim", "Amy", "Eva"])
+
+        self.assertEqual(cache.get("Eva"), "Eva-value")  # Eva is now the most recent
+        cache.put("Ron", "Ron-value")                     # evicts Amy, the least recent
+        self.assertEqual(cache.keys(), ["Ron", "Eva", "Tim"])
+        self.assertNotIn("Amy", cache)
+        self.assertEqual(cache.get("Amy"), None)
+        self.assertEqual(cache.get("Amy", "gone"), "gone")
+
+        cache.put("Tim", "Tim-new")  # an update makes Tim the most recent without evicting
+        self.assertEqual(cache.keys(), ["Tim", "Ron", "Eva"])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.statistics(), (1, 2, 1))
+
+    def test_many(self):
+        cache = LRUCache(50)
+        for number in range(1000):
+            cache.put("key" + str(number), number)
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.statistics()[2], 950)
+        for number in range(950, 1000):
+            self.assertEqual(cache.get("key" + str(number)), number)
+        # the index never needed to grow
+        self.assertEqual(cache.index.statistics()[3], 0)
+
+    def test_pop_and_clear(self):
+        cache = LRUCache(5)
+        for name in NAMES[:5]:
+            cache.put(name, name + "-value")
+        self.assertEqual(cache.pop("Ron"), "Ron-value")
+        self.assertEqual(cache.pop("Ron", None), None)
+        self.assertRaises(KeyError, lambda: cache.pop("Ron"))
+        self.assertEqual(cache.keys(), ["Jan", "Tim", "Amy", "Eva"])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.keys(), [])
+        self.assertRaises(ValueError, lambda: LRUCache(0))
+
+    def test_decorator(self):
+        calls = []
+
+        @lru_cache(2)
+        def square(number, offset=0):
+            calls.append(number)
+            return number * number + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(square(4), 16)  # evicts square(3)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3, 3, 4, 3])
+        self.assertEqual(square.cache.statistics(), (1, 4, 2))
+        self.assertEqual(square.__name__, "square")
+
+    def test_decorator_per_function(self):
+        memo = lru_cache(10)
+
+        @memo
+        def square(number):
+            return number * number
+
+        @memo
+        def negate(number):
+            return -number
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(negate(3), -3)
+        self.assertIsNot(square.cache, negate.cache)
+        self.assertEqual(len(square.cache), 1)
+        self.assertRaises(ValueError, lambda: lru_cache(0))
+
+    def test_key_types(self):
+        cache = LRUCache(2, int)
+        cache.put(1, "one")
+        cache.put(2, "two")
+        cache.put(3, "three")
+        self.assertEqual(cache.keys(), [3, 2])
+        self.assertEqual(cache.get(2), "two")
+        self.assertRaises(ValueError, lambda: LRUCache(2, list))
+
+        @lru_cache(4)
+        def describe(*args, **kwargs):
+            return (args, kwargs)
+
+        self.assertEqual(describe("coal", 3, day=(1, 2)), (("coal", 3), {"day": (1, 2)}))
+        self.assertEqual(describe("coal", 3, day=(1, 2)), (("coal", 3), {"day": (1, 2)}))
+        self.assertEqual(describe("coal", 3), (("coal", 3), {}))
+        self.assertEqual(describe.cache.statistics(), (1, 2, 0))
+        self.assertRaises(TypeError, lambda: describe([1]))
+
+    def test_decorator_caches_none(self):
+        calls = []
+
+        @lru_cache(4)
+        def nothing(number):
+            calls.append(number)
+            return None
+
+        nothing(1)
+        nothing(1)
+        self.assertEqual(calls, [1])
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
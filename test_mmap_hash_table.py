@@ -0,0 +1,112 @@
+"""
+Tests the memory-mapped hash table and its builders.
+"""
+
+from hash_table import LinearProbeTable
+from mmap_hash_table import MmapHashTable, build_from_key_file, build_from_table, write_mmap_table
+import os
+import tempfile
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestMmapHashTable(unittest.TestCase):
+    """ Testing Memory-Mapped Hash Table functionality. """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "names.table")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_from_table(self):
+        table = LinearProbeTable(19)
+        for name in NAMES:
+            table[name] = name + "-value"
+        table["Ann"] = ["a", "list", 1]
+        table["Jim"] = b"bytes"
+        table["Jon"] = None
+        table["Émile"] = "café"
+        build_from_table(table, self.path)
+
+        with MmapHashTable(self.path) as mapped:
+            self.assertEqual(len(mapped), len(table))
+            for key in table.keys():
+                self.assertIn(key, mapped)
+                self.assertEqual(mapped[key], table[key])
+            self.assertNotIn("Joe", mapped)
+            self.assertRaises(KeyError, lambda: mapped["Joe"])
+            self.assertEqual(mapped.get("Joe", "none"), "none")
+            self.assertEqual(mapped.get("Jon", "none"), None)
+            self.assertEqual(sorted(mapped), sorted(table))
+            self.assertEqual(sorted(mapped.items(), key=str), sorted(table.items(), key=str))
+
+    def test_rehashes_other_hash(self):
+        table = LinearProbeTable(10, tablesize_override=FIX_TABLESIZE, hash_function=silly_hash)
+        for name in NAMES:
+            table[name] = len(name)
+        build_from_table(table, self.path)
+        with MmapHashTable(self.path) as mapped:
+            for name in NAMES:
+                self.assertEqual(mapped[name], 3)
+            self.assertEqual(mapped.hash("Eva"), LinearProbeTable(19).hash("Eva"))
+
+    def test_int_keys(self):
+        table = LinearProbeTable(19, key_type=int)
+        for number in range(-50, 500, 7):
+            table[number] = number * 2
+        build_from_table(table, self.path, int)
+        with MmapHashTable(self.path) as mapped:
+            self.assertIs(mapped.key_type, int)
+            for number in range(-50, 500, 7):
+                self.assertEqual(mapped[number], number * 2)
+            self.assertNotIn(-49, mapped)
+        self.assertRaises(ValueError, lambda: write_mmap_table(self.path, [], tuple))
+
+    def test_key_type_of_table(self):
+        table = LinearProbeTable(19, key_type=int)
+        for number in range(100):
+            table[number] = str(number)
+        build_from_table(table, self.path)
+        with MmapHashTable(self.path) as mapped:
+            self.assertIs(mapped.key_type, int)
+            self.assertEqual(dict(mapped.items()), dict(table.items()))
+            # keys equal to a stored int are found like they are in the table
+            for key in (True, False):
+                self.assertEqual(key in mapped, key in table)
+                self.assertEqual(mapped.get(key), table.get(key))
+                self.assertEqual(mapped[key], table[key])
+            self.assertRaises(TypeError, lambda: mapped.get(1.5))
+
+    def test_from_key_file(self):
+        cities = os.path.join(os.path.dirname(os.path.abspath(__file__)), "aust_cities.txt")
+        build_from_key_file(cities, self.path)
+        with open(cities) as city_file:
+            names = [line.strip() for line in city_file]
+        with MmapHashTable(self.path) as mapped:
+            self.assertEqual(len(mapped), len(set(names)))
+            for name in names:
+                self.assertEqual(mapped[name], name)
+            self.assertGreater(mapped.tablesize, 2 * len(mapped))
+
+        # an empty table and a file that is not a table
+        write_mmap_table(self.path, [])
+        with MmapHashTable(self.path) as mapped:
+            self.assertEqual(len(mapped), 0)
+            self.assertNotIn("Sydney", mapped)
+        self.assertRaises(ValueError, lambda: MmapHashTable(cities))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests the parallel array hash table gives the same results as LinearProbeTable.
+"""
+
+from hash_table import LinearProbeTable
+from parallel_hash_table import ParallelLinearProbeTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestParallelHashTable(unittest.TestCase):
+    """ Testing Parallel Array Hash Table functionality. """
+
+    def test_initialisation(self):
+        table = ParallelLinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        conflict, probe_total, probe_max, rehash = table.statistics()
+        self.assertEqual(conflict, 4)     # Tim, Ann, Jim, Jon
+        self.assertEqual(probe_total, 8)  # Tim: 1, Ann: 2, Jim: 2, Jon: 3
+        self.assertEqual(probe_max, 3)    # Jon: 3
+        self.assertEqual(rehash, 0)       # No rehash
+
+        self.assertEqual(table["Tim"], "Tim-value")
+        self.assertRaises(KeyError, lambda: table["Joe"])
+
+        table["Tim"] = "Tim-new"
+        self.assertEqual(table["Tim"], "Tim-new")
+        self.assertEqual(len(table), len(NAMES))
+
+    def test_same_as_linear_probe_table(self):
+        table = ParallelLinearProbeTable(19)
+        reference = LinearProbeTable(19)
+        for number in range(500):
+            key = "key" + str(number)
+            table[key] = number
+            reference[key] = number
+        self.assertEqual(table.statistics(), reference.statistics())
+        self.assertEqual(len(table.hashes), len(reference.table))
+        self.assertEqual(list(table.keys()), list(reference.keys()))
+        self.assertEqual(list(table.values()), list(reference.values()))
+        self.assertEqual(str(table), str(reference))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
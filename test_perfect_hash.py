@@ -0,0 +1,62 @@
+"""
+Tests the minimal perfect hash builder and the name catalogs built with it.
+"""
+
+from cave import CAVE_NAMES
+from name_catalogs import CATALOGS, name_index
+from perfect_hash import PerfectHash
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+class TestPerfectHash(unittest.TestCase):
+    """ Testing Minimal Perfect Hash functionality. """
+
+    def test_index(self):
+        names = PerfectHash(NAMES)
+        self.assertEqual(len(names), len(NAMES))
+        self.assertEqual(sorted(names.slots), list(range(len(NAMES))))  # minimal: one slot per key
+        for index, name in enumerate(NAMES):
+            self.assertEqual(names.index(name), index)
+            self.assertEqual(names[name], index)
+            self.assertIn(name, names)
+        for name in ["Bob", "", "eva", "Eva "]:
+            self.assertEqual(names.index(name), -1)
+            self.assertNotIn(name, names)
+        self.assertRaises(KeyError, lambda: names["Bob"])
+
+    def test_many_keys(self):
+        keys = ["key" + str(number) for number in range(2000)]
+        names = PerfectHash(keys)
+        for index, key in enumerate(keys):
+            self.assertEqual(names.index(key), index)
+        self.assertEqual(names.index("key2000"), -1)
+
+    def test_serialise(self):
+        names = PerfectHash(CAVE_NAMES)
+        loaded = PerfectHash.loads(names.dumps())
+        self.assertEqual(loaded.seed, names.seed)
+        for index, name in enumerate(CAVE_NAMES):
+            self.assertEqual(loaded.index(name), index)
+        self.assertRaises(ValueError, lambda: PerfectHash.loads("{}"))
+
+    def test_edge_cases(self):
+        self.assertEqual(PerfectHash([]).index("Eva"), -1)
+        self.assertEqual(PerfectHash(["Eva"]).index("Eva"), 0)
+        self.assertRaises(ValueError, lambda: PerfectHash(["Eva", "Amy", "Eva"]))
+
+    def test_catalogs(self):
+        for catalog, names in CATALOGS.items():
+            index = name_index(catalog)
+            for position, name in enumerate(names):
+                self.assertEqual(index.index(name), position)
+        self.assertRaises(KeyError, lambda: name_index("dragon"))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
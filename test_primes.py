@@ -0,0 +1,114 @@
+"""
+Tests the segmented prime sieve behind LargestPrimeIterator.
+"""
+
+import primes
+from hash_table import LinearProbeTable
+from primes import LargestPrimeIterator, largest_prime_below, next_prime, prev_prime
+import table_analysis
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+
+def is_prime(number):
+    return number > 1 and all(number % divisor != 0 for divisor in range(2, int(number ** 0.5) + 1))
+
+
+class TestPrimes(unittest.TestCase):
+    """ Testing the prime sieve and its cache. """
+
+    def setUp(self):
+        primes.clear_prime_cache()
+
+    def test_largest_prime_below(self):
+        expected = None
+        for bound in range(3, 3000):
+            if is_prime(bound - 1):
+                expected = bound - 1
+            self.assertEqual(largest_prime_below(bound), expected)
+        self.assertRaises(ValueError, lambda: largest_prime_below(2))
+
+    def test_segment_boundaries(self):
+        size = primes.SEGMENT_SIZE
+        for bound in (size - 1, size, size + 1, size + 20, 3 * size + 1, 1000081, 2 ** 40):
+            prime = largest_prime_below(bound)
+            self.assertLess(prime, bound)
+            self.assertTrue(is_prime(prime))
+            self.assertFalse(any(is_prime(number) for number in range(prime + 1, bound)))
+
+    def test_iterator(self):
+        iterator = LargestPrimeIterator(19, 2)
+        self.assertEqual([next(iterator) for _ in range(4)], [17, 31, 61, 113])
+        # small bounds are looked up in the cached sieve
+        self.assertEqual(list(primes._segments), [0])
+
+    def test_prev_prime_sieve_limit(self):
+        limit = primes.SIEVE_LIMIT
+        for bound in (3, 4, 1000081, limit - 1, limit, limit + 1, limit + 100):
+            self.assertEqual(prev_prime(bound), largest_prime_below(bound), bound)
+        self.assertRaises(ValueError, lambda: prev_prime(2))
+
+    def test_cache_eviction(self):
+        for index in range(primes.MAX_CACHED_SEGMENTS + 10):
+            largest_prime_below((index + 1) * primes.SEGMENT_SIZE)
+        self.assertEqual(len(primes._segments), primes.MAX_CACHED_SEGMENTS)
+        self.assertNotIn(0, primes._segments)
+
+        # reusing a cached segment makes it the most recently used
+        largest_prime_below(20 * primes.SEGMENT_SIZE)
+        self.assertEqual(next(reversed(primes._segments)), 19)
+
+    def test_is_prime(self):
+        for number in list(range(-5, 3000)) + list(range(primes.SEGMENT_SIZE - 100, primes.SEGMENT_SIZE + 3000)):
+            self.assertEqual(primes.is_prime(number), is_prime(number), number)
+        # Carmichael numbers and strong pseudoprimes to small bases
+        for number in (561, 41041, 3215031751, 3825123056546413051):
+            self.assertFalse(primes.is_prime(number), number)
+        for number in (1000000007, 2 ** 61 - 1, 18446744073709551557):
+            self.assertTrue(primes.is_prime(number), number)
+
+    def test_next_and_prev_prime(self):
+        self.assertEqual(next_prime(-3), 2)
+        self.assertEqual(next_prime(2), 3)
+        self.assertEqual(next_prime(19), 23)
+        self.assertEqual(next_prime(10 ** 9), 1000000007)
+        self.assertEqual(next_prime(2 ** 64 - 59 - 1), 2 ** 64 - 59)
+        self.assertEqual(prev_prime(3), 2)
+        self.assertEqual(prev_prime(23), 19)
+        self.assertEqual(prev_prime(10 ** 9), 999999937)
+        self.assertEqual(prev_prime(2 ** 64), 2 ** 64 - 59)
+        self.assertRaises(ValueError, lambda: prev_prime(2))
+
+    def test_growth_ladder(self):
+        ladder = primes.growth_ladder()
+        self.assertEqual(ladder, primes.build_growth_ladder())
+        self.assertTrue(all(primes.is_prime(prime) for prime in ladder))
+        self.assertLessEqual(ladder[-1], 2 ** 40)
+        for size in primes.ANALYSIS_TABLE_SIZES:
+            self.assertIn(size, ladder)
+
+        self.assertEqual(primes.next_growth_prime(19), 37)
+        self.assertGreater(primes.next_growth_prime(20021), 1.9 * 20021)
+        for size in list(range(2, 500)) + [10 ** 6, 2 ** 39 + 7, 2 ** 41]:
+            grown = primes.next_growth_prime(size)
+            self.assertGreater(grown, size)
+            self.assertLess(grown, max(2 * size, 4))
+            self.assertTrue(primes.is_prime(grown))
+
+    def test_table_sizes(self):
+        for table_type in (LinearProbeTable, table_analysis.LinearProbeTable):
+            table = table_type(4)
+            self.assertEqual(table.tablesize, 5)
+            for number in range(20):
+                table[str(number)] = number
+            # the table grows on every rehash, even from tiny sizes
+            self.assertGreater(table.tablesize, 40)
+            for number in range(20):
+                self.assertEqual(table[str(number)], number)
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
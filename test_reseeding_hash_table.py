@@ -0,0 +1,119 @@
+"""
+Tests the hash table re-seeding its hash function when probe chains degrade.
+"""
+
+from hash_functions import make_hash_function
+from random_gen import RandomGen
+from reseeding_hash_table import ReseedingLinearProbeTable
+import itertools
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+# every permutation of the same letters, they all collide under a sum of characters
+ANAGRAMS = ["".join(letters) for letters in itertools.permutations("abcdef")]
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestReseedingHashTable(unittest.TestCase):
+    """ Testing Re-seeding Hash Table functionality. """
+
+    def setUp(self):
+        RandomGen.set_seed(123)
+
+    def test_anagrams(self):
+        table = ReseedingLinearProbeTable(2000, max_probe=16, hash_function=make_hash_function("polynomial", base=1))
+        tablesize = table.tablesize
+        for number, key in enumerate(ANAGRAMS):
+            table[key] = number
+        self.assertEqual(table.tablesize, tablesize)  # re-seeded at the same size, no rehash
+        self.assertGreaterEqual(table.statistics()[4], 1)
+        self.assertIsNotNone(table.seed)
+        self.assertLessEqual(max(table.probe_lengths()), 16)
+        for number, key in enumerate(ANAGRAMS):
+            self.assertEqual(table[key], number)
+        self.assertEqual(len(table), len(ANAGRAMS))
+
+    def test_no_reseed(self):
+        table = ReseedingLinearProbeTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        self.assertEqual(table.statistics(), (4, 8, 3, 0, 0))
+        self.assertIsNone(table.seed)
+
+    def test_reseed_limit(self):
+        table = ReseedingLinearProbeTable(50, tablesize_override=101, max_probe=0)
+        for number in range(50):
+            table["key" + str(number)] = number
+        # no hash keeps 50 keys in 101 slots all at home, re-seeding stops after MAX_RESEEDS
+        self.assertEqual(table.statistics()[3:], (0, ReseedingLinearProbeTable.MAX_RESEEDS))
+        for number in range(50):
+            self.assertEqual(table["key" + str(number)], number)
+
+    def test_single_probe_operations(self):
+        table = ReseedingLinearProbeTable(2000, max_probe=16, hash_function=make_hash_function("polynomial", base=1))
+        for _ in range(2):
+            for key in ANAGRAMS:
+                table.update_with(key, lambda count: count + 1, 0)
+        for key in ANAGRAMS:
+            self.assertEqual(table.setdefault(key, 5), 2)
+        self.assertGreaterEqual(table.statistics()[4], 1)
+
+    def test_reseed_during_batch(self):
+        for insert in (lambda table: table.insert_many(zip(ANAGRAMS, range(len(ANAGRAMS)))),
+                       lambda table: table.bulk_insert(ANAGRAMS, list(range(len(ANAGRAMS))))):
+            table = ReseedingLinearProbeTable(2000, max_probe=16, hash_function=make_hash_function("polynomial", base=1))
+            insert(table)
+            self.assertGreaterEqual(table.statistics()[4], 1)
+            self.assertEqual(len(table), len(ANAGRAMS))
+            for number, key in enumerate(ANAGRAMS):
+                self.assertIn(key, table)
+                self.assertEqual(table[key], number)
+            # inserting the batch again only updates
+            insert(table)
+            self.assertEqual(len(table), len(ANAGRAMS))
+            self.assertIs(table.batch_seed, ReseedingLinearProbeTable.NO_BATCH)
+
+    def test_key_types(self):
+        keys = {int: [number * 19 for number in range(100)],
+                bytes: [key.encode() for key in ANAGRAMS],
+                tuple: [("ore", number * 19) for number in range(100)]}
+        for key_type, type_keys in keys.items():
+            with self.subTest(key_type=key_type.__name__):
+                table = ReseedingLinearProbeTable(200, tablesize_override=FIX_TABLESIZE * 11, max_probe=4,
+                                                  hash_function=lambda key: 0, key_type=key_type)
+                for number, key in enumerate(type_keys):
+                    table[key] = number
+                self.assertGreaterEqual(table.statistics()[4], 1)
+                for number, key in enumerate(type_keys):
+                    self.assertEqual(table[key], number)
+                self.assertEqual(len(table), len(type_keys))
+        self.assertRaises(ValueError, lambda: ReseedingLinearProbeTable(19, key_type=float))
+
+    def test_update_far_key(self):
+        table = ReseedingLinearProbeTable(10, tablesize_override=FIX_TABLESIZE, max_probe=1)
+        table.hash = silly_hash
+        table.reseeds_left = 0
+        for name in ["Jan", "Jim", "Jon"]:  # the same home, Jon sits 2 slots away from it
+            table[name] = 1
+        table.reseeds_left = ReseedingLinearProbeTable.MAX_RESEEDS
+        table["Jon"] = 2
+        table.update_with("Jon", lambda data: data + 1)
+        self.assertEqual(table.statistics()[4], 0)
+        self.assertEqual(table.reseeds_left, ReseedingLinearProbeTable.MAX_RESEEDS)
+        self.assertEqual(table["Jon"], 3)
+
+    def test_invalid_max_probe(self):
+        self.assertRaises(ValueError, lambda: ReseedingLinearProbeTable(10, max_probe=-1))
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests the Robin Hood hash table, in particular that it can be swapped in for LinearProbeTable.
+"""
+
+from hash_table import LinearProbeTable
+from robin_hood_table import RobinHoodTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestRobinHoodTable(unittest.TestCase):
+    """ Testing Robin Hood Table functionality. """
+
+    def check_distances(self, table):
+        for position in range(len(table.table)):
+            item = table.table[position]
+            if item is not None:
+                home = table.hash(item[0]) % len(table.table)
+                self.assertEqual((home + item[3]) % len(table.table), position)
+
+    def test_initialisation(self):
+        table = RobinHoodTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        conflict, probe_total, probe_max, rehash = table.statistics()
+        self.assertEqual(conflict, 4)     # Tim, Ann, Jim, Jon
+        self.assertEqual(probe_max, 2)    # LinearProbeTable gets 3 for Jon
+        self.assertEqual(rehash, 0)
+        self.check_distances(table)
+
+        for name in NAMES:
+            self.assertEqual(table[name], name + "-value")
+        self.assertRaises(KeyError, lambda: table["Joe"])
+        self.assertFalse("Bob" in table)
+
+        table["Tim"] = "Tim-new"
+        self.assertEqual(table["Tim"], "Tim-new")
+        self.assertEqual(len(table), len(NAMES))
+
+    def test_rehash(self):
+        table = RobinHoodTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES + ["Joe"]:
+            table[name] = name + "-value"
+        self.assertGreater(len(table.table), FIX_TABLESIZE, "Table not being rehashed.")
+        self.assertEqual(table.statistics()[3], 1)
+        for name in NAMES + ["Joe"]:
+            self.assertEqual(table[name], name + "-value")
+
+    def test_high_load(self):
+        keys = [str(number) for number in range(900)]
+        table = RobinHoodTable(1000, max_load=0.9)
+        linear = LinearProbeTable(1000)
+        for key in keys:
+            table[key] = key
+            linear[key] = key
+        self.assertEqual(table.statistics()[3], 0)
+        self.check_distances(table)
+        for key in keys:
+            self.assertEqual(table[key], key)
+        self.assertLessEqual(table.statistics()[2], linear.statistics()[2])
+        self.assertRaises(ValueError, lambda: RobinHoodTable(10, max_load=1))
+
+    def test_insert_many_max_load(self):
+        pairs = [(str(number), number) for number in range(900)]
+        table = RobinHoodTable(19, max_load=0.9)
+        table.insert_many(pairs)
+        self.assertEqual(table.statistics()[3], 1)
+        self.assertLess(table.tablesize, 1100)  # sized for 0.9, not a half
+        table = RobinHoodTable(19, max_load=0.3)
+        table.insert_many(pairs)
+        self.assertEqual(table.statistics()[3], 1)
+        self.assertLessEqual(len(table), table.tablesize * 0.3)
+        self.check_distances(table)
+        for key, number in pairs:
+            self.assertEqual(table[key], number)
+
+    def test_pop(self):
+        table = RobinHoodTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        for name in ["Jan", "Eva", "Jim"]:
+            self.assertEqual(table.pop(name), name + "-value")
+            self.check_distances(table)
+        for name in NAMES:
+            self.assertEqual(table.get(name), None if name in ["Jan", "Eva", "Jim"] else name + "-value")
+        self.assertEqual(table.setdefault("Jan", 1), 1)
+        self.check_distances(table)
+        self.assertEqual(len(table), len(NAMES) - 2)
+
+
+    def test_update_with_raising(self):
+        table = RobinHoodTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = 1
+
+        def fail(data):
+            raise ValueError(data)
+        self.assertRaises(ValueError, lambda: table.update_with("Bob", fail, 0))
+        self.assertRaises(ValueError, lambda: table.update_with("Dot", fail))
+        self.check_distances(table)
+        self.assertEqual(len(table), len(NAMES))
+        for name in NAMES:
+            self.assertEqual(table[name], 1)
+        self.assertFalse("Bob" in table)
+
+        self.assertEqual(table.update_with("Dot", lambda data: data + 1), 2)
+        # one probe sequence, no separate lookup before the insert
+        table._find = None
+        self.assertEqual(table.update_with("Bob", lambda data: data + 1, 0), 1)
+        del table._find
+        self.check_distances(table)
+        self.assertEqual(len(table), len(NAMES) + 1)
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
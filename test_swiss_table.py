@@ -0,0 +1,120 @@
+"""
+Tests the control byte hash table gives the same results as LinearProbeTable.
+"""
+
+from hash_table import LinearProbeTable
+from swiss_table import SwissTable
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+FIX_TABLESIZE = 19
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+
+
+def silly_hash(key):
+    return (ord(key[0]) % FIX_TABLESIZE)
+
+
+class TestSwissTable(unittest.TestCase):
+    """ Testing Swiss Table functionality. """
+
+    def check_control_bytes(self, table):
+        for position in range(len(table.table)):
+            item = table.table[position]
+            if item is None:
+                self.assertEqual(table.ctrl[position], SwissTable.EMPTY)
+            else:
+                self.assertEqual(table.ctrl[position], SwissTable._tag(item[2]))
+
+    def test_initialisation(self):
+        table = SwissTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        conflict, probe_total, probe_max, rehash = table.statistics()
+        self.assertEqual(conflict, 4)     # Tim, Ann, Jim, Jon
+        self.assertEqual(probe_total, 8)  # Tim: 1, Ann: 2, Jim: 2, Jon: 3
+        self.assertEqual(probe_max, 3)    # Jon: 3
+        self.assertEqual(rehash, 0)       # No rehash
+        self.check_control_bytes(table)
+
+        for name in NAMES:
+            self.assertEqual(table[name], name + "-value")
+        self.assertRaises(KeyError, lambda: table["Joe"])
+        self.assertFalse("Bob" in table)
+
+    def test_same_as_linear_probe_table(self):
+        table = SwissTable(19)
+        reference = LinearProbeTable(19)
+        for number in range(500):
+            key = "key" + str(number)
+            table[key] = number
+            reference[key] = number
+        self.assertEqual(table.statistics(), reference.statistics())
+        self.assertEqual(list(table.keys()), list(reference.keys()))
+        self.assertEqual(list(table.values()), list(reference.values()))
+        self.check_control_bytes(table)
+
+    def test_delete(self):
+        table = SwissTable(10, tablesize_override=FIX_TABLESIZE)
+        table.hash = silly_hash
+        for name in NAMES:
+            table[name] = name + "-value"
+        for name in ["Amy", "Jan", "Jim"]:
+            del table[name]
+            self.check_control_bytes(table)
+        for name in NAMES:
+            self.assertEqual(table.get(name), None if name in ["Amy", "Jan", "Jim"] else name + "-value")
+        self.assertEqual(table.pop("Jon"), "Jon-value")
+        self.assertEqual(len(table), len(NAMES) - 4)
+
+    def test_high_load(self):
+        keys = ["key" + str(number) for number in range(900)]
+        table = SwissTable(1000, max_load=0.95)
+        for key in keys:
+            table[key] = key
+        self.assertEqual(table.statistics()[3], 0)
+        self.check_control_bytes(table)
+        for key in keys:
+            self.assertEqual(table[key], key)
+            self.assertNotIn(key + "!", table)
+        self.assertRaises(ValueError, lambda: SwissTable(10, max_load=1))
+
+    def test_insert_many_max_load(self):
+        pairs = [(str(number), number) for number in range(700)]
+        table = SwissTable(19, max_load=0.875)
+        table.insert_many(pairs)
+        self.assertEqual(table.statistics()[3], 1)
+        self.assertLess(table.tablesize, 1000)  # sized for 0.875, not a half
+        self.check_control_bytes(table)
+        for key, number in pairs:
+            self.assertEqual(table[key], number)
+
+    def test_full_table(self):
+        table = SwissTable(5, tablesize_override=5, max_load=0.99)
+        for name in NAMES[:5]:
+            table[name] = name + "-value"
+        self.assertTrue(table.is_full())
+        self.assertNotIn("Bob", table)
+        self.assertEqual(table["Ron"], "Ron-value")
+        table["Bob"] = "Bob-value"
+        self.assertGreater(len(table.table), 5)
+        self.check_control_bytes(table)
+
+
+    def test_tags_of_short_keys(self):
+        table = SwissTable(200, hash_function=lambda key: ord(key[0]) * 256 + ord(key[1]))
+        keys = [chr(65 + number // 10) + chr(48 + number % 10) for number in range(100)]
+        for key in keys:
+            table[key] = key
+        self.check_control_bytes(table)
+        # codes under 2^16 have no high bits, the tags must still tell the keys apart
+        self.assertGreater(len({SwissTable._tag(table.hash(key)) for key in keys}), 50)
+        for key in keys:
+            self.assertEqual(table[key], key)
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()
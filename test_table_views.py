@@ -0,0 +1,125 @@
+"""
+Tests the live keys/values/items views of the hash tables and their export.
+"""
+
+from array import array
+import batch_hash
+from chaining_hash_table import ChainingHashTable
+from compact_hash_table import CompactLinearProbeTable
+from cuckoo_hash_table import CuckooHashTable
+from hash_table import LinearProbeTable
+from incremental_hash_table import IncrementalLinearProbeTable
+from parallel_hash_table import ParallelLinearProbeTable
+from table_views import TableView, TableViewsMixin
+import io
+import unittest
+
+__author__ = "Tan Jun Yu"
+
+NAMES = "Eva, Amy, Tim, Ron, Jan, Kim, Dot, Ann, Jim, Jon".split(", ")
+TABLE_TYPES = (LinearProbeTable, CompactLinearProbeTable, ParallelLinearProbeTable, IncrementalLinearProbeTable,
+               ChainingHashTable, CuckooHashTable)
+
+
+class TestTableViews(unittest.TestCase):
+    """ Testing Table Views functionality. """
+
+    def test_live_views(self):
+        for table_type in TABLE_TYPES:
+            with self.subTest(table_type=table_type.__name__):
+                table = table_type(19)
+                keys, values, items = table.keys(), table.values(), table.items()
+                self.assertEqual(len(keys), 0)
+                for name in NAMES:
+                    table[name] = len(name + "-value")
+                table["Eva"] = 3
+
+                self.assertEqual(len(keys), len(NAMES))
+                self.assertEqual(sorted(keys), sorted(NAMES))
+                self.assertEqual(sorted(table), sorted(NAMES))
+                self.assertEqual(list(values), [table[key] for key in keys])
+                self.assertEqual(list(items), list(zip(keys, values)))
+                self.assertIn("Kim", keys)
+                self.assertNotIn("Joe", keys)
+                self.assertIn(3, values)
+                self.assertNotIn(4, values)
+                self.assertIn(("Eva", 3), items)
+                self.assertNotIn(("Eva", 9), items)
+                self.assertNotIn(("Joe", 9), items)
+
+                del table["Kim"]
+                self.assertNotIn("Kim", keys)
+                self.assertEqual(len(items), len(NAMES) - 1)
+
+    def test_changed_during_iteration(self):
+        table = LinearProbeTable(19)
+        for name in NAMES:
+            table[name] = name
+        with self.assertRaises(RuntimeError):
+            for key in table.keys():
+                table[key + "!"] = key
+
+    def test_dump(self):
+        for table_type in TABLE_TYPES:
+            with self.subTest(table_type=table_type.__name__):
+                table = table_type(19)
+                for name in NAMES:
+                    table[name] = name + "-value"
+                output = io.StringIO()
+                table.dump(output)
+                self.assertEqual(output.getvalue(), str(table))
+                self.assertEqual(sorted(str(table).splitlines()), sorted("(" + name + "," + name + "-value)"
+                                                                          for name in NAMES))
+
+    def test_mixin(self):
+        class PairTable(TableViewsMixin):
+            def __init__(self, pairs):
+                self.pairs = dict(pairs)
+
+            def _entries(self):
+                return iter(self.pairs.items())
+
+            def get(self, key, default=None):
+                return self.pairs.get(key, default)
+
+            def __contains__(self, key):
+                return key in self.pairs
+
+            def __len__(self):
+                return len(self.pairs)
+
+        table = PairTable((name, len(name)) for name in NAMES)
+        self.assertEqual(list(table), NAMES)
+        self.assertEqual(list(table.values()), [3] * len(NAMES))
+        self.assertIn(("Eva", 3), table.items())
+        self.assertEqual(str(table), "".join("(" + name + ",3)\n" for name in NAMES))
+        self.assertRaises(TypeError, lambda: TableView(table))
+
+    def test_to_array(self):
+        table = CompactLinearProbeTable(19, key_type=int)
+        for number in range(100):
+            table[number] = number / 2
+        self.assertEqual(table.keys().to_array('q'), array('q', range(100)))
+        self.assertEqual(table.values().to_array('d'), array('d', [number / 2 for number in range(100)]))
+        self.assertEqual(table.items().to_array('d')[:4], array('d', [0, 0, 1, 0.5]))
+        table[100] = "value"
+        self.assertRaises(TypeError, lambda: table.values().to_array('d'))
+
+    @unittest.skipUnless(batch_hash.HAS_NUMPY, "NumPy is not installed")
+    def test_to_numpy(self):
+        table = CompactLinearProbeTable(19)
+        for name in NAMES:
+            table[name] = len(name)
+        keys = table.keys().to_numpy()
+        self.assertEqual(keys.dtype, object)
+        self.assertEqual(keys.tolist(), NAMES)
+        self.assertEqual(table.values().to_numpy(dtype=batch_hash.np.int64).sum(), 30)
+        pairs = table.items().to_numpy()
+        self.assertEqual(pairs.shape, (len(NAMES), 2))
+        self.assertEqual(pairs[0].tolist(), ["Eva", 3])
+
+
+if __name__ == '__main__':
+
+    # running all the tests
+    unittest.main()